@@ -3,15 +3,11 @@
 Export Tab Widget - Handles RO-Crate export functionality with programmatic UI
 """
 
-import json
 import os
 import re
-import shutil
-import tempfile
 import time
-import zipfile
 
-from qgis.PyQt.QtCore import QSize, Qt, pyqtSignal
+from qgis.PyQt.QtCore import QSize, Qt, QThread, QTimer, pyqtSignal, pyqtSlot
 from qgis.PyQt.QtWidgets import (
     QComboBox,
     QFileDialog,
@@ -24,14 +20,111 @@ from qgis.PyQt.QtWidgets import (
     QPushButton,
     QSizePolicy,
     QSpacerItem,
+    QSpinBox,
     QTextEdit,
     QVBoxLayout,
     QWidget,
 )
 from qgis.utils import Qgis
-from rocrate.rocrate import ROCrate
 
-from ..utility import Logger, display_error_message, get_logger
+from ..Layer.layer import Layer
+from ..utility import Logger, display_error_message, get_logger, keep_ascii_alnum
+from .export_worker import ExportWorker
+
+# rocrate and the archive modules are imported where they are used, they are
+# only needed once the user actually exports and rocrate is slow to import
+
+# Default zlib level for archive members written by the plugin, most layer
+# data is already compressed so higher levels cost CPU for hardly any size gain
+ZIP_COMPRESS_LEVEL = 1
+
+# Basic ORCID format: 0000-0000-0000-000X
+_ORCID_RE = re.compile(r"^\d{4}-\d{4}-\d{4}-\d{3}[\dX]$")
+
+# Context and profile additions for the exported RO-Crate metadata
+_WORKFLOW_RUN_CONTEXT = "https://w3id.org/ro/terms/workflow-run/context"
+_CUSTOM_CONTEXT = {
+    "layerVisible": "isAccessibleForFree",
+    "layerCrs": "spatialCoverage",
+    "layerType": "additionalType",
+    "layerFeatureCount": "numberOfItems",
+    "layerGeometryType": "additionalType",
+    "sourceTitle": "name",
+    "sourceURL": "url",
+    "sourceDate": "dateReceived",
+    "sourceComment": "comment",
+    "qgisLog": "text",
+    "qgisParameters": "text",
+    "qgisProcessCommand": "code",
+    "qgisPythonCommand": "code",
+    "qgisResults": "text",
+}
+_PROCESS_PROFILE_ID = "https://w3id.org/ro/wfrun/process/0.5"
+_PROCESS_PROFILE_JSONLD = {
+    "@id": _PROCESS_PROFILE_ID,
+    "@type": ["CreativeWork", "Profile"],
+    "name": "Process Run crate profile",
+    "version": "0.5.0",
+}
+
+# Selectable licenses as (license_id, display name, license URL)
+_LICENSES = [
+    (
+        "CC0-1.0",
+        "CC0 1.0 Universal (Public Domain)",
+        "https://creativecommons.org/publicdomain/zero/1.0/",
+    ),
+    (
+        "CC-BY-4.0",
+        "Creative Commons Attribution 4.0 International",
+        "https://creativecommons.org/licenses/by/4.0/",
+    ),
+    (
+        "CC-BY-SA-4.0",
+        "Creative Commons Attribution-ShareAlike 4.0 International",
+        "https://creativecommons.org/licenses/by-sa/4.0/",
+    ),
+    (
+        "CC-BY-NC-4.0",
+        "Creative Commons Attribution-NonCommercial 4.0 International",
+        "https://creativecommons.org/licenses/by-nc/4.0/",
+    ),
+    (
+        "CC-BY-NC-SA-4.0",
+        "Creative Commons Attribution-NonCommercial-ShareAlike 4.0 International",
+        "https://creativecommons.org/licenses/by-nc-sa/4.0/",
+    ),
+    ("MIT", "MIT License", "https://opensource.org/licenses/MIT"),
+    (
+        "Apache-2.0",
+        "Apache License 2.0",
+        "https://www.apache.org/licenses/LICENSE-2.0",
+    ),
+    (
+        "GPL-3.0",
+        "GNU General Public License v3.0",
+        "https://www.gnu.org/licenses/gpl-3.0.html",
+    ),
+    (
+        "BSD-3-Clause",
+        "BSD 3-Clause License",
+        "https://opensource.org/licenses/BSD-3-Clause",
+    ),
+    (
+        "ODbL-1.0",
+        "Open Database License v1.0",
+        "https://opendatacommons.org/licenses/odbl/1-0/",
+    ),
+    (
+        "PDDL-1.0",
+        "Public Domain Dedication and License v1.0",
+        "https://opendatacommons.org/licenses/pddl/1-0/",
+    ),
+    ("other", "Other (specify in description)", None),
+]
+_LICENSE_URLS = {
+    license_id: url for license_id, _, url in _LICENSES if url is not None
+}
 
 
 class ExportTab(QWidget):
@@ -53,6 +146,14 @@ class ExportTab(QWidget):
         super(ExportTab, self).__init__(parent)
         self.logger = get_logger("ExportTab")
         self.parent = parent
+        self._export_thread = None
+        self._export_worker = None
+        self._export_metadata = None
+        self._export_start_time = None
+        # Temporary files of the running export, removed when it has finished
+        self._export_temp_paths = []
+        # Graph tab locked while the export runs, so its layers stay unchanged
+        self._locked_graph_tab = None
         self.setup_ui()
         self._initialize_ui_components()
         self._setup_signal_connections()
@@ -184,6 +285,25 @@ class ExportTab(QWidget):
         self.export_path_layout.addWidget(self.browse_PushButton)
 
         self.export_settings_layout.addLayout(self.export_path_layout)
+
+        # Compression level layout
+        self.compression_layout = QHBoxLayout()
+        self.compression_layout.setSpacing(8)
+
+        self.compression_label = QLabel("Compression:", self)
+        self.compression_label.setMinimumSize(QSize(80, 0))
+        self.compression_layout.addWidget(self.compression_label)
+
+        self.compression_SpinBox = QSpinBox(self)
+        self.compression_SpinBox.setRange(0, 9)
+        self.compression_SpinBox.setValue(ZIP_COMPRESS_LEVEL)
+        self.compression_SpinBox.setToolTip(
+            "Zip compression level from 0 (fastest) to 9 (smallest file)"
+        )
+        self.compression_layout.addWidget(self.compression_SpinBox)
+        self.compression_layout.addStretch()
+
+        self.export_settings_layout.addLayout(self.compression_layout)
         self.export_layout.addWidget(self.export_settings_group)
 
         # Vertical spacer
@@ -241,34 +361,10 @@ class ExportTab(QWidget):
 
     def _populate_license_dropdown(self):
         """Populate the license dropdown with common license types"""
-        licenses = [
-            ("", "Select a license..."),  # Empty option to force selection
-            ("CC0-1.0", "CC0 1.0 Universal (Public Domain)"),
-            ("CC-BY-4.0", "Creative Commons Attribution 4.0 International"),
-            (
-                "CC-BY-SA-4.0",
-                "Creative Commons Attribution-ShareAlike 4.0 International",
-            ),
-            (
-                "CC-BY-NC-4.0",
-                "Creative Commons Attribution-NonCommercial 4.0 International",
-            ),
-            (
-                "CC-BY-NC-SA-4.0",
-                "Creative Commons Attribution-NonCommercial-ShareAlike "
-                "4.0 International",
-            ),
-            ("MIT", "MIT License"),
-            ("Apache-2.0", "Apache License 2.0"),
-            ("GPL-3.0", "GNU General Public License v3.0"),
-            ("BSD-3-Clause", "BSD 3-Clause License"),
-            ("ODbL-1.0", "Open Database License v1.0"),
-            ("PDDL-1.0", "Public Domain Dedication and License v1.0"),
-            ("other", "Other (specify in description)"),
-        ]
-
         self.license_ComboBox.clear()
-        for license_id, license_name in licenses:
+        # Empty option to force selection
+        self.license_ComboBox.addItem("Select a license...", "")
+        for license_id, license_name, _ in _LICENSES:
             self.license_ComboBox.addItem(license_name, license_id)
 
     def _setup_signal_connections(self):
@@ -279,8 +375,12 @@ class ExportTab(QWidget):
         # Export button
         self.export_PushButton.clicked.connect(self.export_rocrate)
 
-        # Field validation connections
-        self.title_LineEdit.textChanged.connect(self.validate_form)
+        # Field validation connections, keystrokes in the title are debounced
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(150)
+        self._validate_timer.timeout.connect(self.validate_form)
+        self.title_LineEdit.textChanged.connect(self._schedule_validation)
         self.export_path_LineEdit.textChanged.connect(self.validate_form)
         self.license_ComboBox.currentTextChanged.connect(self.validate_form)
 
@@ -296,12 +396,17 @@ class ExportTab(QWidget):
         author = self.author_LineEdit.text().strip()
         license_id = self.license_ComboBox.currentData()
 
-        # Enable export button only if required fields are filled
+        # Enable export button only if required fields are filled and no
+        # export is currently running
         is_valid = bool(
             title and description and export_path and author and license_id
-        )
+        ) and self._export_thread is None
         self.export_PushButton.setEnabled(is_valid)
 
+    def _schedule_validation(self):
+        """Validate the form once typing has paused"""
+        self._validate_timer.start()
+
     def validate_orcid(self, orcid):
         """Validate ORCID format (if provided).
 
@@ -313,23 +418,29 @@ class ExportTab(QWidget):
         if not orcid:
             return True  # ORCID is optional
 
-        # Basic ORCID format validation: 0000-0000-0000-000X
-        pattern = r"^\d{4}-\d{4}-\d{4}-\d{3}[\dX]$"
-        return bool(re.match(pattern, orcid))
+        return bool(_ORCID_RE.match(orcid))
 
     # ============================================================================
     # UTILITY / HELPER METHODS
     # ============================================================================
 
     def browse_export_path(self):
-        """Open file dialog to select export directory"""
-        export_dir = QFileDialog.getExistingDirectory(
-            self,
-            "Select Export Directory",
-            "",
-            QFileDialog.ShowDirsOnly | QFileDialog.DontResolveSymlinks,
-        )
-
+        """Open a non-blocking dialog to select the export directory"""
+        dialog = QFileDialog(self, "Select Export Directory")
+        dialog.setFileMode(QFileDialog.Directory)
+        dialog.setOption(QFileDialog.ShowDirsOnly, True)
+        dialog.setOption(QFileDialog.DontResolveSymlinks, True)
+        dialog.setAttribute(Qt.WA_DeleteOnClose)
+        dialog.fileSelected.connect(self._on_export_dir_selected)
+        # open() shows the dialog window-modal and returns immediately
+        dialog.open()
+
+    def _on_export_dir_selected(self, export_dir):
+        """Set the export path from the directory dialog.
+
+        :param export_dir: Selected export directory
+        :type export_dir: str
+        """
         if export_dir:
             self.export_path_LineEdit.setText(export_dir)
 
@@ -348,6 +459,7 @@ class ExportTab(QWidget):
             "title": self.title_LineEdit.text().strip(),
             "description": self.description_TextEdit.toPlainText().strip(),
             "export_path": self.export_path_LineEdit.text().strip(),
+            "compression_level": self.compression_SpinBox.value(),
         }
 
     def get_license_url(self, license_id):
@@ -358,20 +470,7 @@ class ExportTab(QWidget):
         :return: URL for the license, or None if not found
         :rtype: str or None
         """
-        license_urls = {
-            "CC0-1.0": "https://creativecommons.org/publicdomain/zero/1.0/",
-            "CC-BY-4.0": "https://creativecommons.org/licenses/by/4.0/",
-            "CC-BY-SA-4.0": "https://creativecommons.org/licenses/by-sa/4.0/",
-            "CC-BY-NC-4.0": "https://creativecommons.org/licenses/by-nc/4.0/",
-            "CC-BY-NC-SA-4.0": "https://creativecommons.org/licenses/by-nc-sa/4.0/",
-            "MIT": "https://opensource.org/licenses/MIT",
-            "Apache-2.0": "https://www.apache.org/licenses/LICENSE-2.0",
-            "GPL-3.0": "https://www.gnu.org/licenses/gpl-3.0.html",
-            "BSD-3-Clause": "https://opensource.org/licenses/BSD-3-Clause",
-            "ODbL-1.0": "https://opendatacommons.org/licenses/odbl/1-0/",
-            "PDDL-1.0": "https://opendatacommons.org/licenses/pddl/1-0/",
-        }
-        return license_urls.get(license_id, None)
+        return _LICENSE_URLS.get(license_id)
 
     def clear_form(self):
         """Clear all form fields"""
@@ -403,85 +502,35 @@ class ExportTab(QWidget):
                 self.license_ComboBox.setCurrentIndex(index)
         self.validate_form()  # Update button state
 
-    def _fix_rocrate_context(self, export_file_path):
-        """Fix RO-Crate context issues in the exported zip file.
+    def _add_rocrate_context(self, crate):
+        """Add the process run crate context and profile before writing.
 
-        :param export_file_path: Path to the exported RO-Crate zip file
-        :type export_file_path: str
+        :param crate: The ROCrate object to extend
+        :type crate: ROCrate
         """
-        # Extract metadata
-        with zipfile.ZipFile(export_file_path, "r") as zf:
-            with zf.open("ro-crate-metadata.json") as f:
-                metadata = json.load(f)
-
-        # Add custom context
-        custom_context = {
-            "layerVisible": "isAccessibleForFree",
-            "layerCrs": "spatialCoverage",
-            "layerType": "additionalType",
-            "layerFeatureCount": "numberOfItems",
-            "layerGeometryType": "additionalType",
-            "sourceTitle": "name",
-            "sourceURL": "url",
-            "sourceDate": "dateReceived",
-            "sourceComment": "comment",
-            "qgisLog": "text",
-            "qgisParameters": "text",
-            "qgisProcessCommand": "code",
-            "qgisPythonCommand": "code",
-            "qgisResults": "text",
-        }
-
-        # Ensure @context is a list and append
-        if isinstance(metadata["@context"], list):
-            metadata["@context"].append(
-                "https://w3id.org/ro/terms/workflow-run/context"
-            )  # process run crate
-            metadata["@context"].append(custom_context)
-        else:
-            metadata["@context"] = [metadata["@context"], custom_context]
-
-        for item in metadata["@graph"]:
-            if item.get("@id") == "./":
-                item["conformsTo"] = {
-                    "@id": "https://w3id.org/ro/wfrun/process/0.5"
-                }
-                break
-
-        metadata["@graph"].append(
-            {
-                "@id": "https://w3id.org/ro/wfrun/process/0.5",
-                "@type": ["CreativeWork", "Profile"],
-                "name": "Process Run crate profile",
-                "version": "0.5.0",
-            }
-        )
-
-        # Write back to a temporary zip
-        fd, tmp_zip_path = tempfile.mkstemp(suffix=".zip")
-        os.close(fd)
-
-        with (
-            zipfile.ZipFile(export_file_path, "r") as zin,
-            zipfile.ZipFile(
-                tmp_zip_path, "w", compression=zipfile.ZIP_DEFLATED
-            ) as zout,
-        ):
-            for item in zin.infolist():
-                if item.filename != "ro-crate-metadata.json":
-                    zout.writestr(item, zin.read(item.filename))
-            # Write modified metadata
-            zout.writestr("ro-crate-metadata.json", json.dumps(metadata, indent=2))
-
-        shutil.move(tmp_zip_path, export_file_path)
+        crate.metadata.extra_contexts.append(_WORKFLOW_RUN_CONTEXT)
+        crate.metadata.extra_terms.update(_CUSTOM_CONTEXT)
+        crate.root_dataset["conformsTo"] = {"@id": _PROCESS_PROFILE_ID}
+        # add_jsonld pops the @id, so hand over a copy of the shared constant
+        crate.add_jsonld(dict(_PROCESS_PROFILE_JSONLD))
 
     # ============================================================================
     # EXPORT LOGIC
     # ============================================================================
 
     def export_rocrate(self):
-        """Execute the RO-Crate export process"""
+        """Assemble the RO-Crate and start writing it in a background thread"""
+        import tempfile
+
+        # Edits are validated with a delay, run a pending check now so a title
+        # or other required field cleared just before clicking is caught
+        self._validate_timer.stop()
+        self.validate_form()
+        if not self.export_PushButton.isEnabled():
+            return
+
         metadata = self.get_export_metadata()
+        worker_started = False
         try:
             # Validate required fields
             if not metadata["license"]:
@@ -501,17 +550,19 @@ class ExportTab(QWidget):
                 )
                 return
 
-            # Check if export directory exists
-            if not os.path.exists(metadata["export_path"]):
+            # Check that the export directory exists and is writable with a
+            # single probe file instead of separate exists/access checks
+            try:
+                with tempfile.TemporaryFile(dir=metadata["export_path"]):
+                    pass
+            except (FileNotFoundError, NotADirectoryError):
                 display_error_message(
                     self,
                     "Invalid Path",
                     "The selected export directory does not exist.",
                 )
                 return
-
-            # Check if directory is writable
-            if not os.access(metadata["export_path"], os.W_OK):
+            except PermissionError:
                 display_error_message(
                     self,
                     "Permission Denied",
@@ -528,25 +579,30 @@ class ExportTab(QWidget):
 
             export_file_path = os.path.join(
                 metadata["export_path"],
-                f"{re.sub(r'[^A-Za-z0-9]', '', metadata['title'])}.zip",
+                f"{keep_ascii_alnum(metadata['title'])}.zip",
             )
 
             # Implement RO-Crate export logic
+            from rocrate.rocrate import ROCrate
+
             start_time = time.perf_counter()
             crate = ROCrate()
 
             crate.root_dataset["name"] = str(metadata["title"])
             crate.root_dataset["description"] = str(metadata["description"])
 
+            # Declare the process run crate context up front, it is written
+            # with the rest of the metadata
+            self._add_rocrate_context(crate)
+
             # Add license information
             license_url = self.get_license_url(metadata["license"])
             license_jsonld = {
-                "@id": license_url if license_url else "#license",
+                "@id": license_url or "#license",
                 "@type": "CreativeWork",
                 "name": str(metadata["license_name"]),
+                **({"identifier": str(metadata["license"])} if license_url else {}),
             }
-            if license_url:
-                license_jsonld["identifier"] = str(metadata["license"])
             crate.root_dataset["license"] = {"@id": license_jsonld["@id"]}
             self.logger.info(
                 f"Adding license {license_jsonld['@id']} to crate."
@@ -562,9 +618,12 @@ class ExportTab(QWidget):
                 ),
                 "@type": "Person",
                 "name": str(metadata["author"]),
+                **(
+                    {"affiliation": str(metadata["affiliation"])}
+                    if metadata["affiliation"]
+                    else {}
+                ),
             }
-            if metadata["affiliation"]:
-                author_jsonld["affiliation"] = str(metadata["affiliation"])
             crate.root_dataset["author"] = {"@id": author_jsonld["@id"]}
             self.logger.info(
                 f"Adding author {author_jsonld['@id']} to crate."
@@ -582,47 +641,148 @@ class ExportTab(QWidget):
             )
             self.logger.info("Added SoftwareApplication #qgis to crate.")
 
-            # add documented layers
-            for layer in self.parent.graph_tab.documented_layers.values():
-                crate = layer.add_to_rocrate(crate)
+            # rocrate keeps its entities in a dict keyed by id, so adding them
+            # one at a time stays linear
+            graph_tab = self.parent.graph_tab
+            graph_tab.setEnabled(False)
+            self._locked_graph_tab = graph_tab
+
+            # add documented layers, cleaning up the root hasPart once for all
+            crate = Layer.add_layers_to_rocrate(
+                crate, graph_tab.documented_layers.values(), self._export_temp_paths
+            )
 
             # add documented processes and their instruments
             instruments = {}
-            for process in self.parent.graph_tab.documented_steps.values():
+            for process in graph_tab.documented_steps.values():
                 instruments[process.instrument.id] = process.instrument
                 crate = process.add_to_rocrate(crate)
             for instrument in instruments.values():
                 crate = instrument.add_to_rocrate(crate)
 
-            # Write RO-Crate to zip file and fix issues
-            crate.write_zip(export_file_path)
-            self._fix_rocrate_context(export_file_path)
-
-            end_time = time.perf_counter()
-            self.logger.info(
-                f"Export completed in {end_time - start_time:.4f} seconds."
-            )
-            self.logger.info(f"Exported crate to {export_file_path}.")
-
-            # Show success message
-            QMessageBox.information(
-                self,
-                "Export Successful",
-                f"RO-Crate has been exported successfully to:\n{export_file_path}",
-            )
-
-            # Emit completion signal
-            self.export_completed.emit(export_file_path)
+            # Write RO-Crate to zip file off the GUI thread
+            self._start_export_worker(crate, export_file_path, metadata, start_time)
+            worker_started = True
 
         except Exception as e:
             # Handle any errors during export
-            error_message = f"Export failed: {str(e)}"
             self.logger.error(e)
-            display_error_message(self, "Export Error", error_message)
-            self.export_failed.emit(error_message)
+            self._handle_export_error(f"Export failed: {str(e)}")
 
         finally:
-            Logger().write_logs_to_file(metadata["export_path"], metadata["title"])
-            # Re-enable export button and reset text
-            self.validate_form()  # This will properly set the enabled state
-            self.export_PushButton.setText("Export RO-Crate")
+            if not worker_started:
+                self._finish_export(metadata)
+
+    def _start_export_worker(self, crate, export_file_path, metadata, start_time):
+        """Write the assembled RO-Crate to its zip file in a QThread.
+
+        :param crate: The fully assembled ROCrate object
+        :type crate: ROCrate
+        :param export_file_path: Path of the zip file to write
+        :type export_file_path: str
+        :param metadata: Export metadata from the form fields
+        :type metadata: dict
+        :param start_time: perf_counter value at the start of the export
+        :type start_time: float
+        """
+        self._export_metadata = metadata
+        self._export_start_time = start_time
+
+        self._export_thread = QThread(self)
+        self._export_worker = ExportWorker(
+            crate, export_file_path, metadata["compression_level"]
+        )
+        self._export_worker.moveToThread(self._export_thread)
+
+        self._export_thread.started.connect(self._export_worker.run)
+        self._export_worker.finished.connect(self._on_export_finished)
+        self._export_worker.failed.connect(self._on_export_failed)
+        self._export_worker.finished.connect(self._export_thread.quit)
+        self._export_worker.failed.connect(self._export_thread.quit)
+        self._export_thread.finished.connect(self._export_worker.deleteLater)
+        self._export_thread.finished.connect(self._export_thread.deleteLater)
+
+        self._export_thread.start()
+
+    @pyqtSlot(str)
+    def _on_export_finished(self, export_file_path):
+        """Handle a successfully written RO-Crate.
+
+        :param export_file_path: Path of the written zip file
+        :type export_file_path: str
+        """
+        end_time = time.perf_counter()
+        self.logger.info(
+            f"Export completed in {end_time - self._export_start_time:.4f} seconds."
+        )
+        self.logger.info(f"Exported crate to {export_file_path}.")
+
+        # Show success message
+        QMessageBox.information(
+            self,
+            "Export Successful",
+            f"RO-Crate has been exported successfully to:\n{export_file_path}",
+        )
+
+        # Emit completion signal
+        self.export_completed.emit(export_file_path)
+        self._finish_export(self._export_metadata)
+
+    @pyqtSlot(str)
+    def _on_export_failed(self, error_message):
+        """Handle an error raised while writing the RO-Crate.
+
+        :param error_message: Error message of the failed export
+        :type error_message: str
+        """
+        self._handle_export_error(error_message)
+        self._finish_export(self._export_metadata)
+
+    def _handle_export_error(self, error_message):
+        """Report a failed export to the user and listeners.
+
+        :param error_message: Error message of the failed export
+        :type error_message: str
+        """
+        display_error_message(self, "Export Error", error_message)
+        self.export_failed.emit(error_message)
+
+    def _finish_export(self, metadata):
+        """Write the export log and restore the export button.
+
+        :param metadata: Export metadata from the form fields
+        :type metadata: dict
+        """
+        self._release_export_resources()
+        Logger().write_logs_to_file(metadata["export_path"], metadata["title"])
+        # Re-enable export button and reset text
+        self.validate_form()  # This will properly set the enabled state
+        self.export_PushButton.setText("Export RO-Crate")
+
+    def _release_export_resources(self):
+        """Drop the export thread, remove temporary files and unlock the graph"""
+        # The worker reference is kept until the next export, it is deleted
+        # through deleteLater once its thread has finished
+        self._export_thread = None
+        # The crate has been written or given up on, its temporary files are
+        # no longer read
+        Layer.remove_temp_files(self._export_temp_paths)
+        if self._locked_graph_tab is not None:
+            self._locked_graph_tab.setEnabled(True)
+            self._locked_graph_tab = None
+
+    def stop_export(self):
+        """Cancel a running export and wait for its thread to end.
+
+        Used on teardown, so the result of the cancelled export is not reported.
+        """
+        thread = self._export_thread
+        if thread is None:
+            return
+
+        self._export_worker.finished.disconnect(self._on_export_finished)
+        self._export_worker.failed.disconnect(self._on_export_failed)
+        thread.requestInterruption()
+        thread.quit()
+        thread.wait()
+        self._release_export_resources()
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+Export Worker - Writes an assembled RO-Crate zip file off the GUI thread
+"""
+
+import os
+from contextlib import suppress
+
+from qgis.PyQt.QtCore import QObject, QThread, pyqtSignal, pyqtSlot
+
+from ..utility import get_logger
+
+
+class ExportWorker(QObject):
+    """Writes a RO-Crate to a zip file inside a QThread"""
+
+    # Signals for export results, delivered queued to the GUI thread
+    finished = pyqtSignal(str)  # export_file_path
+    failed = pyqtSignal(str)  # error_message
+
+    # ============================================================================
+    # INITIALIZATION
+    # ============================================================================
+
+    def __init__(self, crate, export_file_path, compresslevel):
+        """Initialize the export worker.
+
+        :param crate: The fully assembled ROCrate object to write
+        :type crate: ROCrate
+        :param export_file_path: Path of the zip file to write
+        :type export_file_path: str
+        :param compresslevel: zlib compression level (0-9) for the zip members
+        :type compresslevel: int
+        """
+        super().__init__()
+        self.logger = get_logger("ExportWorker")
+        self.crate = crate
+        self.export_file_path = export_file_path
+        self.compresslevel = compresslevel
+
+    # ============================================================================
+    # PUBLIC INTERFACE
+    # ============================================================================
+
+    @pyqtSlot()
+    def run(self):
+        """Write the RO-Crate zip file"""
+        try:
+            self._write_zip()
+        except InterruptedError as e:
+            # Cancelled on teardown, don't leave a truncated archive behind
+            with suppress(OSError):
+                os.remove(self.export_file_path)
+            self.logger.warning(e)
+            self.failed.emit(f"Export cancelled: {str(e)}")
+            return
+        except Exception as e:
+            self.logger.error(e)
+            self.failed.emit(f"Export failed: {str(e)}")
+            return
+
+        self.finished.emit(self.export_file_path)
+
+    # ============================================================================
+    # UTILITY / HELPER METHODS
+    # ============================================================================
+
+    def _write_zip(self):
+        """Write all crate entities into the zip file.
+
+        Mirrors ROCrate.write_zip, which always deflates at the zlib default
+        level, but uses the configured compression level and writes straight
+        to the file instead of through an in-memory buffer.
+
+        The entity loop is copied from ROCrate._stream_zip of rocrate 0.14.0,
+        the minimum version the plugin depends on; check it again when that
+        requirement is raised. Its pass over unlisted files in the crate
+        source directory is left out, the exported crate is built in memory
+        without a source directory.
+        """
+        import zipfile
+
+        thread = QThread.currentThread()
+        with zipfile.ZipFile(
+            self.export_file_path,
+            "w",
+            compression=zipfile.ZIP_DEFLATED,
+            compresslevel=self.compresslevel,
+        ) as archive:
+            for entity in self.crate.data_entities + self.crate.default_entities:
+                current_path, current_file = None, None
+                for path, chunk in entity.stream():
+                    if thread.isInterruptionRequested():
+                        # The archive can't be closed with an open member
+                        if current_file:
+                            current_file.close()
+                        raise InterruptedError("the export was stopped")
+                    if path != current_path:
+                        if current_file:
+                            current_file.close()
+                        current_path = path
+                        current_file = archive.open(path, mode="w", force_zip64=True)
+                    current_file.write(chunk)
+                if current_file:
+                    current_file.close()
@@ -5,16 +5,25 @@ Connection Arrow - Directional arrow connecting nodes in graph view
 
 import math
 
-from qgis.PyQt.QtCore import QPointF, Qt
+from qgis.PyQt.QtCore import QLineF, QPointF, QRectF, Qt
 from qgis.PyQt.QtGui import QBrush, QPen, QPolygonF
-from qgis.PyQt.QtWidgets import QGraphicsLineItem, QGraphicsPolygonItem
 
-from .layer_node import LayerNode
-from .process_node import ProcessNode
+# Drawing styles shared by all arrows; cosmetic pens keep their width at any zoom
+ARROW_PEN = QPen(Qt.black, 2)
+ARROW_PEN.setCosmetic(True)
+ARROWHEAD_PEN = QPen(Qt.black)
+ARROWHEAD_PEN.setCosmetic(True)
+ARROWHEAD_BRUSH = QBrush(Qt.black)
 
 
-class ConnectionArrow(QGraphicsLineItem):
-    """Directional arrow connecting nodes"""
+class ConnectionArrow:
+    """Directional arrow connecting nodes.
+
+    Arrows are not scene items; the GraphView holding them strokes all
+    lines and arrowheads in one pass in its foreground.
+    """
+
+    HIT_TOLERANCE = 4  # Click distance from the line in scene units
 
     # ============================================================================
     # INITIALIZATION
@@ -24,156 +33,101 @@ class ConnectionArrow(QGraphicsLineItem):
         """Initialize a ConnectionArrow between two nodes.
 
         :param start_node: Starting node for the connection
-        :type start_node: LayerNode or ProcessNode
+        :type start_node: NodeBase
         :param end_node: Ending node for the connection
-        :type end_node: LayerNode or ProcessNode
+        :type end_node: NodeBase
         """
-        super().__init__()
         self.start_node = start_node
         self.end_node = end_node
-        self.arrowhead = None  # Will hold the arrowhead polygon
-
-        # Set visual properties
-        self.setPen(QPen(Qt.black, 2))
+        self.view = None  # GraphView drawing this arrow, set by add_arrow
+        self.line = QLineF()
+        # Arrowhead triangle, allocated once and updated in place
+        self.arrowhead = QPolygonF([QPointF(), QPointF(), QPointF()])
+        self.bounds = QRectF()  # Scene rect covered by line and arrowhead
+        self._pixel_key = None  # Endpoints rounded to device pixels at the last update
 
         # Register with nodes
-        if isinstance(start_node, LayerNode):
-            start_node.connections.append(self)
-        elif isinstance(start_node, ProcessNode):
-            start_node.add_output_arrow(self)
-
-        if isinstance(end_node, LayerNode):
-            end_node.connections.append(self)
-        elif isinstance(end_node, ProcessNode):
-            end_node.add_input_arrow(self)
+        start_node.attach_output(self)
+        end_node.attach_input(self)
 
         # Create initial position and arrowhead
         self.update_position()
 
-        # Add to scene immediately if nodes are already in scene
-        if self.start_node.scene() and self.end_node.scene():
-            scene = self.start_node.scene()
-            scene.addItem(self)
-            if self.arrowhead:
-                scene.addItem(self.arrowhead)
-
-        self.setToolTip("Click to delete connection")
-
     # ============================================================================
     # POSITION CALCULATION
     # ============================================================================
 
     def update_position(self):
         """Update arrow position and arrowhead based on node positions"""
-        start_center = self.start_node.sceneBoundingRect().center()
-        end_center = self.end_node.sceneBoundingRect().center()
-
-        # Calculate connection points on node boundaries
-        start_rect = self.start_node.boundingRect()
-        end_rect = self.end_node.boundingRect()
+        # Node centers, cached by the nodes when they move
+        sx, sy = self.start_node.scene_geometry[:2]
+        ex, ey = self.end_node.scene_geometry[:2]
 
         # Get direction vector
-        dx = end_center.x() - start_center.x()
-        dy = end_center.y() - start_center.y()
-        length = math.sqrt(dx * dx + dy * dy)
-
-        if length > 0:
-            # Normalize direction
-            dx /= length
-            dy /= length
-
-            if isinstance(self.start_node, LayerNode):  # Rectangle
-                start_edge = self._get_rect_edge_point(start_center, start_rect, dx, dy)
-            else:  # Ellipse
-                start_edge = self._get_ellipse_edge_point(
-                    start_center, start_rect, dx, dy
-                )
-
-            if isinstance(self.end_node, LayerNode):  # Rectangle
-                end_edge = self._get_rect_edge_point(end_center, end_rect, -dx, -dy)
-            else:  # Ellipse
-                end_edge = self._get_ellipse_edge_point(end_center, end_rect, -dx, -dy)
-
-            # Set line position
-            self.setLine(start_edge.x(), start_edge.y(), end_edge.x(), end_edge.y())
-
-            # Create arrowhead
-            self._create_arrowhead(end_edge, dx, dy)
-
-    def _get_rect_edge_point(self, center, rect, dx, dy):
-        """Get edge point on rectangle.
-
-        :param center: Center point of the rectangle
-        :type center: QPointF
-        :param rect: Rectangle bounds
-        :type rect: QRectF
-        :param dx: X component of direction vector
-        :type dx: float
-        :param dy: Y component of direction vector
-        :type dy: float
-        :return: Point on rectangle edge
-        :rtype: QPointF
-        """
-        half_width = rect.width() / 2
-        half_height = rect.height() / 2
-
-        # Determine which edge to intersect
-        if abs(dx) / half_width > abs(dy) / half_height:
-            # Intersect left or right edge
-            edge_x = half_width if dx > 0 else -half_width
-            edge_y = edge_x * dy / dx if dx != 0 else 0
-            edge_y = max(-half_height, min(half_height, edge_y))
+        dx = ex - sx
+        dy = ey - sy
+        length = math.hypot(dx, dy)
+        if length < 1e-6:
+            return  # Node centers coincide, no direction to draw
+
+        # Normalize direction
+        dx /= length
+        dy /= length
+
+        # Calculate connection points on node boundaries
+        x1, y1 = self.start_node.edge_point(dx, dy)
+        x2, y2 = self.end_node.edge_point(-dx, -dy)
+
+        # Skip the update if the endpoints land on the same device pixels as
+        # before, mapped through the view transform so zooming in still
+        # follows sub-unit moves
+        view = self.view
+        if view is not None:
+            transform = view.transform()
+            px1, py1 = transform.map(x1, y1)
+            px2, py2 = transform.map(x2, y2)
+            pixel_key = (round(px1), round(py1), round(px2), round(py2))
+            if pixel_key == self._pixel_key:
+                return
+            self._pixel_key = pixel_key
         else:
-            # Intersect top or bottom edge
-            edge_y = half_height if dy > 0 else -half_height
-            edge_x = edge_y * dx / dy if dy != 0 else 0
-            edge_x = max(-half_width, min(half_width, edge_x))
+            self._pixel_key = None
 
-        return QPointF(center.x() + edge_x, center.y() + edge_y)
+        old_bounds = self.bounds
 
-    def _get_ellipse_edge_point(self, center, rect, dx, dy):
-        """Get edge point on ellipse.
+        # Set line position
+        self.line = QLineF(x1, y1, x2, y2)
 
-        :param center: Center point of the ellipse
-        :type center: QPointF
-        :param rect: Ellipse bounds
-        :type rect: QRectF
-        :param dx: X component of direction vector
-        :type dx: float
-        :param dy: Y component of direction vector
-        :type dy: float
-        :return: Point on ellipse edge
-        :rtype: QPointF
-        """
-        a = rect.width() / 2  # Semi-major axis
-        b = rect.height() / 2  # Semi-minor axis
+        # Create arrowhead
+        self._create_arrowhead(x2, y2, dx, dy)
 
-        # Parametric form: x = a*cos(t), y = b*sin(t)
-        # Find t where direction matches (dx, dy)
-        angle = math.atan2(dy, dx)
-        edge_x = a * math.cos(angle)
-        edge_y = b * math.sin(angle)
+        # Pad by the pen width so the stroke is repainted too
+        self.bounds = (
+            QRectF(QPointF(x1, y1), QPointF(x2, y2))
+            .normalized()
+            .united(self.arrowhead.boundingRect())
+            .adjusted(-2, -2, 2, 2)
+        )
 
-        return QPointF(center.x() + edge_x, center.y() + edge_y)
+        if view is not None:
+            view.update_arrow_region(old_bounds.united(self.bounds))
 
     # ============================================================================
     # ARROWHEAD CREATION
     # ============================================================================
 
-    def _create_arrowhead(self, tip_point, dx, dy):
-        """Create arrowhead at tip point.
+    def _create_arrowhead(self, tip_x, tip_y, dx, dy):
+        """Move the arrowhead polygon to the tip point.
 
-        :param tip_point: Point where arrowhead should be placed
-        :type tip_point: QPointF
+        :param tip_x: X coordinate where the arrowhead should be placed
+        :type tip_x: float
+        :param tip_y: Y coordinate where the arrowhead should be placed
+        :type tip_y: float
         :param dx: X component of direction vector
         :type dx: float
         :param dy: Y component of direction vector
         :type dy: float
         """
-        # Remove old arrowhead
-        if self.arrowhead and self.arrowhead.scene():
-            self.arrowhead.scene().removeItem(self.arrowhead)
-
         arrowhead_size = 15
 
         # Calculate arrowhead points
@@ -181,63 +135,53 @@ class ConnectionArrow(QGraphicsLineItem):
         perp_y = dx
 
         p1 = QPointF(
-            tip_point.x() - arrowhead_size * dx + arrowhead_size / 2 * perp_x,
-            tip_point.y() - arrowhead_size * dy + arrowhead_size / 2 * perp_y,
+            tip_x - arrowhead_size * dx + arrowhead_size / 2 * perp_x,
+            tip_y - arrowhead_size * dy + arrowhead_size / 2 * perp_y,
         )
         p2 = QPointF(
-            tip_point.x() - arrowhead_size * dx - arrowhead_size / 2 * perp_x,
-            tip_point.y() - arrowhead_size * dy - arrowhead_size / 2 * perp_y,
+            tip_x - arrowhead_size * dx - arrowhead_size / 2 * perp_x,
+            tip_y - arrowhead_size * dy - arrowhead_size / 2 * perp_y,
         )
-        p3 = tip_point
-
-        polygon = QPolygonF([p1, p2, p3])
+        p3 = QPointF(tip_x, tip_y)
 
-        self.arrowhead = QGraphicsPolygonItem(polygon)
-        self.arrowhead.setBrush(QBrush(Qt.black))
-        self.arrowhead.setPen(QPen(Qt.black))
-
-        if self.scene():
-            self.scene().addItem(self.arrowhead)
+        self.arrowhead.replace(0, p1)
+        self.arrowhead.replace(1, p2)
+        self.arrowhead.replace(2, p3)
 
     # ============================================================================
-    # EVENT HANDLERS
+    # PUBLIC INTERFACE
     # ============================================================================
 
-    def mousePressEvent(self, event):  # noqa: N802
-        """Delete arrow on click.
+    def contains(self, point):
+        """Check whether a scene point hits the line or the arrowhead.
 
-        :param event: Mouse press event
-        :type event: QMouseEvent
+        :param point: Point in scene coordinates
+        :type point: QPointF
+        :return: True if the point is on the arrow, False otherwise
+        :rtype: bool
         """
-        if event.button() == Qt.LeftButton:
-            self.remove_arrow()
-
-    # ============================================================================
-    # PUBLIC INTERFACE
-    # ============================================================================
+        if not self.bounds.contains(point):
+            return False
+        if self.arrowhead.containsPoint(point, Qt.OddEvenFill):
+            return True
+
+        # Distance from the point to the closest point on the line segment
+        dx = self.line.dx()
+        dy = self.line.dy()
+        length_sq = dx * dx + dy * dy
+        if length_sq == 0:
+            return False
+        px = point.x() - self.line.x1()
+        py = point.y() - self.line.y1()
+        t = max(0.0, min(1.0, (px * dx + py * dy) / length_sq))
+        return math.hypot(px - t * dx, py - t * dy) <= self.HIT_TOLERANCE
 
     def remove_arrow(self):
         """Remove arrow and unregister from nodes"""
-        # Remove arrowhead
-        if self.arrowhead and self.arrowhead.scene():
-            self.arrowhead.scene().removeItem(self.arrowhead)
-
-        # Unregister from start node
-        if isinstance(self.start_node, LayerNode):
-            if self in self.start_node.connections:
-                self.start_node.connections.remove(self)
-        elif isinstance(self.start_node, ProcessNode):
-            if self in self.start_node.output_arrows:
-                self.start_node.remove_output_arrow(self)
-
-        # Unregister from end node
-        if isinstance(self.end_node, LayerNode):
-            if self in self.end_node.connections:
-                self.end_node.connections.remove(self)
-        elif isinstance(self.end_node, ProcessNode):
-            if self in self.end_node.input_arrows:
-                self.end_node.remove_input_arrow(self)
-
-        # Remove from scene
-        if self.scene():
-            self.scene().removeItem(self)
+        # Unregister from nodes
+        self.start_node.detach_output(self)
+        self.end_node.detach_input(self)
+
+        # Remove from view
+        if self.view is not None:
+            self.view.discard_arrow(self)
@@ -3,11 +3,11 @@
 Graph Tab Widget - Widget for creating layer relationship graphs
 """
 
-import re
+from operator import itemgetter
 
 from qgis.core import QgsProject
 from qgis.gui import QgsHistoryProviderRegistry
-from qgis.PyQt.QtCore import QDateTime, Qt
+from qgis.PyQt.QtCore import QDateTime, QSignalBlocker, Qt
 from qgis.PyQt.QtWidgets import (
     QDialog,
     QDialogButtonBox,
@@ -25,7 +25,7 @@ from ..Layer.layer_factory import LayerFactory
 from ..Layer.layer_metadata_dialog import LayerMetadataDialog
 from ..Process.process import Process
 from ..Process.process_metadata_dialog import ProcessMetadataDialog
-from ..utility import get_logger
+from ..utility import get_logger, keep_ascii_alnum
 from .graph_view import GraphView
 from .layer_node import LayerNode
 from .process_node import ProcessNode
@@ -121,12 +121,15 @@ class GraphTab(QWidget):
         layer_list = QListWidget()
         layer_list.setSelectionMode(QListWidget.MultiSelection)
 
+        # Keep each name with its layer so name() is only called once
         project = QgsProject.instance()
+        documented_layers = self.documented_layers
         available_layers = []
 
         for qgs_layer in project.mapLayers().values():
-            if qgs_layer.name() not in self.documented_layers:
-                available_layers.append(qgs_layer)
+            layer_name = qgs_layer.name()
+            if layer_name not in documented_layers:
+                available_layers.append((qgs_layer, layer_name))
 
         if not available_layers:
             # No layers available
@@ -138,16 +141,23 @@ class GraphTab(QWidget):
             )
             layout.addWidget(no_layers_label)
         else:
-            # Add available layers to list
-            for qgs_layer in available_layers:
-                layer_type = (
-                    qgs_layer.type().name
-                    if hasattr(qgs_layer.type(), "name")
-                    else str(qgs_layer.type())
-                )
-                item = QListWidgetItem(f"{qgs_layer.name()} ({layer_type})")
-                item.setData(Qt.UserRole, qgs_layer)
-                layer_list.addItem(item)
+            # Add available layers to list with repaints and signals suspended
+            layer_list.setUpdatesEnabled(False)
+            blocker = QSignalBlocker(layer_list)
+            try:
+                for qgs_layer, layer_name in available_layers:
+                    layer_type = qgs_layer.type()
+                    type_name = (
+                        layer_type.name
+                        if hasattr(layer_type, "name")
+                        else str(layer_type)
+                    )
+                    item = QListWidgetItem(f"{layer_name} ({type_name})")
+                    item.setData(Qt.UserRole, qgs_layer)
+                    layer_list.addItem(item)
+            finally:
+                blocker.unblock()
+                layer_list.setUpdatesEnabled(True)
 
             layout.addWidget(layer_list)
 
@@ -160,25 +170,29 @@ class GraphTab(QWidget):
         dialog.setLayout(layout)
 
         if available_layers and dialog.exec_() == QDialog.Accepted:
-            selected_items = layer_list.selectedItems()
-            if selected_items:
-                for item in selected_items:
-                    qgs_layer = item.data(Qt.UserRole)
+            new_nodes = []
+            layer_factory = LayerFactory()
+            # Walk the layer tree once for all selected layers
+            visibility_map = layer_factory.get_visibility_map()
+            for item in layer_list.selectedItems():
+                qgs_layer = item.data(Qt.UserRole)
 
-                    layer_obj = LayerFactory().create_layer(qgs_layer)
+                layer_obj = layer_factory.create_layer(qgs_layer, visibility_map)
 
-                    metadata_dialog = LayerMetadataDialog(parent=self, layer=layer_obj)
+                metadata_dialog = LayerMetadataDialog(parent=self, layer=layer_obj)
 
-                    if metadata_dialog.exec_() == QDialog.Accepted:
-                        # Layer has been documented, add to graph
-                        node = LayerNode(layer_obj)
-                        node.setPos(400, 300)  # Center position
-                        self.graph_view.scene.addItem(node)
+                if metadata_dialog.exec_() == QDialog.Accepted:
+                    # Layer has been documented, add to graph
+                    node = LayerNode(layer_obj)
+                    node.setPos(400, 300)  # Center position
+                    new_nodes.append(node)
 
-                        # Store in documented layers
-                        self.documented_layers[layer_obj.name] = layer_obj
+                    # Store in documented layers
+                    self.documented_layers[layer_obj.name] = layer_obj
 
-                        self.logger.info(f"Added layer to graph: {layer_obj.name}")
+            self._add_nodes(new_nodes)
+            for node in new_nodes:
+                self.logger.info(f"Added layer to graph: {node.layer_obj.name}")
 
     def open_add_process_dialog(self):
         """Open dialog to select and add a processing step to the graph"""
@@ -238,28 +252,29 @@ class GraphTab(QWidget):
         dialog.setLayout(layout)
 
         if dialog.exec_() == QDialog.Accepted:
-            selected_items = process_list.selectedItems()
-            if selected_items:
-                for item in selected_items:
-                    step_data = item.data(Qt.UserRole)
+            new_nodes = []
+            for item in process_list.selectedItems():
+                step_data = item.data(Qt.UserRole)
 
-                    process_obj = Process(step_data)
+                process_obj = Process(step_data)
 
-                    metadata_dialog = ProcessMetadataDialog(
-                        parent=self, process=process_obj
-                    )
+                metadata_dialog = ProcessMetadataDialog(
+                    parent=self, process=process_obj
+                )
 
-                    if metadata_dialog.exec_() == QDialog.Accepted:
-                        # Process has been documented, add to graph
-                        node = ProcessNode(process_obj=process_obj)
-                        node.setPos(400, 300)  # Center position
-                        self.graph_view.scene.addItem(node)
+                if metadata_dialog.exec_() == QDialog.Accepted:
+                    # Process has been documented, add to graph
+                    node = ProcessNode(process_obj=process_obj)
+                    node.setPos(400, 300)  # Center position
+                    new_nodes.append(node)
 
-                        # Store in documented steps
-                        step_id = process_obj.id
-                        self.documented_steps[step_id] = process_obj
+                    # Store in documented steps
+                    step_id = process_obj.id
+                    self.documented_steps[step_id] = process_obj
 
-                        self.logger.info(f"Added process to graph: {process_obj.name}")
+            self._add_nodes(new_nodes)
+            for node in new_nodes:
+                self.logger.info(f"Added process to graph: {node.process_obj.name}")
 
     # ============================================================================
     # UTILITY / HELPER METHODS
@@ -282,9 +297,9 @@ class GraphTab(QWidget):
             history_provider = QgsHistoryProviderRegistry()
             history_entries = history_provider.queryEntries()
 
-            # Get current time and 7 days ago
+            # Get current time and 7 days ago, as epoch milliseconds
             current_time = QDateTime.currentDateTime()
-            seven_days_ago = current_time.addDays(-7)
+            seven_days_ago_ms = current_time.addDays(-7).toMSecsSinceEpoch()
 
             # Collect valid steps with their timestamps
             valid_steps = []
@@ -292,37 +307,64 @@ class GraphTab(QWidget):
             for step in history_entries:
                 entry = step.entry
                 if entry:
-                    algorithm = entry.get("algorithm_id", "Unknown")
-                    timestamp = step.timestamp.toString("dd.MM.yyyy hh:mm:ss")
-                    display_name = f"{timestamp} | {algorithm}"
+                    # Read the timestamp once; each access wraps a new QDateTime
+                    step_timestamp = step.timestamp
+                    timestamp_ms = step_timestamp.toMSecsSinceEpoch()
 
-                    # Skip if already documented
-                    step_id = re.sub(r"[^A-Za-z0-9]", "", f"{algorithm}{timestamp}")
-                    if step_id in self.documented_steps.keys():
+                    # Filter by date if not showing all
+                    if not show_all and timestamp_ms < seven_days_ago_ms:
                         continue
 
-                    # Filter by date if not showing all
-                    if not show_all and step.timestamp < seven_days_ago:
+                    algorithm = entry.get("algorithm_id", "Unknown")
+                    timestamp = step_timestamp.toString("dd.MM.yyyy hh:mm:ss")
+
+                    # Skip if already documented, built like Process.id
+                    step_id = keep_ascii_alnum(f"{algorithm}{timestamp}")
+                    if step_id in self.documented_steps:
                         continue
 
-                    valid_steps.append((step, display_name, entry))
+                    display_name = f"{timestamp} | {algorithm}"
+                    valid_steps.append((timestamp_ms, step, display_name, entry))
                     steps_found = True
 
             # Sort by timestamp (newest first)
-            valid_steps.sort(key=lambda x: x[0].timestamp, reverse=True)
-
-            # Add sorted items to list
-            for step, display_name, entry in valid_steps:
-                item = QListWidgetItem(display_name)
-                item.setData(Qt.UserRole, step)
-                item.setToolTip(entry.get("log", "No additional information available"))
-                process_list.addItem(item)
+            valid_steps.sort(key=itemgetter(0), reverse=True)
+
+            # Add sorted items to list with repaints and signals suspended
+            process_list.setUpdatesEnabled(False)
+            blocker = QSignalBlocker(process_list)
+            try:
+                for _, step, display_name, entry in valid_steps:
+                    item = QListWidgetItem(display_name)
+                    item.setData(Qt.UserRole, step)
+                    item.setToolTip(
+                        entry.get("log", "No additional information available")
+                    )
+                    process_list.addItem(item)
+            finally:
+                blocker.unblock()
+                process_list.setUpdatesEnabled(True)
 
         except Exception as e:
             self.logger.error(f"Could not load processing history: {e}")
 
         return steps_found
 
+    def _add_nodes(self, nodes):
+        """Add documented nodes to the graph in one bulk update.
+
+        :param nodes: Nodes to add
+        :type nodes: list
+        """
+        if not nodes:
+            return
+        self.graph_view.begin_bulk_add()
+        try:
+            for node in nodes:
+                self.graph_view.add_node(node)
+        finally:
+            self.graph_view.end_bulk_add()
+
     def toggle_connection_mode(self, enabled):
         """Toggle connection mode.
 
@@ -362,7 +404,7 @@ class GraphTab(QWidget):
         )
 
         if reply == QMessageBox.Yes:
-            self.graph_view.scene.clear()
+            self.graph_view.clear()
             self.documented_layers.clear()
             self.documented_steps.clear()
 
@@ -382,13 +424,9 @@ class GraphTab(QWidget):
         :param layer_obj: Layer object that was removed
         :type layer_obj: Layer
         """
-        # Find and remove the layer from stored layers
-        for name, _ in list(self.documented_layers.items()):
-            # Check if this is the same layer object
-            if name == layer_obj.name:
-                del self.documented_layers[name]
-                self.logger.info(f"Removed layer from documentation: {name}")
-                break
+        # Documented layers are keyed by name
+        if self.documented_layers.pop(layer_obj.name, None) is not None:
+            self.logger.info(f"Removed layer from documentation: {layer_obj.name}")
 
     def on_process_removed(self, process_obj):
         """Handle process removal from the graph.
@@ -396,13 +434,9 @@ class GraphTab(QWidget):
         :param process_obj: Process object that was removed
         :type process_obj: Process
         """
-        # Find and remove the process from stored steps
-        for step_id, _ in list(self.documented_steps.items()):
-            # Check if this is the same process object
-            if step_id == process_obj.id:
-                del self.documented_steps[step_id]
-                self.logger.info(f"Removed process from documentation: {step_id}")
-                break
+        # Documented steps are keyed by process id
+        if self.documented_steps.pop(process_obj.id, None) is not None:
+            self.logger.info(f"Removed process from documentation: {process_obj.id}")
 
     # ============================================================================
     # PUBLIC INTERFACE
@@ -3,23 +3,172 @@
 Graph View - Custom graphics view for layer relationship graphs
 """
 
-from qgis.PyQt.QtCore import Qt
+from itertools import count
+
+from qgis.PyQt.QtCore import QEvent, QPointF, QRectF, Qt, QTimer
 from qgis.PyQt.QtGui import QBrush, QColor
 from qgis.PyQt.QtWidgets import (
     QGraphicsScene,
-    QGraphicsTextItem,
     QGraphicsView,
     QMessageBox,
+    QToolTip,
 )
 
-from .connection_arrow import ConnectionArrow
+try:
+    from qgis.PyQt.QtWidgets import QOpenGLWidget
+except ImportError:  # Qt 6 moved it to its own module
+    try:
+        from qgis.PyQt.QtOpenGLWidgets import QOpenGLWidget
+    except ImportError:  # Qt built without OpenGL support
+        QOpenGLWidget = None
+
+from .connection_arrow import (
+    ARROW_PEN,
+    ARROWHEAD_BRUSH,
+    ARROWHEAD_PEN,
+    ConnectionArrow,
+)
 from .layer_node import LayerNode
+from .node_base import NODE_KIND_LAYER
 from .process_node import ProcessNode
 
+# Brushes for the connection-mode start node highlight
+_HIGHLIGHT_BRUSH = QBrush(QColor(255, 255, 0))
+_DEFAULT_BRUSH = QBrush(Qt.white)
+
+
+class QuadTree:
+    """Quadtree over node scene rects for point hit-testing.
+
+    Each tree cell is subdivided into four quadrants once it holds more
+    than CAPACITY items. Items that straddle a quadrant border, or lie
+    outside the root rect, stay in the deepest cell that fully contains
+    them, so every item is stored in exactly one cell.
+    """
+
+    CAPACITY = 8  # Items per cell before it is subdivided
+    MAX_DEPTH = 8
+
+    # ============================================================================
+    # INITIALIZATION
+    # ============================================================================
+
+    def __init__(self, rect, depth=0):
+        """Initialize an empty tree cell.
+
+        :param rect: Area covered by this cell in scene coordinates
+        :type rect: QRectF
+        :param depth: Depth of this cell below the root
+        :type depth: int
+        """
+        self.rect = QRectF(rect)
+        self.depth = depth
+        self.items = {}  # item -> scene rect
+        self.children = []  # NW, NE, SW, SE once subdivided
+
+    # ============================================================================
+    # PUBLIC INTERFACE
+    # ============================================================================
+
+    def insert(self, item, rect):
+        """Insert an item with its scene rect.
+
+        :param item: Item to insert
+        :type item: QGraphicsItem
+        :param rect: Scene rect of the item
+        :type rect: QRectF
+        """
+        cell = self._find_cell(rect)
+        cell.items[item] = QRectF(rect)
+        if (
+            not cell.children
+            and len(cell.items) > self.CAPACITY
+            and cell.depth < self.MAX_DEPTH
+        ):
+            cell._subdivide()
+
+    def remove(self, item, rect):
+        """Remove an item inserted with the given scene rect.
+
+        :param item: Item to remove
+        :type item: QGraphicsItem
+        :param rect: Scene rect the item was inserted with
+        :type rect: QRectF
+        """
+        self._find_cell(rect).items.pop(item, None)
+
+    def query_point(self, x, y):
+        """Get all items whose rect contains a scene point.
+
+        :param x: X coordinate in scene coordinates
+        :type x: float
+        :param y: Y coordinate in scene coordinates
+        :type y: float
+        :return: Items containing the point
+        :rtype: list
+        """
+        point = QPointF(x, y)
+        found = []
+        cells = [self]
+        while cells:
+            cell = cells.pop()
+            found.extend(
+                item for item, rect in cell.items.items() if rect.contains(point)
+            )
+            # Quadrants share their edges, a point on a border lies in several
+            cells.extend(child for child in cell.children if child.rect.contains(point))
+        return found
+
+    # ============================================================================
+    # UTILITY / HELPER METHODS
+    # ============================================================================
+
+    def _find_cell(self, rect):
+        """Get the deepest existing cell that fully contains a rect.
+
+        :param rect: Scene rect to place
+        :type rect: QRectF
+        :return: Cell holding the rect
+        :rtype: QuadTree
+        """
+        cell = self
+        while cell.children:
+            child = next(
+                (child for child in cell.children if child.rect.contains(rect)),
+                None,
+            )
+            if child is None:
+                break
+            cell = child
+        return cell
+
+    def _subdivide(self):
+        """Split this cell into quadrants and push down the items that fit"""
+        half_width = self.rect.width() / 2
+        half_height = self.rect.height() / 2
+        x = self.rect.x()
+        y = self.rect.y()
+        self.children = [
+            QuadTree(
+                QRectF(x + offset_x, y + offset_y, half_width, half_height),
+                self.depth + 1,
+            )
+            for offset_y in (0, half_height)
+            for offset_x in (0, half_width)
+        ]
+
+        items = self.items
+        self.items = {}
+        for item, rect in items.items():
+            self.insert(item, rect)
+
 
 class GraphView(QGraphicsView):
     """Custom graphics view for layer relationships"""
 
+    # Node count above which rendering moves to an OpenGL viewport
+    OPENGL_NODE_THRESHOLD = 150
+
     # ============================================================================
     # INITIALIZATION
     # ============================================================================
@@ -30,6 +179,13 @@ class GraphView(QGraphicsView):
         self.scene = QGraphicsScene()
         self.setScene(self.scene)
 
+        # Nodes are moved around constantly, so skip the BSP index rebuilds
+        # and only repaint the exposed regions
+        self.scene.setItemIndexMethod(QGraphicsScene.NoIndex)
+        self.setViewportUpdateMode(QGraphicsView.MinimalViewportUpdate)
+        self.setOptimizationFlag(QGraphicsView.DontSavePainterState, True)
+        self.setOptimizationFlag(QGraphicsView.DontAdjustForAntialiasing, True)
+
         # Enable drag and drop
         self.setAcceptDrops(True)
         self.setDragMode(QGraphicsView.RubberBandDrag)
@@ -38,9 +194,33 @@ class GraphView(QGraphicsView):
         self.connection_mode = False
         self.connection_start = None
 
+        # Connection arrows, drawn together in drawForeground. Kept as an
+        # insertion-ordered dict (arrow -> None) for O(1) removal
+        self.arrows = {}
+
+        # Arrows whose nodes moved, recomputed once per event loop pass so an
+        # arrow between two dragged nodes is only updated once
+        self._pending_arrows = {}
+        self._arrow_timer = QTimer(self)
+        self._arrow_timer.setSingleShot(True)
+        self._arrow_timer.setInterval(0)
+        self._arrow_timer.timeout.connect(self._update_pending_arrows)
+
+        # Nesting depth of begin_bulk_add/end_bulk_add
+        self._bulk_depth = 0
+
+        # Whether the GL viewport is used
+        self._opengl_viewport = False
+
         # Set scene size
         self.scene.setSceneRect(0, 0, 1000, 800)
 
+        # Spatial index of the node rects for click hit-testing, and the
+        # stacking order of the nodes (node -> insertion number)
+        self.node_index = QuadTree(self.scene.sceneRect())
+        self._node_order = {}
+        self._node_counter = count()
+
     # ============================================================================
     # DRAG AND DROP HANDLERS
     # ============================================================================
@@ -80,15 +260,71 @@ class GraphView(QGraphicsView):
                 layer_type = data[2] if len(data) > 2 else "Vector"
                 node = LayerNode(name, layer_type)
                 node.setPos(scene_pos)
-                self.scene.addItem(node)
+                self.add_node(node)
             elif node_type == "process":
                 algorithm = data[2] if len(data) > 2 else ""
                 node = ProcessNode(name, algorithm)
                 node.setPos(scene_pos)
-                self.scene.addItem(node)
+                self.add_node(node)
 
             event.acceptProposedAction()
 
+    # ============================================================================
+    # DRAWING
+    # ============================================================================
+
+    def drawForeground(self, painter, rect):  # noqa: N802
+        """Draw all connection arrows in one batched pass.
+
+        :param painter: Painter for the view
+        :type painter: QPainter
+        :param rect: Exposed area in scene coordinates
+        :type rect: QRectF
+        """
+        super().drawForeground(painter, rect)
+
+        visible = [arrow for arrow in self.arrows if arrow.bounds.intersects(rect)]
+        if not visible:
+            return
+
+        painter.save()
+        painter.setPen(ARROW_PEN)
+        painter.drawLines([arrow.line for arrow in visible])
+
+        painter.setPen(ARROWHEAD_PEN)
+        painter.setBrush(ARROWHEAD_BRUSH)
+        for arrow in visible:
+            painter.drawConvexPolygon(arrow.arrowhead)
+        painter.restore()
+
+    def update_arrow_region(self, rect):
+        """Schedule a repaint of the scene area covered by an arrow.
+
+        :param rect: Area in scene coordinates
+        :type rect: QRectF
+        """
+        if self._bulk_depth == 0 and not rect.isEmpty():
+            self.scene.update(rect)
+
+    def schedule_arrow_updates(self, *arrow_groups):
+        """Queue the arrows of a moved node for recomputation in one call.
+
+        :param arrow_groups: Iterables of arrows to update, e.g. the arrow
+            registries of a node
+        :type arrow_groups: iterable
+        """
+        for arrows in arrow_groups:
+            self._pending_arrows.update(dict.fromkeys(arrows))
+        if self._pending_arrows and not self._arrow_timer.isActive():
+            self._arrow_timer.start()
+
+    def _update_pending_arrows(self):
+        """Recompute all arrows queued since the last pass"""
+        pending = self._pending_arrows
+        self._pending_arrows = {}
+        for arrow in pending:
+            arrow.update_position()
+
     # ============================================================================
     # MOUSE EVENT HANDLERS
     # ============================================================================
@@ -99,22 +335,22 @@ class GraphView(QGraphicsView):
         :param event: Mouse press event
         :type event: QMouseEvent
         """
-        if self.connection_mode and event.button() == Qt.LeftButton:
-            item = self.itemAt(event.pos())
+        # Read once, each access converts a new copy from C++
+        pos = event.pos()
+        left_click = event.button() == Qt.LeftButton
 
-            # If we clicked on a text item, get its parent node
-            if isinstance(item, QGraphicsTextItem):
-                item = item.parentItem()
+        if self.connection_mode and left_click:
+            # Quadtree lookup, an empty result goes straight to the cancel path
+            item = self.node_at(pos)
 
-            if isinstance(item, (LayerNode, ProcessNode)):
+            if item is not None:
                 if self.connection_start is None:
                     self.connection_start = item
-                    item.setBrush(QBrush(QColor(255, 255, 0)))  # Highlight
+                    item.setBrush(_HIGHLIGHT_BRUSH)
                 else:
                     # Check if connection is valid (layer <-> process only)
                     if self.is_valid_connection(self.connection_start, item):
-                        arrow = ConnectionArrow(self.connection_start, item)
-                        self.scene.addItem(arrow)
+                        self.add_arrow(ConnectionArrow(self.connection_start, item))
                     else:
                         QMessageBox.warning(
                             None,
@@ -131,14 +367,41 @@ class GraphView(QGraphicsView):
                     self.connection_start = None
             else:
                 # Cancel connection
-                if self.connection_start:
+                if self.connection_start is not None:
                     self.connection_start.setBrush(
                         self._get_original_brush(self.connection_start)
                     )
                     self.connection_start = None
+        elif left_click:
+            # Delete arrow on click, unless a node is under the cursor: arrowheads
+            # end on the node outlines, where the node is grabbed for dragging
+            arrow = self.arrow_at(pos) if self.node_at(pos) is None else None
+            if arrow is not None:
+                arrow.remove_arrow()
+            else:
+                super().mousePressEvent(event)
         else:
             super().mousePressEvent(event)
 
+    def viewportEvent(self, event):  # noqa: N802
+        """Show the tooltip for arrows, which are not scene items.
+
+        :param event: Viewport event
+        :type event: QEvent
+        :return: True if the event was handled
+        :rtype: bool
+        """
+        if (
+            event.type() == QEvent.ToolTip
+            and self.node_at(event.pos()) is None
+            and self.arrow_at(event.pos())
+        ):
+            QToolTip.showText(
+                event.globalPos(), "Click to delete connection", self.viewport()
+            )
+            return True
+        return super().viewportEvent(event)
+
     # ============================================================================
     # UTILITY / HELPER METHODS
     # ============================================================================
@@ -154,37 +417,149 @@ class GraphView(QGraphicsView):
         :rtype: bool
         """
         # Only allow connections between different node types
-        if type(start_node) is type(end_node):
+        if start_node.kind == end_node.kind:
             return False  # Same type (layer-layer or process-process) not allowed
 
         # If connecting TO a layer, check if it can accept input
-        if isinstance(end_node, LayerNode):
-            if not end_node.can_accept_input_connection():
-                return False  # Layer already has an input connection
+        if end_node.kind == NODE_KIND_LAYER and end_node.input_arrows:
+            return False  # Layer already has an input connection
 
         return True  # Different types (layer-process) allowed
 
+    def node_at(self, pos):
+        """Get the topmost node at a viewport position.
+
+        :param pos: Position in viewport coordinates
+        :type pos: QPoint
+        :return: Node under the position, or None
+        :rtype: LayerNode or ProcessNode or None
+        """
+        scene_pos = self.mapToScene(pos)
+        hits = [
+            node
+            for node in self.node_index.query_point(scene_pos.x(), scene_pos.y())
+            if node.contains(node.mapFromScene(scene_pos))
+        ]
+        if not hits:
+            return None
+        # Same stacking rule as the scene: higher z first, then added later
+        return max(hits, key=lambda node: (node.zValue(), self._node_order[node]))
+
+    def arrow_at(self, pos):
+        """Get the topmost arrow at a viewport position.
+
+        :param pos: Position in viewport coordinates
+        :type pos: QPoint
+        :return: Arrow under the position, or None
+        :rtype: ConnectionArrow or None
+        """
+        scene_pos = self.mapToScene(pos)
+        for arrow in reversed(self.arrows):
+            if arrow.contains(scene_pos):
+                return arrow
+        return None
+
     def _get_original_brush(self, node):
-        """Get original brush color for node type.
+        """Get the brush a node was styled with before highlighting.
 
         :param node: The node to get the brush for
         :type node: LayerNode or ProcessNode
-        :return: Brush with the original color for the node type
+        :return: Brush with the original color for the node
         :rtype: QBrush
         """
-        if isinstance(node, LayerNode):
-            if node.layer_type == "Vector":
-                return QBrush(QColor(100, 149, 237))
-            else:
-                return QBrush(QColor(255, 140, 0))
-        elif isinstance(node, ProcessNode):
-            return QBrush(QColor(144, 238, 144))
-        return QBrush(Qt.white)
+        return node.original_brush or _DEFAULT_BRUSH
 
     # ============================================================================
     # PUBLIC INTERFACE
     # ============================================================================
 
+    def add_node(self, node):
+        """Add a layer or process node to the scene.
+
+        :param node: Node to add
+        :type node: LayerNode or ProcessNode
+        """
+        self.scene.addItem(node)
+        node.view = self
+        self._node_order[node] = next(self._node_counter)
+        self.node_index.insert(node, node.index_rect)
+        if len(self._node_order) > self.OPENGL_NODE_THRESHOLD:
+            self._use_opengl_viewport()
+
+    def update_node_index(self, node, old_rect):
+        """Move a node in the spatial index after its geometry changed.
+
+        :param node: Node that moved or changed size
+        :type node: LayerNode or ProcessNode
+        :param old_rect: Scene rect the node was indexed with
+        :type old_rect: QRectF
+        """
+        self.node_index.remove(node, old_rect)
+        self.node_index.insert(node, node.index_rect)
+
+    def discard_node(self, node):
+        """Remove a node from the spatial index before it leaves the scene.
+
+        :param node: Node being removed
+        :type node: LayerNode or ProcessNode
+        """
+        if self._node_order.pop(node, None) is not None:
+            self.node_index.remove(node, node.index_rect)
+        node.view = None
+
+    def _use_opengl_viewport(self):
+        """Render through an OpenGL viewport once the graph has grown large"""
+        if self._opengl_viewport or QOpenGLWidget is None:
+            return
+        self._opengl_viewport = True
+        self.setViewport(QOpenGLWidget())
+        # A GL viewport repaints as a whole; partial updates only add overhead
+        self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+
+    def add_arrow(self, arrow):
+        """Add a connection arrow to the view.
+
+        :param arrow: Arrow to add
+        :type arrow: ConnectionArrow
+        """
+        arrow.view = self
+        self.arrows[arrow] = None
+        self.update_arrow_region(arrow.bounds)
+
+    def discard_arrow(self, arrow):
+        """Remove a connection arrow from the view.
+
+        :param arrow: Arrow to remove
+        :type arrow: ConnectionArrow
+        """
+        self._pending_arrows.pop(arrow, None)
+        if arrow in self.arrows:
+            del self.arrows[arrow]
+            self.update_arrow_region(arrow.bounds)
+        arrow.view = None
+
+    def begin_bulk_add(self):
+        """Start adding many nodes or arrows, deferring their repaints"""
+        self._bulk_depth += 1
+
+    def end_bulk_add(self):
+        """Finish a bulk add and repaint the scene once"""
+        self._bulk_depth = max(0, self._bulk_depth - 1)
+        if self._bulk_depth == 0:
+            self.scene.update()
+
+    def clear(self):
+        """Remove all nodes and connection arrows"""
+        for arrow in self.arrows:
+            arrow.view = None
+        self.arrows.clear()
+        self._pending_arrows.clear()
+        for node in self._node_order:
+            node.view = None
+        self._node_order.clear()
+        self.node_index = QuadTree(self.scene.sceneRect())
+        self.scene.clear()
+
     def toggle_connection_mode(self, enabled):
         """Toggle connection creation mode.
 
@@ -3,21 +3,59 @@
 Layer Node - Draggable layer node displayed as rectangle in graph view
 """
 
+import math
+from itertools import chain
+
 from qgis.PyQt.QtCore import Qt
-from qgis.PyQt.QtGui import QBrush, QColor, QFont, QPen
+from qgis.PyQt.QtGui import QBrush, QColor, QPen
 from qgis.PyQt.QtWidgets import (
     QGraphicsItem,
     QGraphicsRectItem,
     QGraphicsTextItem,
-    QMenu,
 )
 
 from ..Layer.layer_metadata_dialog import LayerMetadataDialog
-
-
-class LayerNode(QGraphicsRectItem):
+from .node_base import NODE_KIND_LAYER, NodeBase
+
+# Label prefixes marking visible and external layers
+_VISIBLE_PREFIX = "👁 "  # Eye for visible layers
+_EXTERNAL_PREFIX = "📖 "  # Book for external layers
+
+# Tooltip state labels
+_TT_VISIBLE = "Visible"
+_TT_HIDDEN = "Hidden"
+_TT_EXTERNAL = " | External Source"
+
+# Borders for visible, hidden and external layers
+_PEN_VISIBLE = QPen(Qt.black, 2)  # Solid border
+_PEN_HIDDEN = QPen(Qt.gray, 2, Qt.DashLine)  # Dashed border
+_PEN_EXTERNAL = QPen(Qt.darkBlue, 3)  # Thicker blue border
+
+# Fills keyed by (is vector layer, visible), hidden layers are more muted
+_VECTOR_COLOR = QColor(100, 149, 237)
+_RASTER_COLOR = QColor(255, 140, 0)
+_LAYER_BRUSHES = {
+    (True, True): QBrush(_VECTOR_COLOR),
+    (True, False): QBrush(_VECTOR_COLOR.darker(150)),
+    (False, True): QBrush(_RASTER_COLOR),
+    (False, False): QBrush(_RASTER_COLOR.darker(150)),
+}
+
+
+class LayerNode(QGraphicsRectItem, NodeBase):
     """Draggable layer node - displayed as rectangle"""
 
+    kind = NODE_KIND_LAYER
+    MENU_ACTIONS = (("Inspect", "_inspect_layer"), ("Delete Layer", "delete_node"))
+    READONLY_FIELDS = (
+        ("description_textedit", "setReadOnly", True),
+        ("source_title_lineedit", "setReadOnly", True),
+        ("source_url_lineedit", "setReadOnly", True),
+        ("source_date_dateedit", "setReadOnly", True),
+        ("source_comment_textedit", "setReadOnly", True),
+        ("external_checkbox", "setEnabled", False),
+    )
+
     # ============================================================================
     # INITIALIZATION
     # ============================================================================
@@ -32,8 +70,10 @@ class LayerNode(QGraphicsRectItem):
         self.layer_obj = layer_obj  # Reference to Layer object
         self.layer_name = getattr(layer_obj, "name", "Unnamed Layer")
         self.layer_type = getattr(layer_obj, "type", "Unknown")
-        self.connections = []  # List of connected arrows
-        self.input_arrows = []  # Arrows coming INTO this layer (only one allowed)
+        # Arrow registries as insertion-ordered dicts (arrow -> None) for
+        # O(1) removal
+        self.connections = {}  # Connected arrows
+        self.input_arrows = {}  # Arrows coming INTO this layer (only one allowed)
 
         # Set visual properties based on layer properties
         self.update_visual_style()
@@ -45,6 +85,7 @@ class LayerNode(QGraphicsRectItem):
 
         # Add text label with indicators
         self.text_item = QGraphicsTextItem("", self)
+        self._enable_render_cache()
         self._setup_text_item()
 
     # ============================================================================
@@ -53,96 +94,53 @@ class LayerNode(QGraphicsRectItem):
 
     def update_visual_style(self):
         """Update visual style based on layer properties"""
-        # Base color for layer type
-        if self.layer_type == "Vector":
-            base_color = QColor(100, 149, 237)
-        else:
-            base_color = QColor(255, 140, 0)
-
-        # Modify styling for visibility
-        visible = getattr(self.layer_obj, "visible", True)
-        if not visible:
-            # Make non-visible layers more muted
-            base_color = base_color.darker(150)
-            self.setPen(QPen(Qt.gray, 2, Qt.DashLine))  # Dashed border
-        else:
-            self.setPen(QPen(Qt.black, 2))  # Solid border
+        layer = self.layer_obj
+        visible = bool(getattr(layer, "visible", True))
+        external = getattr(layer, "external", False)
 
-        # External layers get a different border style
-        external = getattr(self.layer_obj, "external", False)
+        # External layers get a different border style than the visibility one
         if external:
-            self.setPen(QPen(Qt.darkBlue, 3))  # Thicker blue border
+            self.setPen(_PEN_EXTERNAL)
+        elif visible:
+            self.setPen(_PEN_VISIBLE)
+        else:
+            self.setPen(_PEN_HIDDEN)
+
+        # Base color for layer type, muted for non-visible layers
+        self.original_brush = _LAYER_BRUSHES[self.layer_type == "Vector", visible]
+        self.setBrush(self.original_brush)
 
-        self.setBrush(QBrush(base_color))
+        # The pen width is part of the bounding rect
+        self._update_scene_geometry()
 
     def _setup_text_item(self):
         """Setup text item to fit within the rectangle with visual indicators"""
-        rect = self.rect()
+        layer = self.layer_obj
 
         # Use layer.name if available, otherwise use layer_name
-        display_name = getattr(self.layer_obj, "name", self.layer_name)
-
-        # Create display text with indicators
-        display_text = display_name
-
-        # Add visual indicators
-        indicators = []
-        visible = getattr(self.layer_obj, "visible", True)
-        external = getattr(self.layer_obj, "external", False)
-
-        if visible:
-            indicators.append("👁")  # Eye for visible layers
-        if external:
-            indicators.append("📖")  # Book for external layers
+        display_name = getattr(layer, "name", self.layer_name)
+        visible = getattr(layer, "visible", True)
+        external = getattr(layer, "external", False)
 
-        if indicators:
-            display_text = " ".join(indicators) + " " + display_text
+        # Create display text with visual indicators
+        display_text = (
+            (_VISIBLE_PREFIX if visible else "")
+            + (_EXTERNAL_PREFIX if external else "")
+            + display_name
+        )
 
         self.text_item.setPlainText(display_text)
 
-        # Start with a reasonable font size
-        font = QFont()
-        font.setPointSize(10)
-        self.text_item.setFont(font)
-
-        # Calculate available space (with padding)
-        available_width = rect.width() - 20
-        available_height = rect.height() - 20
-
-        # Adjust font size to fit
-        font_size = 10
-        while font_size > 6:  # Minimum readable size
-            font.setPointSize(font_size)
-            self.text_item.setFont(font)
-
-            # Set text width for word wrapping
-            self.text_item.setTextWidth(available_width)
-
-            # Check if it fits
-            text_rect = self.text_item.boundingRect()
-            if text_rect.height() <= available_height:
-                break
-
-            font_size -= 1
-
-        # Center the text
-        text_rect = self.text_item.boundingRect()
-        x_offset = (rect.width() - text_rect.width()) / 2
-        y_offset = (rect.height() - text_rect.height()) / 2
-        self.text_item.setPos(x_offset, y_offset)
+        # Shrink the font until the text fits (with padding), then center it
+        self._fit_text_item(padding=20)
 
         # Create tooltip with full information
-        layer_type_display = f"{self.layer_type} Layer"
-        tooltip_parts = [f"{layer_type_display}: {display_name}"]
-
-        if visible:
-            tooltip_parts.append("Visible")
-        else:
-            tooltip_parts.append("Hidden")
+        state = _TT_VISIBLE if visible else _TT_HIDDEN
+        tooltip = f"{self.layer_type} Layer: {display_name} | {state}"
         if external:
-            tooltip_parts.append("External Source")
+            tooltip += _TT_EXTERNAL
 
-        self.setToolTip(" | ".join(tooltip_parts))
+        self.setToolTip(tooltip)
 
     def refresh_display(self):
         """Refresh the display after layer metadata changes"""
@@ -165,9 +163,15 @@ class LayerNode(QGraphicsRectItem):
         :return: Result of parent itemChange
         :rtype: QVariant
         """
-        if change == QGraphicsItem.ItemPositionChange:
-            for arrow in self.connections + self.input_arrows:
-                arrow.update_position()
+        if change == QGraphicsItem.ItemPositionHasChanged:
+            # Needed even without arrows, the view indexes nodes by geometry
+            self._update_scene_geometry()
+            if self.connections or self.input_arrows:
+                if self.view is not None:
+                    self.view.schedule_arrow_updates(self.connections, self.input_arrows)
+                else:
+                    for arrow in chain(self.connections, self.input_arrows):
+                        arrow.update_position()
         return super().itemChange(change, value)
 
     def contextMenuEvent(self, event):  # noqa: N802
@@ -176,15 +180,7 @@ class LayerNode(QGraphicsRectItem):
         :param event: Context menu event
         :type event: QGraphicsSceneContextMenuEvent
         """
-        menu = QMenu()
-        inspect_action = menu.addAction("Inspect")
-        delete_action = menu.addAction("Delete Layer")
-        action = menu.exec_(event.screenPos())
-
-        if action == inspect_action:
-            self._inspect_layer()
-        elif action == delete_action:
-            self.delete_node()
+        self._exec_context_menu(event)
 
     # ============================================================================
     # DIALOG METHODS
@@ -203,43 +199,70 @@ class LayerNode(QGraphicsRectItem):
 
         dialog.exec_()  # Show as modal dialog (no need to handle result)
 
-    def _make_dialog_readonly(self, dialog):
-        """Make all input fields in the dialog read-only.
-
-        :param dialog: Dialog to make read-only
-        :type dialog: LayerMetadataDialog
-        """
-        # Make text fields read-only
-        if hasattr(dialog, "description_textedit"):
-            dialog.description_textedit.setReadOnly(True)
-        if hasattr(dialog, "source_title_lineedit"):
-            dialog.source_title_lineedit.setReadOnly(True)
-        if hasattr(dialog, "source_url_lineedit"):
-            dialog.source_url_lineedit.setReadOnly(True)
-        if hasattr(dialog, "source_date_dateedit"):
-            dialog.source_date_dateedit.setReadOnly(True)
-        if hasattr(dialog, "source_comment_textedit"):
-            dialog.source_comment_textedit.setReadOnly(True)
-        if hasattr(dialog, "external_checkbox"):
-            dialog.external_checkbox.setEnabled(False)
-
-        # Hide save button, only show cancel/close
-        if hasattr(dialog, "save_button"):
-            dialog.save_button.hide()
-        if hasattr(dialog, "cancel_button"):
-            dialog.cancel_button.setText("Close")
-
     # ============================================================================
     # CONNECTION MANAGEMENT
     # ============================================================================
 
+    def edge_point(self, dx, dy):
+        """Get the point where a ray from the center leaves the rectangle.
+
+        :param dx: X component of the normalized direction vector
+        :type dx: float
+        :param dy: Y component of the normalized direction vector
+        :type dy: float
+        :return: Coordinates of the point on the rectangle edge
+        :rtype: tuple
+        """
+        cx, cy, half_width, half_height = self.scene_geometry
+
+        # Scale the direction to whichever edge it crosses first
+        ax = abs(dx)
+        ay = abs(dy)
+        tx = half_width / ax if ax > 0 else math.inf
+        ty = half_height / ay if ay > 0 else math.inf
+        t = min(tx, ty)
+
+        return cx + dx * t, cy + dy * t
+
+    def attach_input(self, arrow):
+        """Register an arrow ending at this layer.
+
+        :param arrow: Arrow to register
+        :type arrow: ConnectionArrow
+        """
+        self.connections[arrow] = None
+
+    def attach_output(self, arrow):
+        """Register an arrow starting at this layer.
+
+        :param arrow: Arrow to register
+        :type arrow: ConnectionArrow
+        """
+        self.connections[arrow] = None
+
+    def detach_input(self, arrow):
+        """Unregister an arrow ending at this layer.
+
+        :param arrow: Arrow to unregister
+        :type arrow: ConnectionArrow
+        """
+        self.connections.pop(arrow, None)
+
+    def detach_output(self, arrow):
+        """Unregister an arrow starting at this layer.
+
+        :param arrow: Arrow to unregister
+        :type arrow: ConnectionArrow
+        """
+        self.connections.pop(arrow, None)
+
     def can_accept_input_connection(self):
         """Check if this layer can accept another input connection.
 
         :return: True if layer can accept input, False otherwise
         :rtype: bool
         """
-        return len(self.input_arrows) == 0  # Only allow one input connection
+        return not self.input_arrows  # Only allow one input connection
 
     def add_input_arrow(self, arrow):
         """Add an input arrow to this layer.
@@ -250,7 +273,7 @@ class LayerNode(QGraphicsRectItem):
         :rtype: bool
         """
         if self.can_accept_input_connection():
-            self.input_arrows.append(arrow)
+            self.input_arrows[arrow] = None
             return True
         return False
 
@@ -260,8 +283,7 @@ class LayerNode(QGraphicsRectItem):
         :param arrow: Arrow to remove
         :type arrow: ConnectionArrow
         """
-        if arrow in self.input_arrows:
-            self.input_arrows.remove(arrow)
+        self.input_arrows.pop(arrow, None)
 
     # ============================================================================
     # PUBLIC INTERFACE
@@ -270,16 +292,16 @@ class LayerNode(QGraphicsRectItem):
     def delete_node(self):
         """Remove node and all connections"""
         # Remove all connected arrows
-        for arrow in self.connections[:]:
-            arrow.remove_arrow()
-        for arrow in self.input_arrows[:]:
+        for arrow in [*self.connections, *self.input_arrows]:
             arrow.remove_arrow()
 
-        # Notify parent widget about removal
-        if hasattr(self.scene(), "views") and self.scene().views():
-            view = self.scene().views()[0]
-            if hasattr(view.parent(), "on_layer_removed"):
-                view.parent().on_layer_removed(self.layer_obj)
+        view = self.view
+        if view is not None:
+            # Notify parent widget about removal
+            on_removed = getattr(view.parent(), "on_layer_removed", None)
+            if on_removed is not None:
+                on_removed(self.layer_obj)
 
-        # Remove from scene
+            # Remove from spatial index
+            view.discard_node(self)
         self.scene().removeItem(self)
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""
+Node Base - Shared behavior of the layer and process graph nodes
+"""
+
+from qgis.PyQt.QtGui import QFont
+from qgis.PyQt.QtWidgets import QGraphicsItem, QMenu
+
+# Node kinds, compared when validating connections
+NODE_KIND_LAYER = 0
+NODE_KIND_PROCESS = 1
+
+
+class NodeBase:
+    """Mixin with the label, menu, dialog and connection handling of graph nodes.
+
+    Node classes using it provide the geometry and connection interface read
+    by ConnectionArrow and GraphView:
+
+    - ``edge_point(dx, dy)`` returns the point where a ray from the node
+      center along the normalized direction leaves the node outline
+    - ``attach_input(arrow)`` and ``attach_output(arrow)`` register an arrow
+      ending or starting at the node
+    - ``detach_input(arrow)`` and ``detach_output(arrow)`` unregister it again
+    """
+
+    MAX_FONT_SIZE = 10  # Label point size when the text fits
+    MIN_FONT_SIZE = 7  # Minimum readable label point size
+
+    kind = None  # NODE_KIND_* constant of the node class
+
+    # Context menu entries as (label, handler method name) pairs
+    MENU_ACTIONS = ()
+    # Inspect dialog fields to lock as (widget name, setter name, value)
+    READONLY_FIELDS = ()
+
+    view = None  # GraphView showing this node, set by GraphView.add_node
+    original_brush = None  # Brush the node is styled with, restored after highlight
+
+    # ============================================================================
+    # VISUAL STYLE
+    # ============================================================================
+
+    def _enable_render_cache(self):
+        """Cache the rendered node and its label in device coordinates.
+
+        Reuses the rendered pixmaps while panning and redrawing unrelated
+        items. The label is cached separately, children are not drawn into
+        the pixmap of the node.
+        """
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        self.text_item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+
+    def _fit_text_item(self, padding):
+        """Use the largest label font size that fits and center the label.
+
+        The label height only shrinks with the font size, so after checking
+        the full size the remaining range is bisected instead of stepping
+        down one point at a time.
+
+        :param padding: Total horizontal and vertical padding inside the node
+        :type padding: float
+        """
+        rect = self.rect()
+        available_height = rect.height() - padding
+        font = QFont()
+
+        # Set text width for word wrapping
+        self.text_item.setTextWidth(rect.width() - padding)
+
+        def fits(font_size):
+            font.setPointSize(font_size)
+            self.text_item.setFont(font)
+            return self.text_item.boundingRect().height() <= available_height
+
+        if not fits(self.MAX_FONT_SIZE):
+            low = self.MIN_FONT_SIZE
+            high = self.MAX_FONT_SIZE - 1
+            while low < high:
+                mid = (low + high + 1) // 2
+                if fits(mid):
+                    low = mid
+                else:
+                    high = mid - 1
+            if font.pointSize() != low:
+                font.setPointSize(low)
+                self.text_item.setFont(font)
+
+        # Center the text
+        text_rect = self.text_item.boundingRect()
+        x_offset = (rect.width() - text_rect.width()) / 2
+        y_offset = (rect.height() - text_rect.height()) / 2
+        self.text_item.setPos(x_offset, y_offset)
+
+    # ============================================================================
+    # EVENT HANDLERS
+    # ============================================================================
+
+    def _exec_context_menu(self, event):
+        """Show the context menu and run the handler of the chosen entry.
+
+        The menu is built once per node class and reused for every node.
+
+        :param event: Context menu event
+        :type event: QGraphicsSceneContextMenuEvent
+        """
+        cls = type(self)
+        menu = cls.__dict__.get("_context_menu")
+        if menu is None:
+            menu = QMenu()
+            for label, handler in cls.MENU_ACTIONS:
+                menu.addAction(label).setData(handler)
+            cls._context_menu = menu
+
+        action = menu.exec_(event.screenPos())
+        if action is not None:
+            getattr(self, action.data())()
+
+    # ============================================================================
+    # DIALOG METHODS
+    # ============================================================================
+
+    def _make_dialog_readonly(self, dialog):
+        """Make all input fields in the dialog read-only.
+
+        :param dialog: Metadata dialog to make read-only
+        :type dialog: QDialog
+        """
+        # Lock the editable fields of the dialog
+        for name, setter, value in self.READONLY_FIELDS:
+            widget = getattr(dialog, name, None)
+            if widget is not None:
+                getattr(widget, setter)(value)
+
+        # Hide save button, only show cancel/close
+        save_button = getattr(dialog, "save_button", None)
+        if save_button is not None:
+            save_button.hide()
+        cancel_button = getattr(dialog, "cancel_button", None)
+        if cancel_button is not None:
+            cancel_button.setText("Close")
+
+    # ============================================================================
+    # GEOMETRY
+    # ============================================================================
+
+    def _update_scene_geometry(self):
+        """Cache the scene geometry read by connected arrows and the view"""
+        rect = self.sceneBoundingRect()
+        old_rect = getattr(self, "index_rect", None)
+        self.index_rect = rect
+        if self.view is not None and old_rect is not None:
+            self.view.update_node_index(self, old_rect)
+
+        half_width = rect.width() / 2
+        half_height = rect.height() / 2
+        self.scene_geometry = (
+            rect.x() + half_width,
+            rect.y() + half_height,
+            half_width,
+            half_height,
+        )
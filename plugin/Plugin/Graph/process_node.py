@@ -3,22 +3,38 @@
 Process Node - Draggable processing step node displayed as circle/oval in graph view
 """
 
+import logging
+from itertools import chain
+
 from qgis.PyQt.QtCore import Qt
-from qgis.PyQt.QtGui import QBrush, QColor, QFont, QPen
+from qgis.PyQt.QtGui import QBrush, QColor, QPen
 from qgis.PyQt.QtWidgets import (
     QGraphicsEllipseItem,
     QGraphicsItem,
     QGraphicsTextItem,
-    QMenu,
 )
 
 from ..Process.process_metadata_dialog import ProcessMetadataDialog
 from ..utility import get_logger
+from .node_base import NODE_KIND_PROCESS, NodeBase
+
+logger = get_logger("ProcessNode")
+
+# Light green for regular processes
+_PROCESS_BRUSH = QBrush(QColor(144, 238, 144))
+_PROCESS_PEN = QPen(Qt.black, 2)
 
 
-class ProcessNode(QGraphicsEllipseItem):
+class ProcessNode(QGraphicsEllipseItem, NodeBase):
     """Draggable processing step node - displayed as circle/oval"""
 
+    kind = NODE_KIND_PROCESS
+    MENU_ACTIONS = (("Inspect", "_inspect_process"), ("Delete Process", "delete_node"))
+    READONLY_FIELDS = (
+        ("name_lineedit", "setReadOnly", True),
+        ("description_textedit", "setReadOnly", True),
+    )
+
     # ============================================================================
     # INITIALIZATION
     # ============================================================================
@@ -30,7 +46,6 @@ class ProcessNode(QGraphicsEllipseItem):
         :type process_obj: Process
         """
         super().__init__(0, 0, 120, 80)  # Slightly larger oval for processes
-        self.logger = get_logger("ProcessNode")
         self.process_obj = process_obj  # Reference to Process object
         self.display_name = getattr(
             process_obj, "name", "Unnamed Process"
@@ -38,14 +53,16 @@ class ProcessNode(QGraphicsEllipseItem):
         self.algorithm = getattr(
             process_obj, "algorithm_id", "Unknown"
         )  # Fallback algorithm
-        self.input_arrows = []  # Arrows coming in
-        self.output_arrows = []  # Arrows going out
+        # Arrow registries as insertion-ordered dicts (arrow -> None) for
+        # O(1) removal
+        self.input_arrows = {}  # Arrows coming in
+        self.output_arrows = {}  # Arrows going out
 
         # Set visual properties
-        self.setBrush(
-            QBrush(QColor(144, 238, 144))
-        )  # Light green for regular processes
-        self.setPen(QPen(Qt.black, 2))
+        self.original_brush = _PROCESS_BRUSH
+        self.setBrush(self.original_brush)
+        self.setPen(_PROCESS_PEN)
+        self._update_scene_geometry()
 
         # Make draggable and selectable
         self.setFlag(QGraphicsItem.ItemIsMovable, True)
@@ -54,6 +71,7 @@ class ProcessNode(QGraphicsEllipseItem):
 
         # Add text label
         self.text_item = QGraphicsTextItem("", self)
+        self._enable_render_cache()
         self._setup_text_item()
 
     # ============================================================================
@@ -62,12 +80,12 @@ class ProcessNode(QGraphicsEllipseItem):
 
     def _setup_text_item(self):
         """Setup text item to fit within the ellipse"""
-        rect = self.rect()
-
         # Use process.name if available and not empty, otherwise use
         # display_name or algorithm
-        if hasattr(self.process_obj, "name") and self.process_obj.name:
-            process_name = self.process_obj.name
+        process = self.process_obj
+        name = getattr(process, "name", None)
+        if name:
+            process_name = name
         elif self.display_name and self.display_name != "Unnamed Process":
             process_name = self.display_name
         else:
@@ -75,39 +93,12 @@ class ProcessNode(QGraphicsEllipseItem):
 
         self.text_item.setPlainText(process_name)
 
-        # Start with a reasonable font size
-        font = QFont()
-        font.setPointSize(10)
-        self.text_item.setFont(font)
-
-        # Calculate available space (with padding) - ellipse is narrower than rectangle
-        available_width = rect.width() - 30  # More padding for ellipse
-        available_height = rect.height() - 30
-
-        # Adjust font size to fit
-        font_size = 10
-        while font_size > 6:  # Minimum readable size
-            font.setPointSize(font_size)
-            self.text_item.setFont(font)
-
-            # Set text width for word wrapping
-            self.text_item.setTextWidth(available_width)
-
-            # Check if it fits
-            text_rect = self.text_item.boundingRect()
-            if text_rect.height() <= available_height:
-                break
-
-            font_size -= 1
-
-        # Center the text
-        text_rect = self.text_item.boundingRect()
-        x_offset = (rect.width() - text_rect.width()) / 2
-        y_offset = (rect.height() - text_rect.height()) / 2
-        self.text_item.setPos(x_offset, y_offset)
+        # Shrink the font until the text fits, then center it - the ellipse
+        # needs more padding than a rectangle
+        self._fit_text_item(padding=30)
 
         # Create tooltip with process information
-        algorithm_info = getattr(self.process_obj, "algorithm_id", self.algorithm)
+        algorithm_info = getattr(process, "algorithm_id", self.algorithm)
 
         self.setToolTip(f"Process: {process_name} | Algorithm: {algorithm_info}")
 
@@ -129,9 +120,15 @@ class ProcessNode(QGraphicsEllipseItem):
         :return: Result of parent itemChange
         :rtype: QVariant
         """
-        if change == QGraphicsItem.ItemPositionChange:
-            for arrow in self.input_arrows + self.output_arrows:
-                arrow.update_position()
+        if change == QGraphicsItem.ItemPositionHasChanged:
+            # Needed even without arrows, the view indexes nodes by geometry
+            self._update_scene_geometry()
+            if self.input_arrows or self.output_arrows:
+                if self.view is not None:
+                    self.view.schedule_arrow_updates(self.input_arrows, self.output_arrows)
+                else:
+                    for arrow in chain(self.input_arrows, self.output_arrows):
+                        arrow.update_position()
         return super().itemChange(change, value)
 
     def contextMenuEvent(self, event):  # noqa: N802
@@ -140,15 +137,7 @@ class ProcessNode(QGraphicsEllipseItem):
         :param event: Context menu event
         :type event: QGraphicsSceneContextMenuEvent
         """
-        menu = QMenu()
-        inspect_action = menu.addAction("Inspect")
-        delete_action = menu.addAction("Delete Process")
-        action = menu.exec_(event.screenPos())
-
-        if action == inspect_action:
-            self._inspect_process()
-        elif action == delete_action:
-            self.delete_node()
+        self._exec_context_menu(event)
 
     # ============================================================================
     # DIALOG METHODS
@@ -172,35 +161,65 @@ class ProcessNode(QGraphicsEllipseItem):
 
         dialog.exec_()  # Show as modal dialog (no need to handle result)
 
-    def _make_dialog_readonly(self, dialog):
-        """Make all input fields in the dialog read-only.
-
-        :param dialog: Dialog to make read-only
-        :type dialog: ProcessMetadataDialog
-        """
-        # Make editable fields read-only
-        if hasattr(dialog, "name_lineedit"):
-            dialog.name_lineedit.setReadOnly(True)
-        if hasattr(dialog, "description_textedit"):
-            dialog.description_textedit.setReadOnly(True)
-
-        # Hide save button, only show cancel/close
-        if hasattr(dialog, "save_button"):
-            dialog.save_button.hide()
-        if hasattr(dialog, "cancel_button"):
-            dialog.cancel_button.setText("Close")
-
     # ============================================================================
     # CONNECTION MANAGEMENT
     # ============================================================================
 
+    def edge_point(self, dx, dy):
+        """Get the point where a ray from the center leaves the ellipse.
+
+        :param dx: X component of the normalized direction vector
+        :type dx: float
+        :param dy: Y component of the normalized direction vector
+        :type dy: float
+        :return: Coordinates of the point on the ellipse edge
+        :rtype: tuple
+        """
+        cx, cy, a, b = self.scene_geometry
+
+        # Parametric form: x = a*cos(t), y = b*sin(t) with t the direction
+        # angle; for a unit vector cos(t) = dx and sin(t) = dy
+        return cx + a * dx, cy + b * dy
+
+    def attach_input(self, arrow):
+        """Register an arrow ending at this process.
+
+        :param arrow: Arrow to register
+        :type arrow: ConnectionArrow
+        """
+        self.add_input_arrow(arrow)
+
+    def attach_output(self, arrow):
+        """Register an arrow starting at this process.
+
+        :param arrow: Arrow to register
+        :type arrow: ConnectionArrow
+        """
+        self.add_output_arrow(arrow)
+
+    def detach_input(self, arrow):
+        """Unregister an arrow ending at this process.
+
+        :param arrow: Arrow to unregister
+        :type arrow: ConnectionArrow
+        """
+        self.remove_input_arrow(arrow)
+
+    def detach_output(self, arrow):
+        """Unregister an arrow starting at this process.
+
+        :param arrow: Arrow to unregister
+        :type arrow: ConnectionArrow
+        """
+        self.remove_output_arrow(arrow)
+
     def add_input_arrow(self, arrow):
         """Add an input arrow and update process object.
 
         :param arrow: Arrow to add
         :type arrow: ConnectionArrow
         """
-        self.input_arrows.append(arrow)
+        self.input_arrows[arrow] = None
         self._update_process_connections()
 
     def remove_input_arrow(self, arrow):
@@ -210,8 +229,8 @@ class ProcessNode(QGraphicsEllipseItem):
         :type arrow: ConnectionArrow
         """
         if arrow in self.input_arrows:
-            self.input_arrows.remove(arrow)
-        self._update_process_connections()
+            del self.input_arrows[arrow]
+            self._update_process_connections()
 
     def add_output_arrow(self, arrow):
         """Add an output arrow and update process object.
@@ -219,7 +238,7 @@ class ProcessNode(QGraphicsEllipseItem):
         :param arrow: Arrow to add
         :type arrow: ConnectionArrow
         """
-        self.output_arrows.append(arrow)
+        self.output_arrows[arrow] = None
         self._update_process_connections()
 
     def remove_output_arrow(self, arrow):
@@ -229,40 +248,36 @@ class ProcessNode(QGraphicsEllipseItem):
         :type arrow: ConnectionArrow
         """
         if arrow in self.output_arrows:
-            self.output_arrows.remove(arrow)
-        self._update_process_connections()
+            del self.output_arrows[arrow]
+            self._update_process_connections()
 
     def _update_process_connections(self):
         """Update process object's input and result based on connection arrows"""
-        # Update input objects from incoming arrows
-        input_layer_ids = []
-        for arrow in self.input_arrows:
-            # Get the source node (should be a LayerNode)
-            if hasattr(arrow, "start_node") and hasattr(arrow.start_node, "layer_obj"):
-                layer_id = arrow.start_node.layer_obj.id
-                input_layer_ids.append(layer_id)
+        # Update input objects from incoming arrows (connections are only valid
+        # between different node kinds, so the other end is always a LayerNode)
+        input_layer_ids = [arrow.start_node.layer_obj.id for arrow in self.input_arrows]
 
         # Set process inputs
         if input_layer_ids:
             self.process_obj.set_input(input_layer_ids)
 
-        # Update result from outgoing arrows (should be only one layer as destination)
-        result_layer_id = None
-        for arrow in self.output_arrows:
-            # Get the destination node (should be a LayerNode)
-            if hasattr(arrow, "end_node") and hasattr(arrow.end_node, "layer_obj"):
-                result_layer_id = arrow.end_node.layer_obj.id
-                break  # Only take the first one as result
+        # Update result from outgoing arrows (should be only one layer as
+        # destination), only take the first one as result
+        result_layer_id = next(
+            (arrow.end_node.layer_obj.id for arrow in self.output_arrows), None
+        )
 
         # Set process result
         if result_layer_id:
             self.process_obj.set_result(result_layer_id)
 
-        process_name = getattr(self.process_obj, "name", "Unnamed Process")
-        self.logger.info(
-            f"Updated process {process_name} connections: "
-            f"\nInputs: {input_layer_ids}\nResult: {result_layer_id}"
-        )
+        # Runs on every arrow change, only build the message if it is logged
+        if logger.isEnabledFor(logging.INFO):
+            process_name = getattr(self.process_obj, "name", "Unnamed Process")
+            logger.info(
+                f"Updated process {process_name} connections: "
+                f"\nInputs: {input_layer_ids}\nResult: {result_layer_id}"
+            )
 
     # ============================================================================
     # PUBLIC INTERFACE
@@ -271,13 +286,16 @@ class ProcessNode(QGraphicsEllipseItem):
     def delete_node(self):
         """Remove node and all connections"""
         # Remove all connected arrows
-        for arrow in self.input_arrows[:] + self.output_arrows[:]:
+        for arrow in [*self.input_arrows, *self.output_arrows]:
             arrow.remove_arrow()
 
-        # Notify parent widget about removal
-        if hasattr(self.scene(), "views") and self.scene().views():
-            view = self.scene().views()[0]
-            if hasattr(view.parent(), "on_process_removed"):
-                view.parent().on_process_removed(self.process_obj)
-        # Remove from scene
+        view = self.view
+        if view is not None:
+            # Notify parent widget about removal
+            on_removed = getattr(view.parent(), "on_process_removed", None)
+            if on_removed is not None:
+                on_removed(self.process_obj)
+
+            # Remove from spatial index
+            view.discard_node(self)
         self.scene().removeItem(self)
@@ -4,7 +4,6 @@ Instruction Tab Widget - Contains usage instructions for the application
 """
 
 from qgis.PyQt.QtWidgets import (
-    QFormLayout,
     QFrame,
     QGroupBox,
     QLabel,
@@ -13,51 +12,20 @@ from qgis.PyQt.QtWidgets import (
     QWidget,
 )
 
-
-class InstructionTab(QWidget):
-    """Widget containing instructions for using the application"""
-
-    # ============================================================================
-    # INITIALIZATION
-    # ============================================================================
-
-    def __init__(self, parent=None):
-        """Initialize the Instruction tab widget.
-
-        :param parent: Parent widget
-        :type parent: QWidget
-        """
-        super().__init__(parent)
-        self.setup_ui()
-
-    # ============================================================================
-    # UI SETUP
-    # ============================================================================
-
-    def setup_ui(self):
-        """Setup the UI with comprehensive instructions"""
-        main_layout = QVBoxLayout(self)
-        main_layout.setContentsMargins(10, 10, 10, 10)
-        main_layout.setSpacing(12)
-
-        # Create scroll area for instructions
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setFrameStyle(QFrame.NoFrame)
-
-        self._add_section(
-            main_layout,
-            "Application Overview",
+# Instruction sections as (title, paragraphs) pairs
+_SECTIONS = (
+    (
+        "Application Overview",
+        (
             "This plugin helps you to document your project and its creation workflow. "
             "It exports to RO-Crate 1.1 to enable sharing of the map. The export "
             "includes layers, processing steps, their dependencies and some additional "
             "provenance information.",
-        )
-
-        # Graph tab instructions
-        self._add_section(
-            main_layout,
-            "Graph Tab - Creating Your Workflow",
+        ),
+    ),
+    (
+        "Graph Tab - Creating Your Workflow",
+        (
             "This tab allows you to create your projects workflow. All the nodes in "
             "this graph will be exported to the RO-Crate.",
             "Step 1: Add all your projects layers to the graph. This should include "
@@ -75,10 +43,11 @@ class InstructionTab(QWidget):
             "Step 3: Add connections between the graphs layers and processing steps. "
             "This creates a complete workflow diagram. Without this, the dependencies "
             "of the layers will be missing in the final export.",
-        )
-        self._add_section(
-            main_layout,
-            "Export Tab - Exporting Your Workflow",
+        ),
+    ),
+    (
+        "Export Tab - Exporting Your Workflow",
+        (
             "This tab allows you to export your projects workflow to RO-Crate.",
             "Step 1: Enter author information. This must include the authors name. "
             "If you have an ORCID, please enter it. You may also enter your "
@@ -88,11 +57,76 @@ class InstructionTab(QWidget):
             "Step 3: Select a path where to save the RO-Crate zip archive. It will "
             "also create a log file in the same directory. After you have done that, "
             "hit Export RO-Crate.",
-        )
+        ),
+    ),
+)
+
+
+class InstructionTab(QWidget):
+    """Widget containing instructions for using the application"""
+
+    # ============================================================================
+    # INITIALIZATION
+    # ============================================================================
+
+    def __init__(self, parent=None):
+        """Initialize the Instruction tab widget.
+
+        :param parent: Parent widget
+        :type parent: QWidget
+        """
+        super().__init__(parent)
+        self._sections_built = False  # Sections are built when first shown
+        self.setup_ui()
+
+    # ============================================================================
+    # UI SETUP
+    # ============================================================================
+
+    def setup_ui(self):
+        """Setup the UI frame, the instructions are added by _build_sections"""
+        main_layout = QVBoxLayout(self)
+        main_layout.setContentsMargins(10, 10, 10, 10)
+        main_layout.setSpacing(12)
+
+        # Create scroll area for instructions, the sections go into its
+        # content widget so word wrapping follows the scroll viewport
+        content_widget = QWidget()
+        self.content_layout = QVBoxLayout(content_widget)
+        self.content_layout.setContentsMargins(0, 0, 0, 0)
+        self.content_layout.setSpacing(12)
+
+        scroll_area = QScrollArea()
+        scroll_area.setWidgetResizable(True)
+        scroll_area.setFrameStyle(QFrame.NoFrame)
+        scroll_area.setWidget(content_widget)
 
         main_layout.addWidget(scroll_area)
         self.setLayout(main_layout)
 
+    def _build_sections(self):
+        """Add the instruction sections to the scroll area content"""
+        for title, content in _SECTIONS:
+            self._add_section(self.content_layout, title, *content)
+
+        # Keep the sections at the top when they don't fill the viewport
+        self.content_layout.addStretch()
+
+    # ============================================================================
+    # EVENT HANDLERS
+    # ============================================================================
+
+    def showEvent(self, event):  # noqa: N802
+        """Build the instruction sections the first time the tab is shown.
+
+        :param event: Show event
+        :type event: QShowEvent
+        """
+        if not self._sections_built:
+            self._build_sections()
+            self._sections_built = True
+        super().showEvent(event)
+
     # ============================================================================
     # UTILITY / HELPER METHODS
     # ============================================================================
@@ -113,15 +147,13 @@ class InstructionTab(QWidget):
         group = QGroupBox(self)
         group.setTitle(title)
 
-        glayout = QFormLayout(group)
-        glayout.setFieldGrowthPolicy(QFormLayout.AllNonFixedFieldsGrow)
-        glayout.setHorizontalSpacing(8)
-        glayout.setVerticalSpacing(8)
+        glayout = QVBoxLayout(group)
+        glayout.setSpacing(8)
         glayout.setContentsMargins(10, 10, 10, 10)
 
         for c in content:
             label = QLabel(c)
             label.setWordWrap(True)
-            glayout.addRow(label)
+            glayout.addWidget(label)
 
         layout.addWidget(group)
@@ -5,23 +5,31 @@ from ..utility import get_logger
 class GPKGLayer(Layer):
     """Specialized Layer subclass for handling GeoPackage layers."""
 
+    __slots__ = ("mimetype", "gpkg_layer", "_description_prefix")
+    logger = get_logger("GPKGLayer")
+
     # ============================================================================
     # INITIALIZATION
     # ============================================================================
 
-    def __init__(self, layer):
+    def __init__(self, layer, visibility_map=None):
         """Initialize a GPKGLayer from a QGIS layer.
 
         :param layer: The QGIS layer object to wrap
         :type layer: QgsMapLayer
+        :param visibility_map: Layer id to visibility lookup shared by a batch of
+            layers, queried from the layer tree if not given
+        :type visibility_map: dict or None
         """
-        super().__init__(layer)
-        self.logger = get_logger("GPKGLayer")
+        super().__init__(layer, visibility_map)
         self.mimetype = "application/geopackage+sqlite3"
         splits = layer.source().split("|layername=")
         self.source = splits[0]
         self.gpkg_layer = splits[1]
+        self._description_prefix = f"[GeoPackage Layer: {self.gpkg_layer}] "
 
     def set_description(self, desc):
-        desc = f"[GeoPackage Layer: {self.gpkg_layer}] {desc}"
+        # Prefix once, editing an already prefixed description keeps it as is
+        if not desc.startswith(self._description_prefix):
+            desc = self._description_prefix + desc
         return super().set_description(desc)
@@ -1,41 +1,86 @@
-import re
+import os
 import tempfile
+from contextlib import suppress
 from datetime import datetime
-from os.path import getmtime, getsize, isfile
 from pathlib import Path
+from stat import S_ISREG
 
 from qgis.core import QgsMapLayer, QgsMapLayerType, QgsProject, QgsWkbTypes
 
-from ..utility import get_logger, get_mimetype
+from ..utility import get_logger, get_mimetype, keep_ascii_alnum
+
+# Display names of the QGIS layer types
+_LAYER_TYPE_NAMES = {
+    QgsMapLayer.RasterLayer: "Raster",
+    QgsMapLayer.VectorLayer: "Vector",
+}
+
+
+def _remove_root_parts(crate, ids_to_remove):
+    """Drop parts from the root dataset's hasPart, keeping the others in order.
+
+    :param crate: The ROCrate object to update
+    :type crate: ROCrate
+    :param ids_to_remove: IDs of the parts to remove
+    :type ids_to_remove: set
+    """
+    # Replace with a filtered copy
+    crate.root_dataset["hasPart"] = [
+        part
+        for part in crate.root_dataset.get("hasPart", [])
+        if part["@id"] not in ids_to_remove
+    ]
 
 
 class Layer:
+    # Created once per project layer, so store attributes in fixed slots
+    # instead of a per-instance dict
+    __slots__ = (
+        "external",
+        "visible",
+        "layer",
+        "clean_name",
+        "name",
+        "description",
+        "type",
+        "provider",
+        "source",
+        "sourceProperty",
+        "id",
+    )
+
+    # Shared by all instances, subclasses set their own so the inherited
+    # methods log under the subclass name
+    logger = get_logger("Layer")
+
     # ============================================================================
     # INITIALIZATION
     # ============================================================================
 
-    def __init__(self, layer):
+    def __init__(self, layer, visibility_map=None):
         """Initialize a Layer object from a QGIS layer.
 
         :param layer: The QGIS layer object to wrap
         :type layer: QgsMapLayer
+        :param visibility_map: Layer id to visibility lookup shared by a batch of
+            layers, queried from the layer tree if not given
+        :type visibility_map: dict or None
         """
-        self.logger = get_logger("Layer")
         self.external = False
-        self.visible = bool(
-            QgsProject.instance().layerTreeRoot().findLayer(layer.id()).isVisible()
-        )
+        if visibility_map is not None:
+            self.visible = bool(visibility_map.get(layer.id(), False))
+        else:
+            self.visible = bool(
+                QgsProject.instance().layerTreeRoot().findLayer(layer.id()).isVisible()
+            )
         self.layer = layer
-        self.clean_name = re.sub(r"[^A-Za-z0-9]", "", layer.name())
-        self.name = layer.name()
+        name = layer.name()
+        self.clean_name = keep_ascii_alnum(name)
+        self.name = name
         self.description = ""
-        self.type = (
-            "Raster"
-            if layer.type() == QgsMapLayer.RasterLayer
-            else "Vector" if layer.type() == QgsMapLayer.VectorLayer else "Unknown"
-        )
+        self.type = _LAYER_TYPE_NAMES.get(layer.type(), "Unknown")
         self.provider = layer.dataProvider().name().lower()
-        self.source = self.layer.source()
+        self.source = layer.source()
         self.sourceProperty = {}
         self.id = f"./{self.clean_name}"
 
@@ -84,48 +129,59 @@ class Layer:
     # UTILITY / HELPER METHODS
     # ============================================================================
 
-    def _get_content_size(self, path):
-        """Get the file size of a given path.
+    def _get_file_properties(self, path):
+        """Get the size and last modified timestamp of a file with one stat call.
 
         :param path: File path to check
         :type path: str
-        :return: File size as string with 'B' suffix, or 'Unknown' if file doesn't exist
-        :rtype: str
+        :return: Dict with the 'contentSize' in KB and the 'dateModified' ISO
+            timestamp, both 'Unknown' if the file doesn't exist
+        :rtype: dict
         """
-        if isfile(path):
-            return f"{getsize(path) / 1024}"
-        else:
-            return "Unknown"
+        try:
+            file_stat = os.stat(path)
+        except OSError:
+            file_stat = None
+        if file_stat is None or not S_ISREG(file_stat.st_mode):
+            return {"contentSize": "Unknown", "dateModified": "Unknown"}
+
+        return {
+            "contentSize": f"{file_stat.st_size / 1024}",
+            "dateModified": datetime.fromtimestamp(file_stat.st_mtime).isoformat(),
+        }
 
-    def _get_last_modified(self, path):
-        """Get the last modified timestamp of a file.
+    def _reserve_temp_path(self, suffix, temp_paths):
+        """Reserve a temporary file path for an export file written by QGIS.
 
-        :param path: File path to check
-        :type path: str
-        :return: Formatted timestamp string, or 'Unknown' if file doesn't exist
+        :param suffix: File name suffix of the temporary file
+        :type suffix: str
+        :param temp_paths: Temporary paths of the running export, the path is
+            added
+        :type temp_paths: list
+        :return: Path of the created, empty temporary file
         :rtype: str
         """
-        if isfile(path):
-            # getting the last modified time using getmtime
-            modified_time = getmtime(path)
-            # formating the timestamp for readability
-            formatted_time = datetime.fromtimestamp(modified_time).isoformat()
-            return formatted_time
-        else:
-            return "Unknown"
+        fd, path = tempfile.mkstemp(suffix=suffix)
+        os.close(fd)
+        temp_paths.append(path)
+        return path
 
     def _add_geometry_properties(self, props):
-        if self.layer.crs():
-            props["layerCrs"] = self.layer.crs().authid()
-        if self.layer.type() is not None:
-            props["layerType"] = QgsMapLayerType(self.layer.type()).name
-        if self.layer.type() == QgsMapLayerType.VectorLayer:
-            if self.layer.featureCount():
-                props["layerFeatureCount"] = self.layer.featureCount()
-            if self.layer.wkbType():
-                props["layerGeometryType"] = QgsWkbTypes.displayString(
-                    self.layer.wkbType()
-                )
+        # Each call crosses into the C++ layer, so read every value once
+        layer = self.layer
+        crs = layer.crs()
+        if crs:
+            props["layerCrs"] = crs.authid()
+        layer_type = layer.type()
+        if layer_type is not None:
+            props["layerType"] = QgsMapLayerType(layer_type).name
+        if layer_type == QgsMapLayerType.VectorLayer:
+            feature_count = layer.featureCount()
+            if feature_count:
+                props["layerFeatureCount"] = feature_count
+            wkb_type = layer.wkbType()
+            if wkb_type:
+                props["layerGeometryType"] = QgsWkbTypes.displayString(wkb_type)
         return props
 
     def _add_source_properties(self, props):
@@ -165,7 +221,7 @@ class Layer:
 
         return crate, dataset
 
-    def _add_symbology_to_rocrate(self, crate):
+    def _add_symbology_to_rocrate(self, crate, temp_paths):
         """Add the layer symbology file to the ROCrate.
 
         Exports the layer's style to a temporary QML file and adds it to the ROCrate
@@ -173,34 +229,35 @@ class Layer:
 
         :param crate: The ROCrate object to add the symbology to
         :type crate: ROCrate
+        :param temp_paths: Temporary files of the export, removed once the crate
+            has been written
+        :type temp_paths: list
         :return: Tuple of the updated crate and the created symbology file
         :rtype: tuple
         """
         # add symbology of map layer
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".qml", delete=False
-        ) as temp_qml:
-            temp_qml_path = temp_qml.name
-            self.layer.saveNamedStyle(temp_qml_path)
-            symbology = crate.add_file(
-                temp_qml_path,
-                f"{self.id}/symbology.qml",
-                properties={
-                    "name": f"{self.name} Symbology",
-                    "encodingFormat": get_mimetype(temp_qml_path),
-                    "contentSize": self._get_content_size(temp_qml_path),
-                    "dateModified": self._get_last_modified(temp_qml_path),
-                },
-            )
-            self.logger.info(
-                f"Added file {temp_qml_path} -> "
-                f"map/{self.clean_name}/symbology.qml to crate."
-            )
-            temp_qml.close()
+        # QGIS writes the style itself, so only reserve a temporary path. The
+        # crate reads the file when it is written
+        temp_qml_path = self._reserve_temp_path(".qml", temp_paths)
+
+        self.layer.saveNamedStyle(temp_qml_path)
+        symbology = crate.add_file(
+            temp_qml_path,
+            f"{self.id}/symbology.qml",
+            properties={
+                "name": f"{self.name} Symbology",
+                "encodingFormat": get_mimetype(temp_qml_path),
+                **self._get_file_properties(temp_qml_path),
+            },
+        )
+        self.logger.info(
+            f"Added file {temp_qml_path} -> "
+            f"map/{self.clean_name}/symbology.qml to crate."
+        )
 
         return crate, symbology
 
-    def _add_geometry_to_rocrate(self, crate):
+    def _add_geometry_to_rocrate(self, crate, temp_paths):
         """Add the layer geometry file to the ROCrate.
 
         Determines the appropriate MIME type based on file extension and adds
@@ -209,56 +266,56 @@ class Layer:
 
         :param crate: The ROCrate object to add the geometry to
         :type crate: ROCrate
+        :param temp_paths: Temporary files of the export, removed once the crate
+            has been written
+        :type temp_paths: list
         :return: Tuple of the updated crate and the created geometry file
         :rtype: tuple
         """
         properties = {
             "name": f"{self.name} Geometry",
-            "contentSize": self._get_content_size(self.source),
-            "dateModified": self._get_last_modified(self.source),
+            **self._get_file_properties(self.source),
         }
         properties = self._add_encoding_property(properties)
         properties = self._add_geometry_properties(properties)
         properties = self._add_source_properties(properties)
+        suffix = Path(self.source).suffix
         geometry = crate.add_file(
             self.source,
-            f"{self.id}/geometry{Path(self.source).suffix}",
+            f"{self.id}/geometry{suffix}",
             properties=properties,
         )
         self.logger.info(
             f"Added file {self.source} -> "
-            f"map/{self.clean_name}/geometry{Path(self.source).suffix} to crate."
+            f"map/{self.clean_name}/geometry{suffix} to crate."
         )
 
         return crate, geometry
 
-    # ============================================================================
-    # PUBLIC INTERFACE
-    # ============================================================================
-
-    def add_to_rocrate(self, crate):
-        """Add this layer and all its components to a ROCrate.
+    def _add_parts_to_rocrate(self, crate, temp_paths):
+        """Add the layer dataset and its files to the ROCrate.
 
-        This method orchestrates the addition of the layer dataset, symbology
-        (if visible), and geometry files to the ROCrate. It also manages the
-        hasPart relationships and removes individual components from the root
-        dataset's hasPart to avoid duplication.
+        Links the files to the layer dataset but leaves them in the root
+        dataset's hasPart, so several layers can be cleaned up in one pass.
 
         :param crate: The ROCrate object to add this layer to
         :type crate: ROCrate
-        :return: The updated ROCrate object
-        :rtype: ROCrate
+        :param temp_paths: Temporary files of the export, removed once the crate
+            has been written
+        :type temp_paths: list
+        :return: Tuple of the updated crate and the set of file IDs to remove
+            from the root dataset's hasPart
+        :rtype: tuple
         """
-
         dataset = None
         crate, dataset = self._add_dataset_to_rocrate(crate)
 
         symbology = None
         if self.visible:
-            crate, symbology = self._add_symbology_to_rocrate(crate)
+            crate, symbology = self._add_symbology_to_rocrate(crate, temp_paths)
 
         geometry = None
-        crate, geometry = self._add_geometry_to_rocrate(crate)
+        crate, geometry = self._add_geometry_to_rocrate(crate, temp_paths)
 
         # Set hasPart relationship
         if self.visible and symbology:
@@ -266,16 +323,72 @@ class Layer:
         else:
             dataset["hasPart"] = [geometry]
 
-        # IDs of parts you want to remove from root.hasPart
-        ids_to_remove = [geometry["@id"]]
+        # IDs of parts you want to remove from root.hasPart, as a set for
+        # constant time lookups while filtering
+        ids_to_remove = {geometry["@id"]}
         if self.visible:
-            ids_to_remove.append(symbology["@id"])
+            ids_to_remove.add(symbology["@id"])
+
+        return crate, ids_to_remove
+
+    # ============================================================================
+    # PUBLIC INTERFACE
+    # ============================================================================
+
+    def add_to_rocrate(self, crate, temp_paths):
+        """Add this layer and all its components to a ROCrate.
+
+        This method orchestrates the addition of the layer dataset, symbology
+        (if visible), and geometry files to the ROCrate. It also manages the
+        hasPart relationships and removes individual components from the root
+        dataset's hasPart to avoid duplication.
+
+        :param crate: The ROCrate object to add this layer to
+        :type crate: ROCrate
+        :param temp_paths: Temporary files of the export, removed with
+            remove_temp_files once the crate has been written
+        :type temp_paths: list
+        :return: The updated ROCrate object
+        :rtype: ROCrate
+        """
+        crate, ids_to_remove = self._add_parts_to_rocrate(crate, temp_paths)
+        _remove_root_parts(crate, ids_to_remove)
+
+        return crate
+
+    @staticmethod
+    def add_layers_to_rocrate(crate, layers, temp_paths):
+        """Add several layers and all their components to a ROCrate.
 
-        # Replace with a filtered copy
-        crate.root_dataset["hasPart"] = [
-            part
-            for part in crate.root_dataset.get("hasPart", [])
-            if part["@id"] not in ids_to_remove
-        ]
+        Works like calling add_to_rocrate for each layer, but filters the root
+        dataset's hasPart only once for all layers instead of once per layer.
+
+        :param crate: The ROCrate object to add the layers to
+        :type crate: ROCrate
+        :param layers: Layers to add
+        :type layers: iterable of Layer
+        :param temp_paths: Temporary files of the export, removed with
+            remove_temp_files once the crate has been written
+        :type temp_paths: list
+        :return: The updated ROCrate object
+        :rtype: ROCrate
+        """
+        ids_to_remove = set()
+        for layer in layers:
+            crate, layer_ids = layer._add_parts_to_rocrate(crate, temp_paths)
+            ids_to_remove |= layer_ids
+        _remove_root_parts(crate, ids_to_remove)
 
         return crate
+
+    @staticmethod
+    def remove_temp_files(temp_paths):
+        """Delete the temporary files of an export, ignoring ones already gone.
+
+        :param temp_paths: Temporary files collected while adding layers
+        :type temp_paths: list
+        """
+        for path in temp_paths:
+            with suppress(OSError):
+                os.remove(path)
+        temp_paths.clear()
@@ -1,3 +1,7 @@
+from types import MappingProxyType
+
+from qgis.core import QgsProject
+
 from .gpkg_layer import GPKGLayer
 from .layer import Layer
 from .memory_layer import MemoryLayer
@@ -14,24 +18,34 @@ class LayerFactory:
     while maintaining a uniform interface.
     """
 
-    # ============================================================================
-    # INITIALIZATION
-    # ============================================================================
-
-    def __init__(self):
-        self._layer_types = {
+    # Layer class for each provider type, shared read-only by all factories
+    _LAYER_TYPES = MappingProxyType(
+        {
             "gdal": Layer,
             "ogr": Layer,
             "memory": MemoryLayer,
             "wms": WMSLayer,
             "wfs": WFSLayer,
         }
+    )
 
     # ============================================================================
     # PUBLIC INTERFACE
     # ============================================================================
 
-    def create_layer(self, layer):
+    def get_visibility_map(self):
+        """Get the visibility of all project layers from one layer tree walk.
+
+        Pass the result to create_layer when wrapping several layers, so each
+        layer doesn't search the layer tree again.
+
+        :return: Visibility of each layer tree layer keyed by layer id
+        :rtype: dict
+        """
+        root = QgsProject.instance().layerTreeRoot()
+        return {node.layerId(): node.isVisible() for node in root.findLayers()}
+
+    def create_layer(self, layer, visibility_map=None):
         """Create an appropriate Layer object based on the provider type.
 
         Examines the QGIS layer's provider type and returns an instance of the
@@ -40,14 +54,18 @@ class LayerFactory:
 
         :param layer: The QGIS layer object to wrap
         :type layer: QgsMapLayer
+        :param visibility_map: Layer visibility from get_visibility_map, the
+            layer tree is searched for the layer if not given
+        :type visibility_map: dict or None
         :return: An instance of the appropriate Layer subclass
         :rtype: Layer
         """
+        # File based formats are recognized by their source path
+        source = layer.source()
+        if ".gpkg|layername=" in source:
+            return GPKGLayer(layer, visibility_map)
+        if ".shp" in source:
+            return SHPLayer(layer, visibility_map)
+
         layer_type = layer.providerType().lower()
-        if ".gpkg|layername=" in layer.source():
-            return GPKGLayer(layer)
-        if ".shp" in layer.source():
-            return SHPLayer(layer)
-        if layer_type in self._layer_types:
-            return self._layer_types[layer_type](layer)
-        return Layer(layer)
+        return self._LAYER_TYPES.get(layer_type, Layer)(layer, visibility_map)
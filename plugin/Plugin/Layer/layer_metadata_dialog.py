@@ -1,5 +1,3 @@
-import re
-
 from qgis.PyQt.QtCore import QDate, Qt, QTimer, pyqtSignal
 from qgis.PyQt.QtGui import QFont
 from qgis.PyQt.QtWidgets import (
@@ -20,6 +18,75 @@ from qgis.PyQt.QtWidgets import (
 
 from ..utility import display_error_message
 
+# Accepted URL schemes and characters of a domain label in a source URL
+_URL_SCHEMES = ("http", "https")
+_DOMAIN_LABEL_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789-")
+
+# Styles of the whole dialog, parsed once instead of per widget. Field borders
+# follow the validState property set in apply_validation_styles
+_DIALOG_STYLESHEET = """
+    QLineEdit:read-only { background-color: #f8f9fa; color: #6c757d; }
+    *[validState="invalid"] { border: 2px solid #e74c3c; border-radius: 3px; }
+    *[validState="valid"] { border: 2px solid #27ae60; border-radius: 3px; }
+    QPushButton#save_button {
+        background-color: #27ae60;
+        color: white;
+        border: none;
+        border-radius: 4px;
+        font-weight: bold;
+    }
+    QPushButton#save_button:hover {
+        background-color: #229954;
+    }
+    QPushButton#save_button:disabled {
+        background-color: #bdc3c7;
+        color: #7f8c8d;
+    }
+"""
+
+# Validator method of each validated field
+_FIELD_VALIDATORS = {
+    "description": "validate_description_field",
+    "source_title": "validate_source_title_field",
+    "source_url": "validate_source_url_field",
+}
+
+
+def _is_valid_host(host):
+    """Check if a lowercase URL host is localhost, an IPv4 address or a domain.
+
+    :param host: Host part of the URL, without port
+    :type host: str
+    :return: True if the host is valid, False otherwise
+    :rtype: bool
+    """
+    if host == "localhost":
+        return True
+
+    labels = host.split(".")
+    if len(labels) == 4 and all(
+        label.isascii() and label.isdigit() and len(label) <= 3 for label in labels
+    ):
+        return True  # IPv4 address
+
+    if labels[-1] == "":
+        labels.pop()  # Fully qualified domain with a trailing dot
+    if len(labels) < 2:
+        return False
+
+    # Top level domain of 2 to 6 letters, other labels of up to 63 letters,
+    # digits and inner hyphens
+    tld = labels.pop()
+    if not (2 <= len(tld) <= 6 and tld.isascii() and tld.isalpha()):
+        return False
+    return all(
+        0 < len(label) <= 63
+        and label[0] != "-"
+        and label[-1] != "-"
+        and _DOMAIN_LABEL_CHARS.issuperset(label)
+        for label in labels
+    )
+
 
 class LayerMetadataDialog(QDialog):
     """Dialog for documenting layer metadata and external source information.
@@ -46,6 +113,12 @@ class LayerMetadataDialog(QDialog):
         """
         super().__init__(parent)
         self.layer = layer
+        # Fields edited since the last validation pass and the last result
+        # of every field, so a pass only re-runs the validators of edits
+        self._dirty_fields = {"description"}
+        self._field_validity = {}
+        # The external source fields are only built once they are needed
+        self._source_fields_built = False
         self.setup_ui()
         self.setup_logic()
 
@@ -54,6 +127,7 @@ class LayerMetadataDialog(QDialog):
         self.setWindowTitle("Layer Metadata Documentation")
         self.setMinimumSize(650, 700)
         self.resize(650, 700)
+        self.setStyleSheet(_DIALOG_STYLESHEET)
 
         # Main layout
         main_layout = QVBoxLayout()
@@ -72,12 +146,14 @@ class LayerMetadataDialog(QDialog):
 
     def setup_logic(self):
         """Setup logic, connections, and initialize field validation."""
-        # Initialize fields with layer data
+        # Initialize fields with layer data before connecting the change
+        # signals, so filling them in schedules no validation passes
         self.populate_fields()
 
         # Setup validation timer
-        self.validation_timer = QTimer()
+        self.validation_timer = QTimer(self)
         self.validation_timer.setSingleShot(True)
+        self.validation_timer.setInterval(300)  # 300ms delay
         self.validation_timer.timeout.connect(self.perform_real_time_validation)
 
         # Connect signals
@@ -85,12 +161,11 @@ class LayerMetadataDialog(QDialog):
         self.save_button.clicked.connect(self.validate_and_accept)
         self.external_checkbox.toggled.connect(self.on_external_changed)
 
-        # Field change connections for real-time validation
-        self.description_textedit.textChanged.connect(self.on_text_changed)
-        self.source_title_lineedit.textChanged.connect(self.on_text_changed)
-        self.source_url_lineedit.textChanged.connect(self.on_text_changed)
-        self.source_date_dateedit.dateChanged.connect(self.perform_real_time_validation)
-        self.source_comment_textedit.textChanged.connect(self.on_text_changed)
+        # Field change connections for real-time validation, the external
+        # source fields are connected when they are built
+        self.description_textedit.textChanged.connect(
+            lambda: self.on_text_changed("description")
+        )
 
         # Initial validation
         self.perform_real_time_validation()
@@ -131,9 +206,6 @@ class LayerMetadataDialog(QDialog):
         # Layer Name
         self.layer_name_lineedit = QLineEdit()
         self.layer_name_lineedit.setReadOnly(True)
-        self.layer_name_lineedit.setStyleSheet(
-            "QLineEdit:read-only { background-color: #f8f9fa; color: #6c757d; }"
-        )
         basic_info_layout.addRow("Layer Name:", self.layer_name_lineedit)
 
         # Description
@@ -164,9 +236,6 @@ class LayerMetadataDialog(QDialog):
         # Layer Visible (read-only)
         self.layer_visible_lineedit = QLineEdit()
         self.layer_visible_lineedit.setReadOnly(True)
-        self.layer_visible_lineedit.setStyleSheet(
-            "QLineEdit:read-only { background-color: #f8f9fa; color: #6c757d; }"
-        )
         self.layer_visible_lineedit.setToolTip(
             "Shows whether this layer is currently visible in QGIS"
         )
@@ -198,41 +267,42 @@ class LayerMetadataDialog(QDialog):
         # Layer Type (read-only)
         self.tech_layer_type_lineedit = QLineEdit()
         self.tech_layer_type_lineedit.setReadOnly(True)
-        self.tech_layer_type_lineedit.setStyleSheet(
-            "QLineEdit:read-only { background-color: #f8f9fa; color: #6c757d; }"
-        )
         tech_info_layout.addRow("Layer Type:", self.tech_layer_type_lineedit)
 
         # Source (read-only)
         self.source_lineedit = QLineEdit()
         self.source_lineedit.setReadOnly(True)
-        self.source_lineedit.setStyleSheet(
-            "QLineEdit:read-only { background-color: #f8f9fa; color: #6c757d; }"
-        )
         tech_info_layout.addRow("Data Source:", self.source_lineedit)
 
         # Clean Name (read-only)
         self.clean_name_lineedit = QLineEdit()
         self.clean_name_lineedit.setReadOnly(True)
-        self.clean_name_lineedit.setStyleSheet(
-            "QLineEdit:read-only { background-color: #f8f9fa; color: #6c757d; }"
-        )
         tech_info_layout.addRow("Clean Name:", self.clean_name_lineedit)
 
         tech_info_group.setLayout(tech_info_layout)
         main_layout.addWidget(tech_info_group)
 
     def _create_external_source_section(self, main_layout):
-        """Create the external source information section.
+        """Create the empty external source information section.
+
+        The fields are added by _build_external_source_fields the first time
+        the layer is marked as external.
 
         :param main_layout: Main layout to add the section to
         :type main_layout: QVBoxLayout
         """
         self.source_info_group = QGroupBox("External Source Information")
         self.source_info_group.setVisible(False)
-        source_info_layout = QFormLayout()
-        source_info_layout.setSpacing(12)
-        source_info_layout.setContentsMargins(15, 15, 15, 15)
+        self.source_info_layout = QFormLayout()
+        self.source_info_layout.setSpacing(12)
+        self.source_info_layout.setContentsMargins(15, 15, 15, 15)
+
+        self.source_info_group.setLayout(self.source_info_layout)
+        main_layout.addWidget(self.source_info_group)
+
+    def _build_external_source_fields(self):
+        """Create, populate and connect the external source fields."""
+        source_info_layout = self.source_info_layout
 
         # Source Title
         self.source_title_lineedit = QLineEdit()
@@ -273,8 +343,19 @@ class LayerMetadataDialog(QDialog):
         )
         source_info_layout.addRow("Source Comment:", self.source_comment_textedit)
 
-        self.source_info_group.setLayout(source_info_layout)
-        main_layout.addWidget(self.source_info_group)
+        self._populate_external_source_fields()
+
+        # Field change connections for real-time validation, the source date
+        # and comment are not validated
+        self.source_title_lineedit.textChanged.connect(
+            lambda: self.on_text_changed("source_title")
+        )
+        self.source_url_lineedit.textChanged.connect(
+            lambda: self.on_text_changed("source_url")
+        )
+
+        self._dirty_fields.update(("source_title", "source_url"))
+        self._source_fields_built = True
 
     def _create_button_section(self, main_layout):
         """Create the button section.
@@ -301,24 +382,7 @@ class LayerMetadataDialog(QDialog):
         self.save_button = QPushButton("Save Metadata")
         self.save_button.setMinimumSize(120, 30)
         self.save_button.setDefault(True)
-        self.save_button.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #27ae60;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #229954;
-            }
-            QPushButton:disabled {
-                background-color: #bdc3c7;
-                color: #7f8c8d;
-            }
-        """
-        )
+        self.save_button.setObjectName("save_button")  # Styled by the dialog
         button_layout.addWidget(self.save_button)
 
         main_layout.addLayout(button_layout)
@@ -329,41 +393,52 @@ class LayerMetadataDialog(QDialog):
 
     def populate_fields(self):
         """Populate dialog fields with existing layer data."""
+        # Read each layer attribute once, missing ones fall back to defaults
+        layer = self.layer
+
         # Layer name
-        layer_name = getattr(self.layer, "name", "")
+        layer_name = getattr(layer, "name", "")
         self.layer_name_lineedit.setText(layer_name)
 
-        visibility_text = "Yes" if getattr(self.layer, "visible", False) else "No"
+        visibility_text = "Yes" if getattr(layer, "visible", False) else "No"
         self.layer_visible_lineedit.setText(visibility_text)
 
         # Technical information
-        self.tech_layer_type_lineedit.setText(getattr(self.layer, "type", ""))
-        self.source_lineedit.setText(str(getattr(self.layer, "source", "")))
-        self.clean_name_lineedit.setText(getattr(self.layer, "clean_name", ""))
+        self.tech_layer_type_lineedit.setText(getattr(layer, "type", ""))
+        self.source_lineedit.setText(str(getattr(layer, "source", "")))
+        self.clean_name_lineedit.setText(getattr(layer, "clean_name", ""))
 
-        self.external_checkbox.setChecked(getattr(self.layer, "external", False))
+        self.external_checkbox.setChecked(getattr(layer, "external", False))
 
         # Description
-        if hasattr(self.layer, "description") and self.layer.description:
-            self.description_textedit.setPlainText(self.layer.description)
-
-        # External source fields
-        if hasattr(self.layer, "source_title") and self.layer.source_title:
-            self.source_title_lineedit.setText(self.layer.source_title)
-        if hasattr(self.layer, "source_url") and self.layer.source_url:
-            self.source_url_lineedit.setText(self.layer.source_url)
-        if hasattr(self.layer, "source_date") and self.layer.source_date:
-            date = QDate.fromString(self.layer.source_date, "yyyy-MM-dd")
-            if date.isValid():
-                self.source_date_dateedit.setDate(date)
-        if hasattr(self.layer, "source_comment") and self.layer.source_comment:
-            self.source_comment_textedit.setPlainText(self.layer.source_comment)
+        description = getattr(layer, "description", None)
+        if description:
+            self.description_textedit.setPlainText(description)
 
         self.description_textedit.setFocus()
 
         # Update UI based on external state
         self.update_ui_based_on_external_state()
 
+    def _populate_external_source_fields(self):
+        """Populate the external source fields with existing layer data."""
+        layer = self.layer
+
+        source_title = getattr(layer, "source_title", None)
+        if source_title:
+            self.source_title_lineedit.setText(source_title)
+        source_url = getattr(layer, "source_url", None)
+        if source_url:
+            self.source_url_lineedit.setText(source_url)
+        source_date = getattr(layer, "source_date", None)
+        if source_date:
+            date = QDate.fromString(source_date, Qt.ISODate)
+            if date.isValid():
+                self.source_date_dateedit.setDate(date)
+        source_comment = getattr(layer, "source_comment", None)
+        if source_comment:
+            self.source_comment_textedit.setPlainText(source_comment)
+
     # ============================================================================
     # EVENT HANDLERS
     # ============================================================================
@@ -373,10 +448,14 @@ class LayerMetadataDialog(QDialog):
         self.update_ui_based_on_external_state()
         self.perform_real_time_validation()
 
-    def on_text_changed(self):
-        """Handle text field changes with delayed validation."""
-        self.validation_timer.stop()
-        self.validation_timer.start(300)  # 300ms delay
+    def on_text_changed(self, field):
+        """Handle text field changes with delayed validation.
+
+        :param field: Name of the changed field
+        :type field: str
+        """
+        self._dirty_fields.add(field)
+        self.validation_timer.start()  # Restarts the delay if already running
 
     # ============================================================================
     # UI STATE MANAGEMENT
@@ -385,6 +464,8 @@ class LayerMetadataDialog(QDialog):
     def update_ui_based_on_external_state(self):
         """Update UI elements visibility based on external checkbox state."""
         is_external = self.external_checkbox.isChecked()
+        if is_external and not self._source_fields_built:
+            self._build_external_source_fields()
         self.source_info_group.setVisible(is_external)
 
     # ============================================================================
@@ -392,23 +473,20 @@ class LayerMetadataDialog(QDialog):
     # ============================================================================
 
     def perform_real_time_validation(self):
-        """Perform real-time validation of all form fields."""
-        description_valid = self.validate_description_field()
-        name_valid = True
+        """Perform real-time validation of the changed form fields."""
+        # Re-run only the validators of edited fields, the others are unchanged
+        validity = self._field_validity
+        for field in self._dirty_fields:
+            validity[field] = getattr(self, _FIELD_VALIDATORS[field])()
+        self._dirty_fields.clear()
 
-        # If external is checked, validate external source fields
-        is_external = self.external_checkbox.isChecked()
-        if is_external:
-            source_title_valid = self.validate_source_title_field()
-            source_url_valid = self.validate_source_url_field()
+        all_valid = validity["description"]
+
+        # If external is checked, the external source fields must be valid too
+        if self.external_checkbox.isChecked():
             all_valid = (
-                description_valid
-                and name_valid
-                and source_title_valid
-                and source_url_valid
+                all_valid and validity["source_title"] and validity["source_url"]
             )
-        else:
-            all_valid = description_valid and name_valid
 
         self.save_button.setEnabled(all_valid)
 
@@ -472,12 +550,14 @@ class LayerMetadataDialog(QDialog):
         :param state: Validation state ('valid', 'invalid', or 'neutral')
         :type state: str
         """
-        if state == "invalid":
-            widget.setStyleSheet("border: 2px solid #e74c3c; border-radius: 3px;")
-        elif state == "valid":
-            widget.setStyleSheet("border: 2px solid #27ae60; border-radius: 3px;")
-        else:  # neutral
-            widget.setStyleSheet("")
+        if widget.property("validState") == state:
+            return  # Already styled for this state, skip the re-polish
+
+        # Re-polish so the dialog stylesheet rules for the new state apply
+        widget.setProperty("validState", state)
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
 
     def is_valid_url(self, url):
         """Check if URL has a valid format.
@@ -487,17 +567,31 @@ class LayerMetadataDialog(QDialog):
         :return: True if URL format is valid, False otherwise
         :rtype: bool
         """
+        # Checked with plain string operations instead of a regex, so pasted
+        # input can't cause slow backtracking
+        if any(char.isspace() for char in url):
+            return False
+
+        scheme, separator, rest = url.partition("://")
+        if not separator or scheme.lower() not in _URL_SCHEMES:
+            return False
 
-        url_pattern = re.compile(
-            r"^https?://"
-            r"(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|"
-            r"localhost|"
-            r"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})"
-            r"(?::\d+)?"
-            r"(?:/?|[/?]\S+)$",
-            re.IGNORECASE,
+        # Host and port end at the first path, query or fragment delimiter
+        netloc_end = next(
+            (i for i, char in enumerate(rest) if char in "/?#"), len(rest)
         )
-        return url_pattern.match(url) is not None
+        netloc = rest[:netloc_end]
+        path = rest[netloc_end:]
+
+        # Nothing, a single slash, or a path or query that isn't empty
+        if path not in ("", "/") and (path[0] not in "/?" or len(path) < 2):
+            return False
+
+        host, colon, port = netloc.partition(":")
+        if colon and not (port.isascii() and port.isdigit()):
+            return False
+
+        return _is_valid_host(host.lower())
 
     def validate_and_accept(self):
         """Perform final validation before accepting the dialog."""
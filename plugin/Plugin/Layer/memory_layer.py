@@ -1,31 +1,67 @@
-import tempfile
+from datetime import datetime
+from io import BytesIO
 
-from qgis.core import QgsRasterFileWriter, QgsRasterPipe, QgsVectorFileWriter
+from qgis.core import QgsJsonExporter, QgsRasterFileWriter, QgsRasterPipe
 
 from ..Layer.layer import Layer
 from ..utility import get_logger, get_mimetype
 
+# Decimal places of exported GeoJSON coordinates, about full double precision
+_GEOJSON_PRECISION = 15
+
+# GDAL GeoTIFF creation options for exported rasters, tiled and deflated on all
+# cores to cut the bytes written. DEFLATE and no predictor work for every GDAL
+# build and band data type
+_TIFF_CREATE_OPTIONS = [
+    "COMPRESS=DEFLATE",
+    "TILED=YES",
+    "BIGTIFF=IF_SAFER",
+    "NUM_THREADS=ALL_CPUS",
+]
+
+
+def _crs_urn(crs):
+    """Get the OGC URN naming a CRS in a GeoJSON crs member.
+
+    :param crs: The CRS to name
+    :type crs: QgsCoordinateReferenceSystem
+    :return: URN such as 'urn:ogc:def:crs:EPSG::25832', empty if the CRS is
+        invalid or has no authority id
+    :rtype: str
+    """
+    if not crs.isValid():
+        return ""
+    authority, _, code = crs.authid().partition(":")
+    if not code:
+        return ""
+    return f"urn:ogc:def:crs:{authority}::{code}"
+
 
 class MemoryLayer(Layer):
     """Specialized Layer subclass for handling QGIS memory layers.
 
     Memory layers exist only in memory and don't have physical files on disk.
-    This class handles exporting them to temporary files (TIFF for raster,
-    GeoJSON for vector) before adding them to the ROCrate.
+    This class exports rasters to temporary TIFF files and serializes vectors
+    to GeoJSON in memory before adding them to the ROCrate.
     """
 
+    __slots__ = ()
+    logger = get_logger("MemoryLayer")
+
     # ============================================================================
     # INITIALIZATION
     # ============================================================================
 
-    def __init__(self, layer):
+    def __init__(self, layer, visibility_map=None):
         """Initialize a MemoryLayer from a QGIS memory layer.
 
         :param layer: The QGIS memory layer object to wrap
         :type layer: QgsMapLayer
+        :param visibility_map: Layer id to visibility lookup shared by a batch of
+            layers, queried from the layer tree if not given
+        :type visibility_map: dict or None
         """
-        super().__init__(layer)
-        self.logger = get_logger("MemoryLayer")
+        super().__init__(layer, visibility_map)
         self.provider = "memory"
         self.source = "memory"
 
@@ -33,22 +69,25 @@ class MemoryLayer(Layer):
     # ROCRATE COMPONENT METHODS (OVERRIDES)
     # ============================================================================
 
-    def _add_geometry_to_rocrate(self, crate):
+    def _add_geometry_to_rocrate(self, crate, temp_paths):
         """Add the memory layer geometry to ROCrate by exporting to temporary files.
 
         Since memory layers don't have physical files, this method exports them
-        to temporary files first. Raster layers are exported as TIFF files,
-        vector layers as GeoJSON files.
+        first. Raster layers are exported as temporary TIFF files, vector layers
+        as GeoJSON held in memory.
 
         :param crate: The ROCrate object to add the geometry to
         :type crate: ROCrate
+        :param temp_paths: Temporary files of the export, removed once the crate
+            has been written
+        :type temp_paths: list
         :return: Tuple of the updated crate and the created geometry file
         :rtype: tuple
         """
         geometry = None
 
         if self.type == "Raster":
-            geometry = self._export_raster_to_rocrate(crate)
+            geometry = self._export_raster_to_rocrate(crate, temp_paths)
         elif self.type == "Vector":
             geometry = self._export_vector_to_rocrate(crate)
 
@@ -58,21 +97,26 @@ class MemoryLayer(Layer):
     # UTILITY / HELPER METHODS
     # ============================================================================
 
-    def _export_raster_to_rocrate(self, crate):
+    def _export_raster_to_rocrate(self, crate, temp_paths):
         """Export memory raster layer to temporary TIFF file and add to ROCrate.
 
         :param crate: The ROCrate object to add the raster to
         :type crate: ROCrate
+        :param temp_paths: Temporary files of the export, the TIFF is added
+        :type temp_paths: list
         :return: The created geometry file object
         :rtype: File
         """
-        with tempfile.NamedTemporaryFile(suffix=".tif", delete=False) as temp_tif:
-            temp_tif_path = temp_tif.name
+        # QGIS writes the raster itself, so only reserve a temporary path. The
+        # crate reads the file when it is written
+        temp_tif_path = self._reserve_temp_path(".tif", temp_paths)
 
         pipe = QgsRasterPipe()
         provider = self.layer.dataProvider()
         pipe.set(provider.clone())
-        QgsRasterFileWriter(temp_tif_path).writeRaster(
+        writer = QgsRasterFileWriter(temp_tif_path)
+        writer.setCreateOptions(_TIFF_CREATE_OPTIONS)
+        writer.writeRaster(
             pipe,
             provider.xSize(),
             provider.ySize(),
@@ -83,8 +127,7 @@ class MemoryLayer(Layer):
         properties = {
             "name": f"{self.name} Geometry",
             "encodingFormat": get_mimetype(temp_tif_path),
-            "contentSize": self._get_content_size(temp_tif_path),
-            "dateModified": self._get_last_modified(temp_tif_path),
+            **self._get_file_properties(temp_tif_path),
         }
         properties = self._add_geometry_properties(properties)
         properties = self._add_source_properties(properties)
@@ -94,7 +137,6 @@ class MemoryLayer(Layer):
             f"{self.id}/geometry.tif",
             properties=properties,
         )
-        temp_tif.close()
         self.logger.info(
             f"Added memory file {temp_tif_path} -> {f'map/{self.clean_name}/geometry.tif'} to crate."
         )
@@ -102,43 +144,58 @@ class MemoryLayer(Layer):
         return geometry
 
     def _export_vector_to_rocrate(self, crate):
-        """Export memory vector layer to temporary GeoJSON file and add to ROCrate.
+        """Serialize memory vector layer to GeoJSON and add it to ROCrate.
+
+        The features already live in memory, so the GeoJSON is handed to the
+        crate as bytes instead of going through a temporary file. Features are
+        serialized one at a time while iterating the layer rather than copied
+        into a list first.
 
         :param crate: The ROCrate object to add the vector to
         :type crate: ROCrate
         :return: The created geometry file object
         :rtype: File
         """
-        with tempfile.NamedTemporaryFile(
-            suffix=".geojson", delete=False
-        ) as temp_geojson:
-            temp_geojson_path = temp_geojson.name
-
-        QgsVectorFileWriter.writeAsVectorFormat(
-            self.layer,
-            temp_geojson_path,
-            "UTF-8",
-            self.layer.crs(),
-            "GeoJSON",
-        )
-
+        exporter = QgsJsonExporter(self.layer, _GEOJSON_PRECISION)
+        # Keep the coordinates in the layer CRS instead of converting to WGS 84
+        exporter.setTransformGeometries(False)
+        geojson = BytesIO()
+        geojson.write(b'{"type": "FeatureCollection", ')
+        # Name the layer CRS in the crs member, as the GDAL GeoJSON driver does,
+        # so readers don't assume WGS 84
+        crs_urn = _crs_urn(self.layer.crs())
+        if crs_urn:
+            geojson.write(
+                b'"crs": {"type": "name", "properties": {"name": "%s"}}, '
+                % crs_urn.encode("utf-8")
+            )
+        geojson.write(b'"features": [')
+        for index, feature in enumerate(self.layer.getFeatures()):
+            if index:
+                geojson.write(b", ")
+            geojson.write(exporter.exportFeature(feature).encode("utf-8"))
+        geojson.write(b"]}")
+        content_size = geojson.tell()
+        geojson.seek(0)
+
+        dest_path = f"{self.id}/geometry.geojson"
         properties = {
             "name": f"{self.name} Geometry",
-            "encodingFormat": get_mimetype(temp_geojson_path),
-            "contentSize": self._get_content_size(temp_geojson_path),
-            "dateModified": self._get_last_modified(temp_geojson_path),
+            "encodingFormat": get_mimetype(dest_path),
+            "contentSize": f"{content_size / 1024}",
+            "dateModified": datetime.now().isoformat(),
         }
         properties = self._add_geometry_properties(properties)
         properties = self._add_source_properties(properties)
 
         geometry = crate.add_file(
-            temp_geojson_path,
-            f"{self.id}/geometry.geojson",
+            geojson,
+            dest_path,
             properties=properties,
         )
-        temp_geojson.close()
         self.logger.info(
-            f"Added memory file {temp_geojson_path} -> {f'map/{self.clean_name}/geometry.geojson'} to crate."
+            f"Added memory layer {self.name} -> "
+            f"{f'map/{self.clean_name}/geometry.geojson'} to crate."
         )
 
         return geometry
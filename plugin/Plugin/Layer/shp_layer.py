@@ -1,49 +1,95 @@
-import glob
 import os
-import tempfile
+import shutil
 import zipfile
 
 from ..Layer.layer import Layer
 from ..utility import get_logger
 
+# Read size when copying the Shapefile parts into the archive
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+# Extensions of the files that can make up a Shapefile, in archive order
+_SHP_SIDECARS = (
+    ".shp",
+    ".shx",
+    ".dbf",
+    ".prj",
+    ".cpg",
+    ".qpj",
+    ".sbn",
+    ".sbx",
+    ".qix",
+    ".fix",
+    ".aih",
+    ".ain",
+    ".atx",
+    ".ixs",
+    ".mxs",
+    ".shp.xml",
+    ".qmd",
+)
+
 
 class SHPLayer(Layer):
     """Specialized Layer subclass for handling Shapefile layers."""
 
+    __slots__ = ("mimetype",)
+    logger = get_logger("SHPLayer")
+
     # ============================================================================
     # INITIALIZATION
     # ============================================================================
 
-    def __init__(self, layer):
+    def __init__(self, layer, visibility_map=None):
         """Initialize a SHPLayer from a QGIS layer.
 
         :param layer: The QGIS layer object to wrap
         :type layer: QgsMapLayer
+        :param visibility_map: Layer id to visibility lookup shared by a batch of
+            layers, queried from the layer tree if not given
+        :type visibility_map: dict or None
         """
-        super().__init__(layer)
-        self.logger = get_logger("SHPLayer")
+        super().__init__(layer, visibility_map)
         self.mimetype = "application/zip"
 
-    def _add_geometry_to_rocrate(self, crate):
-        file_dir = os.path.dirname(self.source)
-        file_basename = os.path.splitext(os.path.basename(self.source))[0]
+    def _add_geometry_to_rocrate(self, crate, temp_paths):
+        file_dir, file_name = os.path.split(self.source)
+        stem = os.path.splitext(file_name)[0].lower()
 
-        pattern = os.path.join(file_dir, f"{file_basename}.*")
-        matching_files = glob.glob(pattern)
+        # List the directory once and match the known sidecars regardless of
+        # letter case, a .DBF can sit next to a .shp
+        files_by_name = {}
+        with os.scandir(file_dir or ".") as entries:
+            for entry in entries:
+                name = entry.name.lower()
+                if name.startswith(stem) and entry.is_file():
+                    files_by_name[name] = entry.path
+        matching_files = [
+            files_by_name[stem + ext]
+            for ext in _SHP_SIDECARS
+            if stem + ext in files_by_name
+        ]
 
-        with tempfile.NamedTemporaryFile(suffix=".zip", delete=False) as temp_zip:
-            temp_zip_path = temp_zip.name
+        # Only reserve a temporary path, ZipFile reopens it. The crate reads
+        # the archive when it is written
+        temp_zip_path = self._reserve_temp_path(".zip", temp_paths)
 
-        with zipfile.ZipFile(temp_zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
+        # Stored uncompressed, the exported crate archive compresses it anyway
+        with zipfile.ZipFile(temp_zip_path, "w", zipfile.ZIP_STORED) as zipf:
             for file_path in matching_files:
                 arcname = os.path.basename(file_path)
-                zipf.write(file_path, arcname)
+                # Keep the file timestamp and permissions, copy in large chunks
+                zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+                zinfo.compress_type = zipf.compression
+                with open(file_path, "rb") as src, zipf.open(
+                    zinfo, "w", force_zip64=True
+                ) as dst:
+                    shutil.copyfileobj(src, dst, _COPY_CHUNK_SIZE)
 
         properties = {
             "name": f"{self.name} Geometry",
             "encodingFormat": "application/zip",
-            "contentSize": self._get_content_size(temp_zip_path),
-            "dateModified": self._get_last_modified(temp_zip_path),
+            **self._get_file_properties(temp_zip_path),
         }
         properties = self._add_geometry_properties(properties)
         properties = self._add_source_properties(properties)
@@ -53,7 +99,6 @@ class SHPLayer(Layer):
             f"{self.id}/geometry.zip",
             properties=properties,
         )
-        temp_zip.close()
         self.logger.info(
             f"Added Shapefile archive {temp_zip_path} -> {f'map/{self.clean_name}/geometry.zip'} to crate."
         )
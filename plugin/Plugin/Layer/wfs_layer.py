@@ -4,6 +4,13 @@ from urllib.parse import urlencode
 from ..Layer.layer import Layer
 from ..utility import get_logger, get_mimetype
 
+# Quoted service URL in the QGIS WFS source string
+_URL_RE = re.compile(r"url='([^']+)'")
+# Request parameters copied from the QGIS source, in their order in the URL
+_PARAM_KEYS = ("VERSION", "TYPENAME", "MAXFEATURES", "EXCEPTIONS", "OUTPUTFORMAT")
+# Any of the parameters, matched case-insensitively in a single scan
+_PARAM_RE = re.compile(rf"({'|'.join(_PARAM_KEYS)})=([^&\s']+)", re.IGNORECASE)
+
 
 class WFSLayer(Layer):
     """Specialized Layer subclass for handling QGIS WFS (Web Feature Service) layers.
@@ -13,11 +20,14 @@ class WFSLayer(Layer):
     and reconstructing proper WFS URLs for ROCrate storage.
     """
 
+    __slots__ = ("mimetype",)
+    logger = get_logger("WFSLayer")
+
     # ============================================================================
     # INITIALIZATION
     # ============================================================================
 
-    def __init__(self, layer):
+    def __init__(self, layer, visibility_map=None):
         """Initialize a WFSLayer from a QGIS WFS layer.
 
         Extracts and reconstructs the WFS service URL from the QGIS layer source
@@ -25,9 +35,11 @@ class WFSLayer(Layer):
 
         :param layer: The QGIS WFS layer object to wrap
         :type layer: QgsMapLayer
+        :param visibility_map: Layer id to visibility lookup shared by a batch of
+            layers, queried from the layer tree if not given
+        :type visibility_map: dict or None
         """
-        super().__init__(layer)
-        self.logger = get_logger("WFSLayer")
+        super().__init__(layer, visibility_map)
         self.provider = "wfs"
         self.mimetype = None
         self.source = self._get_wfs_url()
@@ -36,7 +48,7 @@ class WFSLayer(Layer):
     # ROCRATE COMPONENT METHODS (OVERRIDES)
     # ============================================================================
 
-    def _add_geometry_to_rocrate(self, crate):
+    def _add_geometry_to_rocrate(self, crate, temp_paths):
         """Add the WFS layer reference to ROCrate.
 
         Since WFS layers are web services, this adds a reference to the service URL
@@ -45,6 +57,9 @@ class WFSLayer(Layer):
 
         :param crate: The ROCrate object to add the WFS reference to
         :type crate: ROCrate
+        :param temp_paths: Temporary files of the export, unused as no file is
+            written for the web service
+        :type temp_paths: list
         :return: Tuple of the updated crate and the created geometry reference
         :rtype: tuple
         """
@@ -60,7 +75,7 @@ class WFSLayer(Layer):
             self.source,
             properties=properties,
         )
-        self.logger.info(f"Added WFS layer {self.source} to crate.")
+        self.logger.info("Added WFS layer %s to crate.", self.source)
 
         return crate, geometry
 
@@ -84,7 +99,7 @@ class WFSLayer(Layer):
         params = {}
 
         # URL extrahieren
-        url_match = re.search(r"url='([^']+)'", qgis_source_string)
+        url_match = _URL_RE.search(qgis_source_string)
         if not url_match:
             return None
         base_url = url_match.group(1)
@@ -94,22 +109,17 @@ class WFSLayer(Layer):
         params["SERVICE"] = "WFS"
         params["REQUEST"] = request_type
 
-        # Weitere Parameter aus Source extrahieren
-        patterns = {
-            "VERSION": r"VERSION=([^&\s']+)",
-            "TYPENAME": r"TYPENAME=([^&\s']+)",
-            "MAXFEATURES": r"MAXFEATURES=([^&\s']+)",
-            "EXCEPTIONS": r"EXCEPTIONS=([^&\s']+)",
-            "OUTPUTFORMAT": r"OUTPUTFORMAT=([^&\s']+)",
-        }
+        # Weitere Parameter aus Source extrahieren, the first match of a key wins
+        found = {}
+        for match in _PARAM_RE.finditer(qgis_source_string):
+            found.setdefault(match.group(1).upper(), match.group(2))
 
-        # Make parameter matching case-insensitive
-        for key, pattern in patterns.items():
-            match = re.search(pattern, qgis_source_string, re.IGNORECASE)
-            if match:
+        for key in _PARAM_KEYS:
+            value = found.get(key)
+            if value is not None:
                 if key == "OUTPUTFORMAT":
-                    self.mimetype = match.group(1).split("=")[1]
-                params[key] = match.group(1)
+                    self.mimetype = value
+                params[key] = value
 
         # URL zusammenbauen
         query_string = urlencode(params)
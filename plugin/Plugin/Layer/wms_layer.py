@@ -1,8 +1,14 @@
-from urllib.parse import unquote
+from urllib.parse import quote, unquote, urlencode
 
 from ..Layer.layer import Layer
 from ..utility import get_logger, get_mimetype
 
+# Parameters the QGIS WMS source lacks, put in front of the GetMap URL
+_WMS_PARAMS = (("SERVICE", "WMS"), ("REQUEST", "GetMap"))
+# Characters left unescaped in the rebuilt query, common in CRS, MIME type and
+# layer list values
+_QUERY_SAFE = ":/,"
+
 
 class WMSLayer(Layer):
     """Specialized Layer subclass for handling QGIS WMS (Web Map Service) layers.
@@ -12,11 +18,14 @@ class WMSLayer(Layer):
     and reconstructing proper WMS URLs for ROCrate storage.
     """
 
+    __slots__ = ("mimetype",)
+    logger = get_logger("WMSLayer")
+
     # ============================================================================
     # INITIALIZATION
     # ============================================================================
 
-    def __init__(self, layer):
+    def __init__(self, layer, visibility_map=None):
         """Initialize a WMSLayer from a QGIS WMS layer.
 
         Extracts and reconstructs the WMS service URL from the QGIS layer source
@@ -24,9 +33,11 @@ class WMSLayer(Layer):
 
         :param layer: The QGIS WMS layer object to wrap
         :type layer: QgsMapLayer
+        :param visibility_map: Layer id to visibility lookup shared by a batch of
+            layers, queried from the layer tree if not given
+        :type visibility_map: dict or None
         """
-        super().__init__(layer)
-        self.logger = get_logger("WMSLyer")
+        super().__init__(layer, visibility_map)
         self.provider = "wms"
         self.mimetype = None
         self.source = self._get_wms_url()
@@ -35,7 +46,7 @@ class WMSLayer(Layer):
     # ROCRATE COMPONENT METHODS (OVERRIDES)
     # ============================================================================
 
-    def _add_geometry_to_rocrate(self, crate):
+    def _add_geometry_to_rocrate(self, crate, temp_paths):
         """Add the WMS layer reference to ROCrate.
 
         Since WMS layers are web services, this adds a reference to the service URL
@@ -44,6 +55,9 @@ class WMSLayer(Layer):
 
         :param crate: The ROCrate object to add the WMS reference to
         :type crate: ROCrate
+        :param temp_paths: Temporary files of the export, unused as no file is
+            written for the web service
+        :type temp_paths: list
         :return: Tuple of the updated crate and the created geometry reference
         :rtype: tuple
         """
@@ -59,7 +73,7 @@ class WMSLayer(Layer):
             self.source,
             properties=properties,
         )
-        self.logger.info(f"Added WMS layer {self.source} to crate.")
+        self.logger.info("Added WMS layer %s to crate.", self.source)
 
         return crate, geometry
 
@@ -77,30 +91,29 @@ class WMSLayer(Layer):
         :return: Complete WMS GetMap URL or None if parsing fails
         :rtype: str or None
         """
-        # Extract base URL
+        # Decode the key=value pairs of the source in one pass, an encoded
+        # query of the service URL stays part of the url value. QGIS keeps "+"
+        # literal in sources, so the pairs are not decoded as form data. The
+        # missing WMS parameters go at the beginning
         base_url = None
-        params = []
-        qgis_source = unquote(self.layer.source())
-
-        # Split by & and process each part
-        parts = qgis_source.split("&")
-
-        for part in parts:
-            if "url=" in part:
-                base_url = part.split("url=")[1].rstrip("?")
+        params = list(_WMS_PARAMS)
+        for part in self.layer.source().split("&"):
+            if not part:
+                continue
+            key, _, value = part.partition("=")
+            key = unquote(key)
+            value = unquote(value)
+            if key == "url":
+                base_url = value.rstrip("?")
             else:
-                if "format=" in part:
-                    self.mimetype = part.split("=")[1]
-                params.append(part)
+                if key == "format":
+                    self.mimetype = value
+                params.append((key, value))
 
         if not base_url:
             return None
 
-        # Add missing WMS parameters at the beginning
-        wms_params = ["SERVICE=WMS", "REQUEST=GetMap"]
-
-        # Combine all parameters
-        all_params = wms_params + params
-
-        # Build final URL
-        return f"{base_url}?{'&'.join(all_params)}"
+        # Build final URL, re-encoding the decoded values
+        query = urlencode(params, safe=_QUERY_SAFE, quote_via=quote)
+        separator = "&" if "?" in base_url else "?"
+        return f"{base_url}{separator}{query}"
@@ -5,10 +5,15 @@ Instrument - Represents a QGIS processing algorithm as a software instrument
 
 from ..utility import get_logger
 
+logger = get_logger("Instrument")
+
 
 class Instrument:
     """Represents a QGIS processing algorithm as a software instrument"""
 
+    # Created for every exported step, so store attributes in fixed slots
+    __slots__ = ("algorithm", "id", "type", "name")
+
     # ============================================================================
     # INITIALIZATION
     # ============================================================================
@@ -19,7 +24,6 @@ class Instrument:
         :param algorithm: QGIS algorithm identifier
         :type algorithm: str
         """
-        self.logger = get_logger("Instrument")
         self.algorithm = algorithm
         self.id = f"#{algorithm}"
         self.type = "SoftwareApplication"
@@ -38,5 +42,5 @@ class Instrument:
         :rtype: ROCrate
         """
         crate.add_jsonld({"@id": self.id, "@type": self.type, "name": self.name})
-        self.logger.info(f"Added instrument {self.id} to crate.")
+        logger.info("Added instrument %s to crate.", self.id)
         return crate
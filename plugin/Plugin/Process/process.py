@@ -3,11 +3,28 @@
 Process - Represents a QGIS processing step with metadata and RO-Crate export
 """
 
-import re
+import json
+from functools import cached_property
 
-from ..utility import get_logger
+from ..utility import get_logger, keep_ascii_alnum
 from .instrument import Instrument
 
+logger = get_logger("Process")
+
+
+def _format_json(value):
+    """Pretty-print a history entry value, falling back to its string form.
+
+    :param value: Parameters or results of the history entry
+    :type value: dict
+    :return: Indented JSON with sorted keys, or str(value) if not serializable
+    :rtype: str
+    """
+    try:
+        return json.dumps(value, indent=2, sort_keys=True)
+    except Exception:
+        return str(value)
+
 
 class Process:
     """Represents a QGIS processing step"""
@@ -22,7 +39,6 @@ class Process:
         :param source: QGIS history entry containing process information
         :type source: QgsHistoryEntry
         """
-        self.logger = get_logger("Process")
         self.timestamp = source.timestamp.toString("dd.MM.yyyy hh:mm:ss")
         entry = source.entry
         self.algorithm_id = entry.get("algorithm_id")
@@ -31,10 +47,10 @@ class Process:
         self.python_command = entry.get("python_command", "Unknown")
         self.parameters = entry.get("parameters", {})
         self.results = entry.get("results", {})
-        self.id = re.sub(r"[^A-Za-z0-9]", "", f"{self.algorithm_id}{self.timestamp}")
+        # Strip the algorithm id and timestamp down to the step id characters
+        self.id = keep_ascii_alnum(f"{self.algorithm_id}{self.timestamp}")
         self.name = ""
         self.description = ""
-        self.instrument = Instrument(self.algorithm_id)
         self.object = {}
         self.result = {}
 
@@ -60,9 +76,7 @@ class Process:
         :type inputs: list or str
         """
         if len(inputs) > 1:
-            self.object = []
-            for inp in inputs:
-                self.object.append({"@id": inp})
+            self.object = [{"@id": inp} for inp in inputs]
         else:
             self.object = {"@id": inputs[0]}
 
@@ -74,6 +88,47 @@ class Process:
         """
         self.result = {"@id": result}
 
+    # ============================================================================
+    # LAZY ATTRIBUTES
+    # ============================================================================
+
+    @cached_property
+    def instrument(self):
+        """Get the instrument of the algorithm, created on first use.
+
+        Most history entries are never exported, so the instrument is only
+        built once a crate needs it.
+
+        :return: Instrument representing the algorithm
+        :rtype: Instrument
+        """
+        return Instrument(self.algorithm_id)
+
+    # ============================================================================
+    # DISPLAY VALUES
+    # ============================================================================
+
+    # The history entry values never change, so they are formatted only once
+    # no matter how often the process dialog is opened
+
+    @cached_property
+    def parameters_json(self):
+        """Get the parameters formatted for display.
+
+        :return: Indented JSON of the parameters
+        :rtype: str
+        """
+        return _format_json(self.parameters)
+
+    @cached_property
+    def results_json(self):
+        """Get the results formatted for display.
+
+        :return: Indented JSON of the results
+        :rtype: str
+        """
+        return _format_json(self.results)
+
     # ============================================================================
     # ROCRATE EXPORT
     # ============================================================================
@@ -104,5 +159,5 @@ class Process:
             properties=properties,
         )
 
-        self.logger.info(f"Added process {self.id} to crate.")
+        logger.info("Added process %s to crate.", self.id)
         return crate
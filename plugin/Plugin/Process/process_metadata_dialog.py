@@ -3,8 +3,6 @@
 Process Metadata Dialog - Dialog for documenting processing step metadata
 """
 
-import json
-
 from qgis.PyQt.QtCore import Qt, QTimer
 from qgis.PyQt.QtGui import QFont
 from qgis.PyQt.QtWidgets import (
@@ -15,6 +13,7 @@ from qgis.PyQt.QtWidgets import (
     QLabel,
     QLineEdit,
     QMessageBox,
+    QPlainTextEdit,
     QPushButton,
     QSizePolicy,
     QSpacerItem,
@@ -22,6 +21,19 @@ from qgis.PyQt.QtWidgets import (
     QVBoxLayout,
 )
 
+# Field borders by the validState property set in _apply_validation_styles,
+# parsed once for the dialog instead of on every validation pass
+_DIALOG_STYLESHEET = """
+    *[validState="invalid"] { border: 2px solid #e74c3c; border-radius: 3px; }
+    *[validState="valid"] { border: 2px solid #27ae60; border-radius: 3px; }
+"""
+
+# Validator method of each validated field
+_FIELD_VALIDATORS = {
+    "name": "_validate_name_field",
+    "description": "_validate_description_field",
+}
+
 
 class ProcessMetadataDialog(QDialog):
     """Dialog for documenting processing step metadata"""
@@ -40,6 +52,13 @@ class ProcessMetadataDialog(QDialog):
         """
         super().__init__(parent)
         self.process = process
+        # Fields edited since the last validation pass, and the stripped
+        # texts and verdicts of every field, reused when accepting
+        self._dirty_fields = set(_FIELD_VALIDATORS)
+        self._field_texts = {}
+        self._field_validity = {}
+        # Log HTML not rendered yet, the log is only parsed once it is expanded
+        self._pending_log_html = None
         self.setup_ui()
         self._setup_logic()
 
@@ -54,6 +73,7 @@ class ProcessMetadataDialog(QDialog):
         self.setWindowTitle("Process Metadata Documentation")
         self.setMinimumSize(700, 800)
         self.resize(700, 800)
+        self.setStyleSheet(_DIALOG_STYLESHEET)
 
         # Main layout
         main_layout = QVBoxLayout()
@@ -144,11 +164,12 @@ class ProcessMetadataDialog(QDialog):
         parameters_layout.setSpacing(12)
         parameters_layout.setContentsMargins(15, 15, 15, 15)
 
-        self.parameters_textedit = QTextEdit()
+        # Plain text widget, the JSON needs no rich text document
+        self.parameters_textedit = QPlainTextEdit()
         self.parameters_textedit.setMaximumHeight(120)
         self.parameters_textedit.setReadOnly(True)
         self.parameters_textedit.setStyleSheet(
-            "QTextEdit:read-only { background-color: #f8f9fa; color: #6c757d; font-family: monospace; }"
+            "QPlainTextEdit:read-only { background-color: #f8f9fa; color: #6c757d; font-family: monospace; }"
         )
         parameters_layout.addWidget(self.parameters_textedit)
 
@@ -161,19 +182,21 @@ class ProcessMetadataDialog(QDialog):
         results_layout.setSpacing(12)
         results_layout.setContentsMargins(15, 15, 15, 15)
 
-        self.results_textedit = QTextEdit()
+        self.results_textedit = QPlainTextEdit()
         self.results_textedit.setMaximumHeight(120)
         self.results_textedit.setReadOnly(True)
         self.results_textedit.setStyleSheet(
-            "QTextEdit:read-only { background-color: #f8f9fa; color: #6c757d; font-family: monospace; }"
+            "QPlainTextEdit:read-only { background-color: #f8f9fa; color: #6c757d; font-family: monospace; }"
         )
         results_layout.addWidget(self.results_textedit)
 
         results_group.setLayout(results_layout)
         main_layout.addWidget(results_group)
 
-        # Log Group (read-only)
-        log_group = QGroupBox("Process Log")
+        # Log Group (read-only, collapsed until checked)
+        self.log_group = QGroupBox("Process Log")
+        self.log_group.setCheckable(True)
+        self.log_group.setChecked(False)
         log_layout = QVBoxLayout()
         log_layout.setSpacing(12)
         log_layout.setContentsMargins(15, 15, 15, 15)
@@ -181,13 +204,14 @@ class ProcessMetadataDialog(QDialog):
         self.log_textedit = QTextEdit()
         self.log_textedit.setMaximumHeight(120)
         self.log_textedit.setReadOnly(True)
+        self.log_textedit.setVisible(False)
         self.log_textedit.setStyleSheet(
             "QTextEdit:read-only { background-color: #f8f9fa; color: #6c757d; font-family: monospace; }"
         )
         log_layout.addWidget(self.log_textedit)
 
-        log_group.setLayout(log_layout)
-        main_layout.addWidget(log_group)
+        self.log_group.setLayout(log_layout)
+        main_layout.addWidget(self.log_group)
 
         # Spacer
         spacer = QSpacerItem(20, 10, QSizePolicy.Minimum, QSizePolicy.Expanding)
@@ -237,17 +261,21 @@ class ProcessMetadataDialog(QDialog):
         self._populate_fields()
 
         # Setup validation timer
-        self.validation_timer = QTimer()
+        self.validation_timer = QTimer(self)
         self.validation_timer.setSingleShot(True)
+        self.validation_timer.setInterval(300)  # 300ms delay
         self.validation_timer.timeout.connect(self._perform_real_time_validation)
 
         # Connect signals
         self.cancel_button.clicked.connect(self.reject)
         self.save_button.clicked.connect(self._validate_and_accept)
+        self.log_group.toggled.connect(self._on_log_toggled)
 
         # Field change connections for real-time validation
-        self.name_lineedit.textChanged.connect(self._on_text_changed)
-        self.description_textedit.textChanged.connect(self._on_text_changed)
+        self.name_lineedit.textChanged.connect(lambda: self._on_text_changed("name"))
+        self.description_textedit.textChanged.connect(
+            lambda: self._on_text_changed("description")
+        )
 
         # Initial validation
         self._perform_real_time_validation()
@@ -270,44 +298,55 @@ class ProcessMetadataDialog(QDialog):
         process_id = getattr(self.process, "id", "Unknown")
         self.process_id_lineedit.setText(str(process_id))
 
-        # Parameters (read-only, formatted JSON)
-        parameters = getattr(self.process, "parameters", {})
-        try:
-            formatted_parameters = json.dumps(parameters, indent=2, sort_keys=True)
-            self.parameters_textedit.setPlainText(formatted_parameters)
-        except Exception:
-            self.parameters_textedit.setPlainText(str(parameters))
-
-        # Results (read-only, formatted JSON)
-        results = getattr(self.process, "results", {})
-        try:
-            formatted_results = json.dumps(results, indent=2, sort_keys=True)
-            self.results_textedit.setPlainText(formatted_results)
-        except Exception:
-            self.results_textedit.setPlainText(str(results))
-
-        # Log (read-only)
-        log = getattr(self.process, "log", "No log available")
-        self.log_textedit.setHtml(str(log))
+        # Parameters and results (read-only, formatted JSON cached by the process)
+        self.parameters_textedit.setPlainText(
+            getattr(self.process, "parameters_json", "{}")
+        )
+        self.results_textedit.setPlainText(getattr(self.process, "results_json", "{}"))
+
+        # Log (read-only), rendered when the log group is first expanded
+        self._pending_log_html = str(getattr(self.process, "log", "No log available"))
 
         # Set initial focus
         self.name_lineedit.setFocus()
 
+    # ============================================================================
+    # EVENT HANDLERS
+    # ============================================================================
+
+    def _on_log_toggled(self, checked):
+        """Show or hide the log, rendering its HTML on the first expand.
+
+        :param checked: Whether the log group is expanded
+        :type checked: bool
+        """
+        if checked and self._pending_log_html is not None:
+            self.log_textedit.setHtml(self._pending_log_html)
+            self._pending_log_html = None
+        self.log_textedit.setVisible(checked)
+
     # ============================================================================
     # VALIDATION
     # ============================================================================
 
-    def _on_text_changed(self):
-        """Handle text changes with delayed validation"""
-        self.validation_timer.stop()
-        self.validation_timer.start(300)  # 300ms delay
+    def _on_text_changed(self, field):
+        """Handle text changes with delayed validation.
 
-    def _perform_real_time_validation(self):
-        """Perform real-time validation of fields"""
-        name_valid = self._validate_name_field()
-        description_valid = self._validate_description_field()
+        :param field: Name of the changed field
+        :type field: str
+        """
+        self._dirty_fields.add(field)
+        self.validation_timer.start()  # Restarts the delay if already running
 
-        all_valid = name_valid and description_valid
+    def _perform_real_time_validation(self):
+        """Perform real-time validation of the changed fields"""
+        # Re-run only the validators of edited fields, the others are unchanged
+        validity = self._field_validity
+        for field in self._dirty_fields:
+            validity[field] = getattr(self, _FIELD_VALIDATORS[field])()
+        self._dirty_fields.clear()
+
+        all_valid = validity["name"] and validity["description"]
         self.save_button.setEnabled(all_valid)
 
     def _validate_name_field(self):
@@ -317,6 +356,7 @@ class ProcessMetadataDialog(QDialog):
         :rtype: bool
         """
         text = self.name_lineedit.text().strip()
+        self._field_texts["name"] = text
         if len(text) >= 3:
             self._apply_validation_styles(self.name_lineedit, "valid")
             return True
@@ -334,6 +374,7 @@ class ProcessMetadataDialog(QDialog):
         :rtype: bool
         """
         text = self.description_textedit.toPlainText().strip()
+        self._field_texts["description"] = text
         if len(text) >= 10:
             self._apply_validation_styles(self.description_textedit, "valid")
             return True
@@ -352,20 +393,32 @@ class ProcessMetadataDialog(QDialog):
         :param state: Validation state ('valid', 'invalid', or 'neutral')
         :type state: str
         """
-        if state == "invalid":
-            widget.setStyleSheet("border: 2px solid #e74c3c; border-radius: 3px;")
-        elif state == "valid":
-            widget.setStyleSheet("border: 2px solid #27ae60; border-radius: 3px;")
-        else:  # neutral
-            widget.setStyleSheet("")
+        if widget.property("validState") == state:
+            return  # Already styled for this state, skip the re-polish
+
+        # Re-polish so the dialog stylesheet rules for the new state apply
+        widget.setProperty("validState", state)
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
+
+    def _flush_pending_validation(self):
+        """Validate edits still waiting for the delayed validation right away.
+
+        Afterwards the cached field texts and verdicts match the widgets.
+        """
+        if self.validation_timer.isActive():
+            self.validation_timer.stop()
+            self._perform_real_time_validation()
 
     def _validate_and_accept(self):
         """Final validation before accepting the dialog"""
-        name_text = self.name_lineedit.text().strip()
-        description_text = self.description_textedit.toPlainText().strip()
+        self._flush_pending_validation()
+        name_text = self._field_texts["name"]
+        description_text = self._field_texts["description"]
 
         # Validate required fields
-        if not name_text or len(name_text) < 3:
+        if not self._field_validity["name"]:
             QMessageBox.warning(
                 self,
                 "Validation Error",
@@ -374,7 +427,7 @@ class ProcessMetadataDialog(QDialog):
             self.name_lineedit.setFocus()
             return
 
-        if not description_text or len(description_text) < 10:
+        if not self._field_validity["description"]:
             QMessageBox.warning(
                 self,
                 "Validation Error",
@@ -402,9 +455,10 @@ class ProcessMetadataDialog(QDialog):
         if hasattr(self.process.timestamp, "toString"):
             timestamp_str = self.process.timestamp.toString("yyyy-MM-dd hh:mm:ss")
 
+        self._flush_pending_validation()
         return {
-            "name": self.name_lineedit.text().strip(),
-            "description": self.description_textedit.toPlainText().strip(),
+            "name": self._field_texts["name"],
+            "description": self._field_texts["description"],
             "algorithm_id": getattr(self.process, "algorithm_id", "Unknown"),
             "timestamp": timestamp_str,
             "process_id": getattr(self.process, "id", "Unknown"),
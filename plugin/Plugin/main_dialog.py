@@ -3,12 +3,13 @@
 Main Dialog - Main dialog class that coordinates all tab widgets
 """
 
-from qgis.PyQt.QtCore import Qt, pyqtSignal
+from qgis.PyQt.QtCore import Qt, pyqtSignal, pyqtSlot
 from qgis.PyQt.QtWidgets import (
     QDialog,
     QDialogButtonBox,
     QTabWidget,
     QVBoxLayout,
+    QWidget,
 )
 
 # Import individual tab widgets
@@ -16,6 +17,10 @@ from .Export.export_tab import ExportTab
 from .Graph.graph_tab import GraphTab
 from .Instruction.instruction_tab import InstructionTab
 
+# Positions of the tabs built on first use
+_GRAPH_TAB_INDEX = 1
+_EXPORT_TAB_INDEX = 2
+
 
 class MainDialog(QDialog):
     """Main dialog for automated workflow documentation"""
@@ -34,21 +39,20 @@ class MainDialog(QDialog):
         :param parent: Parent widget
         :type parent: QWidget
         """
-        super().__init__(parent)
-
-        # Set window properties
-        self.setWindowTitle("Automated Workflow Documentation")
-        self.setMinimumSize(1000, 700)
-        self.resize(1000, 700)
-
         # Make window resizable and allow maximizing
-        self.setWindowFlags(
+        super().__init__(
+            parent,
             Qt.Window
             | Qt.WindowMinimizeButtonHint
             | Qt.WindowMaximizeButtonHint
-            | Qt.WindowCloseButtonHint
+            | Qt.WindowCloseButtonHint,
         )
 
+        # Set window properties
+        self.setWindowTitle("Automated Workflow Documentation")
+        self.setMinimumSize(1000, 700)
+        self.resize(1000, 700)
+
         # Setup the UI
         self.setup_ui()
 
@@ -65,7 +69,7 @@ class MainDialog(QDialog):
     def setup_ui(self):
         """Setup the user interface"""
         # Create main layout
-        main_layout = QVBoxLayout()
+        main_layout = QVBoxLayout(self)
         main_layout.setSpacing(15)
         main_layout.setContentsMargins(10, 10, 10, 10)
 
@@ -80,7 +84,7 @@ class MainDialog(QDialog):
 
         # Create button box
         self.button_box = QDialogButtonBox(
-            QDialogButtonBox.Ok | QDialogButtonBox.Cancel, Qt.Horizontal
+            QDialogButtonBox.Ok | QDialogButtonBox.Cancel, Qt.Horizontal, self
         )
 
         # Connect button box signals
@@ -89,20 +93,18 @@ class MainDialog(QDialog):
 
         main_layout.addWidget(self.button_box)
 
-        # Set main layout
-        self.setLayout(main_layout)
-
     def _initialize_tab_widgets(self):
         """Initialize and configure all tab widgets"""
-        # Create tab widget instances
+        # Create tab widget instances, the graph and export tabs are heavier
+        # and only built into their placeholder pages when first used
         self.instruction_tab = InstructionTab(parent=self)
-        self.graph_tab = GraphTab(parent=self)
-        self.export_tab = ExportTab(parent=self)
+        self._graph_tab = None
+        self._export_tab = None
 
         # Add tabs to the main tab widget
         self.tab_widget.addTab(self.instruction_tab, "Instructions")
-        self.tab_widget.addTab(self.graph_tab, "Graph")
-        self.tab_widget.addTab(self.export_tab, "Export")
+        self.tab_widget.addTab(QWidget(), "Graph")
+        self.tab_widget.addTab(QWidget(), "Export")
 
         # Set initial tab
         self.tab_widget.setCurrentIndex(0)  # Start with Instructions tab
@@ -116,19 +118,61 @@ class MainDialog(QDialog):
         # You can add connections here when export needs graph data
         pass
 
+    def _build_tab(self, tab_class, index):
+        """Build a deferred tab into its placeholder page.
+
+        :param tab_class: Tab widget class to instantiate
+        :type tab_class: type
+        :param index: Index of the placeholder page in the tab widget
+        :type index: int
+        :return: Created tab widget
+        :rtype: QWidget
+        """
+        tab = tab_class(parent=self)
+        layout = QVBoxLayout(self.tab_widget.widget(index))
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(tab)
+        return tab
+
+    @property
+    def graph_tab(self):
+        """Graph tab, built on first access.
+
+        :return: Graph tab widget
+        :rtype: GraphTab
+        """
+        if self._graph_tab is None:
+            self._graph_tab = self._build_tab(GraphTab, _GRAPH_TAB_INDEX)
+        return self._graph_tab
+
+    @property
+    def export_tab(self):
+        """Export tab, built on first access.
+
+        :return: Export tab widget
+        :rtype: ExportTab
+        """
+        if self._export_tab is None:
+            self._export_tab = self._build_tab(ExportTab, _EXPORT_TAB_INDEX)
+        return self._export_tab
+
     # ============================================================================
     # EVENT HANDLERS
     # ============================================================================
 
+    @pyqtSlot(int)
     def _on_tab_changed(self, index):
         """Handle tab change events.
 
         :param index: Index of the newly selected tab
         :type index: int
         """
-        if index == 1:  # Graph tab
+        if index == _GRAPH_TAB_INDEX:
             # Focus on graph view when switching to graph tab
             self.graph_tab.graph_view.setFocus()
+        elif index == _EXPORT_TAB_INDEX:
+            # Accessing the tab builds it on its first view
+            _ = self.export_tab
 
     # ============================================================================
     # PUBLIC INTERFACE
@@ -146,6 +190,11 @@ class MainDialog(QDialog):
         """Clear the graph - useful for export or reset functionality"""
         self.graph_tab.clear_graph()
 
+    def stop_export(self):
+        """Cancel a running export and wait for it, e.g. when the plugin unloads"""
+        if self._export_tab is not None:
+            self._export_tab.stop_export()
+
     def load_graph_data(self, data):
         """Load graph data - useful for import functionality.
 
@@ -1,9 +1,12 @@
 import json
 import logging
 import mimetypes
-import os
+import threading
+from collections import deque
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from string import ascii_letters, digits
 
 from qgis.PyQt.QtWidgets import QMessageBox
 
@@ -14,22 +17,35 @@ from qgis.PyQt.QtWidgets import QMessageBox
 
 def display_user_message(window, title, message):
     """Display an informational message to the user"""
-    msg_box = QMessageBox(window)
-    msg_box.setIcon(QMessageBox.Information)
-    msg_box.setWindowTitle(title)
-    msg_box.setText(message)
-    msg_box.setStandardButtons(QMessageBox.Ok)
-    msg_box.exec_()
+    QMessageBox.information(window, title, message)
 
 
 def display_error_message(window, title, message):
     """Display an error message to the user"""
-    msg_box = QMessageBox(window)
-    msg_box.setIcon(QMessageBox.Critical)
-    msg_box.setWindowTitle(title)
-    msg_box.setText(message)
-    msg_box.setStandardButtons(QMessageBox.Ok)
-    msg_box.exec_()
+    QMessageBox.critical(window, title, message)
+
+
+# =============================================================================
+# TEXT UTILITIES
+# =============================================================================
+
+
+class _AsciiAlnumTable(dict):
+    """str.translate table keeping ASCII letters and digits, deleting the rest"""
+
+    def __missing__(self, code):
+        self[code] = None  # Remembered, so each character is only looked up once
+        return None
+
+
+_ASCII_ALNUM_TABLE = _AsciiAlnumTable(
+    (ord(char), char) for char in ascii_letters + digits
+)
+
+
+def keep_ascii_alnum(text):
+    """Strip a text down to its ASCII letters and digits for ids and file names"""
+    return text.translate(_ASCII_ALNUM_TABLE)
 
 
 # =============================================================================
@@ -37,17 +53,19 @@ def display_error_message(window, title, message):
 # =============================================================================
 
 
+# Custom MIME type mappings shipped next to this module
+_MIMETYPES_JSON = Path(__file__).with_name("mimetypes.json")
+
+
+@lru_cache(maxsize=None)
 def _load_custom_mimetypes():
-    """Load custom MIME type mappings from JSON file"""
-    current_dir = Path(__file__).parent
-    json_file_path = current_dir / "mimetypes.json"
+    """Load custom MIME type mappings from JSON file, read once per session"""
     try:
-        if os.path.exists(json_file_path):
-            with open(json_file_path, "r") as f:
-                return json.load(f)
-        else:
-            return {}
-    except (FileNotFoundError, json.JSONDecodeError) as e:
+        with open(_MIMETYPES_JSON, "r") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}  # No custom mappings shipped
+    except json.JSONDecodeError as e:
         print(f"Error loading custom MIME types: {e}")
         return {}
 
@@ -84,21 +102,36 @@ def get_mimetype(file_path):
 # =============================================================================
 
 
+# Write buffer of the export log file, large enough for most logs in one write
+_LOG_FILE_BUFFER_SIZE = 1 << 20
+
+# Log records kept in memory for the export log, older ones are dropped so a
+# long QGIS session can't grow the buffer without bound
+_MAX_LOG_RECORDS = 10000
+
+
 class MemoryHandler(logging.Handler):
     """Custom handler that stores log records in memory"""
 
     def __init__(self):
         super().__init__()
-        self.log_entries = []
+        self.log_entries = deque(maxlen=_MAX_LOG_RECORDS)
 
     def emit(self, record):
-        """Store the formatted log record"""
-        log_entry = self.format(record)
-        self.log_entries.append(log_entry)
+        """Store the log record, it is only formatted when the logs are read"""
+        # Freeze the message so the record holds no msg or args objects, an
+        # exception passed as msg would keep its traceback frames alive
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            # Render the traceback now instead of keeping its frames alive
+            self.format(record)
+            record.exc_info = None
+        self.log_entries.append(record)
 
     def get_logs(self):
-        """Return all stored log entries"""
-        return self.log_entries
+        """Return all stored log entries, formatted on the fly"""
+        return (self.format(record) for record in self.log_entries)
 
     def clear_logs(self):
         """Clear all stored log entries"""
@@ -109,22 +142,25 @@ class Logger:
     """Singleton logger class for QGIS RO-Crate operations"""
 
     _instance = None
-    _logger = None
-    _log_entries = []
+    _instance_lock = threading.Lock()
 
     def __new__(cls):
+        # Only the first construction takes the lock, the instance is published
+        # after its handler is set up so no thread sees it half initialized
         if cls._instance is None:
-            cls._instance = super(Logger, cls).__new__(cls)
+            with cls._instance_lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._setup_logger()
+                    cls._instance = instance
         return cls._instance
 
-    def __init__(self):
-        if self._logger is None:
-            self._setup_logger()
-
     def _setup_logger(self):
         """Set up the logger with memory handler"""
         self._logger = logging.getLogger("qgis_rocrate")
         self._logger.setLevel(logging.DEBUG)
+        # Records are only kept for the export log, not passed on to root handlers
+        self._logger.propagate = False
 
         self._logger.handlers.clear()
 
@@ -150,16 +186,24 @@ class Logger:
     def write_logs_to_file(self, export_path, project_title):
         """Write all accumulated logs to file"""
         try:
-            log_filename = f"{project_title}_export_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-            log_file_path = os.path.join(export_path, log_filename)
-
-            with open(log_file_path, "w", encoding="utf-8") as f:
+            # One timestamp so the file name and the header agree
+            now = datetime.now()
+            log_filename = f"{project_title}_export_log_{now:%Y%m%d_%H%M%S}.log"
+            log_file_path = str(Path(export_path) / log_filename)
+
+            # Write "\n" as is, skipping the newline translation on every write
+            with open(
+                log_file_path,
+                "w",
+                encoding="utf-8",
+                newline="\n",
+                buffering=_LOG_FILE_BUFFER_SIZE,
+            ) as f:
                 f.write(f"RO-Crate Export Log for: {project_title}\n")
-                f.write(f"Export Date: {datetime.now().isoformat()}\n")
+                f.write(f"Export Date: {now.isoformat()}\n")
                 f.write("=" * 50 + "\n\n")
 
-                for log_entry in self.memory_handler.get_logs():
-                    f.write(log_entry + "\n")
+                f.writelines(f"{entry}\n" for entry in self.memory_handler.get_logs())
 
             return log_file_path
 
@@ -152,6 +152,10 @@ class AutomatedWorkflowDocumentation:
 
     def unload(self):
         """Removes the plugin menu item and icon from QGIS GUI."""
+        # Don't destroy the export thread while it is still writing
+        if self.dlg is not None:
+            self.dlg.stop_export()
+
         for action in self.actions:
             self.iface.removePluginMenu(
                 self.tr("&Automated Workflow Documentation"), action
@@ -0,0 +1,60 @@
+import zipfile
+
+import pytest
+from qgis.testing import start_app
+
+from plugin.Plugin.Export.export_worker import ExportWorker
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+@pytest.fixture(scope="session")
+def qgis_app():
+    """Start QGIS application for tests."""
+    yield start_app()
+
+
+@pytest.fixture
+def crate(tmp_path):
+    """Create a RO-Crate with a data file and a contextual entity"""
+    from rocrate.rocrate import ROCrate
+
+    data_file = tmp_path / "geometry.geojson"
+    data_file.write_text('{"type": "FeatureCollection", "features": []}')
+
+    crate = ROCrate()
+    crate.add_file(str(data_file), dest_path="map/layer/geometry.geojson")
+    crate.add_jsonld({"@id": "#qgis", "@type": "SoftwareApplication"})
+    return crate
+
+
+# ============================================================================
+# ZIP WRITING TESTS
+# ============================================================================
+
+def test_zip_contains_all_entity_paths(qgis_app, crate, tmp_path):
+    """Test that every streamed data and default entity path is written"""
+    export_file_path = str(tmp_path / "export.zip")
+    ExportWorker(crate, export_file_path, 1)._write_zip()
+
+    expected = {
+        path
+        for entity in crate.data_entities + crate.default_entities
+        for path, _ in entity.stream()
+    }
+    with zipfile.ZipFile(export_file_path) as archive:
+        assert set(archive.namelist()) == expected
+        assert "ro-crate-metadata.json" in expected
+        assert "map/layer/geometry.geojson" in expected
+
+
+def test_zip_members_are_deflated(qgis_app, crate, tmp_path):
+    """Test that the members are deflated and read back intact"""
+    export_file_path = str(tmp_path / "export.zip")
+    ExportWorker(crate, export_file_path, 9)._write_zip()
+
+    with zipfile.ZipFile(export_file_path) as archive:
+        for info in archive.infolist():
+            assert info.compress_type == zipfile.ZIP_DEFLATED
+            assert archive.testzip() is None
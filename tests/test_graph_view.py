@@ -0,0 +1,198 @@
+import pytest
+from qgis.testing import start_app
+from qgis.PyQt.QtCore import QPointF, QRectF
+
+from plugin.Plugin.Graph.connection_arrow import ConnectionArrow
+from plugin.Plugin.Graph.graph_view import GraphView, QuadTree
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+@pytest.fixture(scope="session")
+def qgis_app():
+    """Start QGIS application for tests."""
+    yield start_app()
+
+
+@pytest.fixture
+def tree(qgis_app):
+    """Create a QuadTree over a 100 x 100 area"""
+    return QuadTree(QRectF(0, 0, 100, 100))
+
+
+@pytest.fixture
+def graph_view(qgis_app):
+    """Create a GraphView"""
+    graph_view = GraphView()
+    yield graph_view
+    graph_view.deleteLater()
+
+
+def _fill_quadrants(tree):
+    """Insert enough small items into the quadrants to subdivide the root"""
+    corners = [(10, 10), (60, 10), (10, 60), (60, 60)]
+    for index in range(QuadTree.CAPACITY + 1):
+        x, y = corners[index % 4]
+        tree.insert(f"filler{index}", QRectF(x + index, y + index, 2, 2))
+
+
+class _IndexedNode:
+    """Stand-in for a graph node that only carries its indexed scene rect"""
+
+    def __init__(self, rect):
+        self.index_rect = QRectF(rect)
+
+
+# ============================================================================
+# QUADTREE TESTS
+# ============================================================================
+
+def test_root_subdivides_above_capacity(tree):
+    """Test that a full cell is split and its fitting items are pushed down"""
+    _fill_quadrants(tree)
+    assert len(tree.children) == 4
+    assert tree.items == {}
+    assert sum(len(child.items) for child in tree.children) == QuadTree.CAPACITY + 1
+
+
+def test_query_point_finds_item(tree):
+    """Test that a point query returns only the items containing the point"""
+    _fill_quadrants(tree)
+    tree.insert("node", QRectF(70, 20, 10, 10))
+    assert tree.query_point(75, 25) == ["node"]
+    assert tree.query_point(95, 95) == []
+
+
+def test_straddling_item_stays_in_parent(tree):
+    """Test that an item across a quadrant border stays in the parent cell"""
+    _fill_quadrants(tree)
+    tree.insert("straddling", QRectF(45, 45, 10, 10))
+    assert "straddling" in tree.items
+    assert tree.query_point(48, 48) == ["straddling"]
+    assert tree.query_point(52, 52) == ["straddling"]
+
+
+def test_item_outside_root_is_found(tree):
+    """Test that an item outside the root rect is kept in the root"""
+    _fill_quadrants(tree)
+    tree.insert("outside", QRectF(150, 150, 10, 10))
+    assert "outside" in tree.items
+    assert tree.query_point(155, 155) == ["outside"]
+
+
+def test_query_point_on_quadrant_border(tree):
+    """Test that a point on a quadrant border finds items of every quadrant"""
+    _fill_quadrants(tree)
+    tree.insert("east", QRectF(50, 20, 10, 10))
+    tree.insert("west", QRectF(40, 20, 10, 10))
+    assert sorted(tree.query_point(50, 25)) == ["east", "west"]
+
+
+def test_remove_item(tree):
+    """Test that a removed item is no longer found"""
+    _fill_quadrants(tree)
+    rect = QRectF(70, 20, 10, 10)
+    tree.insert("node", rect)
+    tree.remove("node", rect)
+    assert tree.query_point(75, 25) == []
+
+
+def test_update_node_index_moves_node(graph_view):
+    """Test that update_node_index reinserts a node at its new rect"""
+    for index in range(QuadTree.CAPACITY + 1):
+        filler = _IndexedNode(QRectF(index * 5, 0, 2, 2))
+        graph_view.node_index.insert(filler, filler.index_rect)
+
+    node = _IndexedNode(QRectF(10, 700, 20, 20))
+    graph_view.node_index.insert(node, node.index_rect)
+    old_rect = node.index_rect
+    node.index_rect = QRectF(900, 100, 20, 20)
+    graph_view.update_node_index(node, old_rect)
+
+    assert node not in graph_view.node_index.query_point(20, 710)
+    assert node in graph_view.node_index.query_point(910, 110)
+
+
+# ============================================================================
+# CONNECTION ARROW TESTS
+# ============================================================================
+
+class _BoxNode:
+    """Stand-in for a graph node with a square outline around a center"""
+
+    def __init__(self, x, y, half_size=10):
+        self.scene_geometry = (x, y, half_size, half_size)
+        self.inputs = []
+        self.outputs = []
+
+    def edge_point(self, dx, dy):
+        cx, cy, half_width, half_height = self.scene_geometry
+        tx = half_width / abs(dx) if dx else float("inf")
+        ty = half_height / abs(dy) if dy else float("inf")
+        t = min(tx, ty)
+        return cx + dx * t, cy + dy * t
+
+    def attach_input(self, arrow):
+        self.inputs.append(arrow)
+
+    def attach_output(self, arrow):
+        self.outputs.append(arrow)
+
+    def detach_input(self, arrow):
+        self.inputs.remove(arrow)
+
+    def detach_output(self, arrow):
+        self.outputs.remove(arrow)
+
+
+@pytest.fixture
+def arrow(qgis_app):
+    """Create an arrow from a node at (0, 0) to a node at (100, 0)"""
+    return ConnectionArrow(_BoxNode(0, 0), _BoxNode(100, 0))
+
+
+def test_arrow_ends_on_node_outlines(arrow):
+    """Test that the arrow line runs between the node outlines"""
+    assert (arrow.line.x1(), arrow.line.y1()) == (10, 0)
+    assert (arrow.line.x2(), arrow.line.y2()) == (90, 0)
+
+
+def test_arrow_contains_line_points(arrow):
+    """Test hits on and near the line, within the hit tolerance"""
+    assert arrow.contains(QPointF(50, 0))
+    assert arrow.contains(QPointF(50, ConnectionArrow.HIT_TOLERANCE - 1))
+    assert not arrow.contains(QPointF(50, ConnectionArrow.HIT_TOLERANCE + 2))
+    assert not arrow.contains(QPointF(0, 0))
+
+
+def test_arrow_contains_arrowhead_points(arrow):
+    """Test hits inside the arrowhead beyond the line tolerance"""
+    assert arrow.contains(QPointF(78, 5.5))
+    assert not arrow.contains(QPointF(78, -9))
+
+
+def test_add_and_discard_arrow(graph_view, arrow):
+    """Test the arrow registry of the view"""
+    graph_view.add_arrow(arrow)
+    assert arrow.view is graph_view
+    assert arrow in graph_view.arrows
+
+    graph_view.discard_arrow(arrow)
+    assert arrow.view is None
+    assert arrow not in graph_view.arrows
+
+
+def test_remove_arrow_unregisters_everywhere(graph_view, arrow):
+    """Test that removing an arrow detaches it from its nodes and the view"""
+    start_node = arrow.start_node
+    end_node = arrow.end_node
+    assert start_node.outputs == [arrow]
+    assert end_node.inputs == [arrow]
+
+    graph_view.add_arrow(arrow)
+    arrow.remove_arrow()
+    assert start_node.outputs == []
+    assert end_node.inputs == []
+    assert arrow not in graph_view.arrows
+    assert arrow.view is None
@@ -20,9 +20,10 @@ def qgis_app():
 @pytest.fixture
 def instruction_tab(qgis_app):
     """
-    Fixture that creates the InstructionTab widget.
+    Fixture that creates and shows the InstructionTab widget.
     """
     instruction_tab = InstructionTab()
+    instruction_tab.show()  # Sections are built on first show
     yield instruction_tab
     instruction_tab.deleteLater()
 
@@ -78,6 +79,21 @@ def test_expected_sections_exist(instruction_tab):
     assert expected_titles == titles
 
 
+def test_sections_built_on_first_show(qgis_app):
+    """Sections should only be created once the tab is shown."""
+    instruction_tab = InstructionTab()
+    assert instruction_tab.findChildren(QGroupBox) == []
+
+    instruction_tab.show()
+    assert len(instruction_tab.findChildren(QGroupBox)) == 3
+
+    # Showing again should not duplicate the sections
+    instruction_tab.hide()
+    instruction_tab.show()
+    assert len(instruction_tab.findChildren(QGroupBox)) == 3
+    instruction_tab.deleteLater()
+
+
 def test_sections_have_content(instruction_tab):
     """Each section should contain at least one QLabel."""
     group_boxes = instruction_tab.findChildren(QGroupBox)
@@ -0,0 +1,100 @@
+import pytest
+from qgis.testing import start_app
+
+from plugin.Plugin.Layer.layer_metadata_dialog import LayerMetadataDialog
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+@pytest.fixture(scope="session")
+def qgis_app():
+    """Start QGIS application for tests."""
+    yield start_app()
+
+
+@pytest.fixture
+def dialog(qgis_app):
+    """Create a LayerMetadataDialog without a layer"""
+    dialog = LayerMetadataDialog()
+    yield dialog
+    dialog.deleteLater()
+
+
+# ============================================================================
+# URL VALIDATION TESTS
+# ============================================================================
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://example.com",
+        "http://example.com/",
+        "HTTPS://Example.COM",
+        "https://ex-ample.com",
+        "https://a.b.c.de",
+        "https://sub.example.co.uk/path/to/data.zip",
+        "http://localhost",
+        "http://localhost:8080/wms",
+        "http://192.168.0.1",
+        "http://999.999.999.999",
+        "http://192.168.0.1:8000/ows?service=WMS",
+        "https://example.com:8080",
+        "https://example.com:8080/path",
+        "https://example.com.",
+        "https://example.com.:443/",
+        "https://example.com?query=1",
+        "https://example.com/?",
+        "https://example.com//",
+        "https://example.com/#frag",
+        "https://example.com/path?q=1#frag",
+    ],
+)
+def test_valid_urls(dialog, url):
+    """Test URLs accepted by the check, as by the earlier regex"""
+    assert dialog.is_valid_url(url)
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "",
+        "example.com",
+        "ftp://example.com",
+        "https://",
+        "https://example",
+        "https://example.c",
+        "https://example.abcdefg",
+        "https://example.c0m",
+        "https://-example.com",
+        "https://example-.com",
+        "https://exa_mple.com",
+        "https://exämple.com",
+        "http://localhost.",
+        "http://1.2.3",
+        "https://1234.1.1.1",
+        "https://example.com:",
+        "https://example.com:80a",
+        "https://example.com?",
+        "https://example.com#frag",
+        " https://example.com",
+        "https://exa mple.com",
+        "https://example.com/ path",
+    ],
+)
+def test_invalid_urls(dialog, url):
+    """Test URLs rejected by the check, as by the earlier regex"""
+    assert not dialog.is_valid_url(url)
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://example.com\n",  # The regex $ also matched before a final newline
+        "http://١٢٣.١.١.١",  # The regex \d also matched non-ASCII digits
+        "http://127.0.0.1:٨٠",
+    ],
+)
+def test_rejected_unlike_regex(dialog, url):
+    """Test inputs the earlier regex accepted, which are rejected on purpose"""
+    assert not dialog.is_valid_url(url)
@@ -0,0 +1,68 @@
+import pytest
+from qgis.testing import start_app
+
+from plugin.Plugin.Layer.wms_layer import WMSLayer
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+@pytest.fixture(scope="session")
+def qgis_app():
+    """Start QGIS application for tests."""
+    yield start_app()
+
+
+class _SourceLayer:
+    """Stand-in for a QGIS layer that only provides its source string"""
+
+    def __init__(self, source):
+        self._source = source
+
+    def source(self):
+        return self._source
+
+
+def _wms_layer(source):
+    """Create a WMSLayer around a source string without a live WMS layer"""
+    wms_layer = WMSLayer.__new__(WMSLayer)
+    wms_layer.layer = _SourceLayer(source)
+    wms_layer.mimetype = None
+    return wms_layer
+
+
+# ============================================================================
+# URL PARSING TESTS
+# ============================================================================
+
+def test_wms_url_adds_service_and_request(qgis_app):
+    """Test that the GetMap parameters are put in front of the source ones"""
+    wms_layer = _wms_layer(
+        "crs=EPSG:4326&format=image/png&layers=roads&url=https://ex.com/wms"
+    )
+    url = wms_layer._get_wms_url()
+    assert url == (
+        "https://ex.com/wms?SERVICE=WMS&REQUEST=GetMap"
+        "&crs=EPSG:4326&format=image/png&layers=roads"
+    )
+    assert wms_layer.mimetype == "image/png"
+
+
+def test_wms_url_without_url_returns_none(qgis_app):
+    """Test that a source without service URL gives no WMS URL"""
+    assert _wms_layer("crs=EPSG:4326&format=image/png")._get_wms_url() is None
+
+
+def test_wms_url_keeps_plus_in_format(qgis_app):
+    """Test that a literal plus in the format is not decoded as a space"""
+    wms_layer = _wms_layer("format=image/svg+xml&url=https://ex.com/wms")
+    url = wms_layer._get_wms_url()
+    assert wms_layer.mimetype == "image/svg+xml"
+    assert url.endswith("&format=image/svg%2Bxml")
+
+
+def test_wms_url_keeps_plus_in_service_url(qgis_app):
+    """Test that a literal plus in the service URL is not decoded as a space"""
+    wms_layer = _wms_layer("format=image/png&url=https://ex.com/wms?map%3D/data/a+b.map")
+    url = wms_layer._get_wms_url()
+    assert url.startswith("https://ex.com/wms?map=/data/a+b.map&SERVICE=WMS")